@@ -1,25 +1,94 @@
 import logging
+import subprocess
+import sys
+import time
 
+import src.config as cfg
 import src.error_handler as eh
-from src.gui import MainWindowGUI
 from src.logging_config import setup_logging
 
 
-def launch():
+def launch(startup_time=None):
     """
     Function to launch the GUI.
+    The GUI is imported here, so the time to the first window can be measured from the start of the launch script.
     """
     try:
         logging.info('Launching GUI')
+        from src.gui import MainWindowGUI
         gui = MainWindowGUI()
+        if startup_time is not None:
+            gui.window.after_idle(lambda: logging.info('First window shown %.3f s after start', time.perf_counter() - startup_time))
         gui.run()
     except (eh.MetamodelCreationError, eh.ModelCreationError, FileNotFoundError):
         raise
     except Exception as e:
-        logging.error(f'An unexpected error occurred: {e}')
+        logging.error('An unexpected error occurred: %s', e)
         raise
 
 
+def get_import_times(module_name):
+    """
+    Import the module in a separate Python process and return the import times reported by "python -X importtime".
+    Returns a list of (module name, nesting level, self time, cumulative time) tuples, with the times in seconds.
+    """
+    command = [sys.executable, '-X', 'importtime', '-c', f'import {module_name}']
+    result = subprocess.run(command, capture_output=True, text=True)
+    import_times = list()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_time, cumulative_time, imported_module = line[len('import time:'):].split('|')
+        nesting_level = (len(imported_module) - len(imported_module.lstrip()) - 1) // 2
+        import_times.append((imported_module.strip(), nesting_level, int(self_time) / 1e6, int(cumulative_time) / 1e6))
+    if result.returncode != 0:
+        error_lines = result.stderr.strip().splitlines()
+        logging.warning('Failed to import module "%s": %s', module_name, error_lines[-1] if error_lines else f'exit code {result.returncode}')
+        return list()
+    return import_times
+
+
+def get_module_imports(import_times, module_name):
+    """
+    Get the import times of the module and of the modules it imports directly.
+    Modules imported by a module are reported before it, so they are the entries between the module and the previous top level module.
+    Returns (None, empty list) if the module is not a top level entry of the import times (e.g. it was already imported by "site").
+    """
+    module_index = max((index for index, import_time in enumerate(import_times) if import_time[0] == module_name and import_time[1] == 0), default=None)
+    if module_index is None:
+        return None, list()
+    direct_imports = list()
+    for import_time in reversed(import_times[:module_index]):
+        if import_time[1] == 0:
+            break
+        if import_time[1] == 1:
+            direct_imports.append(import_time)
+    return import_times[module_index], direct_imports
+
+
+def log_startup_profile():
+    """
+    Log the import cost of the modules imported before the first window and of the modules imported on first use.
+    """
+    import_times = get_import_times(cfg.STARTUP_PROFILE_MODULE)
+    module_import_time, direct_imports = get_module_imports(import_times, cfg.STARTUP_PROFILE_MODULE)
+    if module_import_time is not None:
+        logging.info('Importing "%s" takes %.3f s. Most expensive imports:', cfg.STARTUP_PROFILE_MODULE, module_import_time[3])
+        for module_name, _, self_time, cumulative_time in sorted(direct_imports, key=lambda import_time: -import_time[3])[:cfg.STARTUP_PROFILE_TOP_MODULES]:
+            logging.info('  %s: %.3f s (%.3f s self)', module_name, cumulative_time, self_time)
+
+    logging.info('Modules imported on first use (not part of the startup):')
+    for module_name in cfg.STARTUP_PROFILE_DEFERRED_MODULES:
+        module_import_time, _ = get_module_imports(get_import_times(module_name), module_name)
+        if module_import_time is not None:
+            logging.info('  %s: %.3f s', module_name, module_import_time[3])
+
+
 if __name__ == '__main__':
+    startup_time = time.perf_counter()
     setup_logging()
-    launch()
+    if cfg.STARTUP_PROFILE_ARGUMENT in sys.argv[1:]:
+        log_startup_profile()
+        launch(startup_time)
+    else:
+        launch()
@@ -156,6 +156,11 @@ TEMPLATE_FOLDER = 'template'
 EXPORT_FOLDER = 'export'
 EXPORT_DOT_FOLDER = 'dot'
 EXPORT_PLANTUML_FOLDER = 'plantuml'
+EXPORT_MODEL_CLUSTERS_FOLDER = 'model_clusters'
+CACHE_FOLDER = 'cache'
+FORMAT_CACHE_FOLDER = 'format'
+FORMAT_STAGING_FOLDER = 'staging'
+JINJA_CACHE_FOLDER = 'jinja'
 PROJECT_JAVA_FOLDER = 'src/main/java'
 PROJECT_RESOURCES_FOLDER = 'src/main/resources'
 PROJECT_TEST_JAVA_FOLDER = 'src/test/java'
@@ -177,16 +182,31 @@ JAVA_REPOSITORY_FILE_NAME = '%sRepository.java'
 JAVA_REPOSITORY_CONFIGURATION_FILE_NAME = 'RepositoryConfiguration.java'
 JAVA_APPLICATION_FILE_NAME = '%sApplication.java'
 APPLICATION_PROPERTIES_FILE_NAME = 'application.properties'
+GENERATION_MANIFEST_FILE = 'generation_manifest.json'
+EXPORT_CACHE_FILE = 'export_cache.json'
+FORMAT_CACHE_FILE = 'format_cache.json'
+PLANTUML_JAR_PREFIX = 'plantuml'  # Name of the jar file in the resources folder, without the version (see RESOURCE_JAR_REGEX)
+GOOGLE_FORMAT_JAR_PREFIX = 'google-java-format'
 # Other
 OK = 'OK'
 WARNING = 'WARNING'
 ERROR = 'ERROR'
+WRITTEN = 'written'
+UNCHANGED = 'unchanged'
+DELETED = 'deleted'
 DOT_FILE_EXTENSION = '.dot'
 PLANTUML_FILE_EXTENSION = '.pu'
 PNG_FILE_EXTENSION = '.png'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
 JSD_MBRS_GENERATOR_EXTENSION = '.jsdmbrs'
+GENERATION_MANIFEST_VERSION = 1
+EXPORT_CACHE_VERSION = 1
+FORMAT_CACHE_VERSION = 1
 METAMODEL_NAME = 'metamodel'
 MODEL_NAME = f'model{DOT_FILE_EXTENSION}'
+MODEL_INDEX_NAME = f'model_index{DOT_FILE_EXTENSION}'
+MODEL_CLUSTER_FILE_NAME = f'model_%s{DOT_FILE_EXTENSION}'
+MODEL_COMPONENT_NAME = 'cluster_%s'
 VALID_RELATIONSHIP_TYPE_MAPPING = {
     '1..1': '1..1',
     '*..*': '*..*',
@@ -234,9 +254,18 @@ HASHMAP = 'hashmap'
 HASHSET = 'hashset'
 TREEMAP = 'treemap'
 LIST = 'list'
+# Value ranges of the integer types (inclusive)
+BYTE_RANGE = (-128, 127)
+SHORT_RANGE = (-32768, 32767)
+INT_RANGE = (-2147483648, 2147483647)
+LONG_RANGE = (-9223372036854775808, 9223372036854775807)
 
 # CUSTOM ERROR MESSAGES
+MULTIPLE_SEMANTIC_ERRORS = '%s (and %s more semantic error(s))'
 UNIQUE_CLASS_NAMES_ERROR = 'Class name "%s" already exists! Each class name must be unique.'
+MISSING_DATABASE_ERROR = 'The "%s" grammar file does not define the Database section! The database must be defined in the grammar file used for generation.'
+IMPORTED_DATABASE_ERROR = 'The imported "%s" grammar file defines the Database section! Only the grammar file used for generation can define the database.'
+NO_CLASSES_ERROR = 'The "%s" grammar file and its imported grammar files do not define any class! At least one class is required.'
 DATABASE_NAME_ERROR = '%s database name "%s" is not a valid SQL database name! %s'
 DATABASE_DRIVER_ERROR = 'The "%s" database driver dependency is already specified in the Application file and it does not match the provided "%s" database driver! Please either update the database driver in the grammar or modify the existing driver dependency in the Application file.'
 DATABASE_USERNAME_ERROR = '%s database username "%s" is not a valid SQL database username! %s'
@@ -268,11 +297,14 @@ CONSTANT_AND_VALUE_ERROR = 'If "const" or "constant" keyword is specified, const
 CONSTANT_AND_ENCAPSULATION_ERROR = 'Constant property "%s" cannot have setter method! Constant properties can only have getter methods.'
 CONSTANT_PROPERTY_VALUE_ERROR = 'Invalid value "%s" for property "%s" of type "%s" (%s)!'
 LIST_ELEMENTS_ERROR = 'Invalid value "%s" in "%s" %s for property "%s" of type "%s" (%s)!'
+MULTIPLE_LIST_ELEMENTS_ERROR = '%s invalid values in %s for property "%s" of type "%s" at index(es) %s (%s)!'
 CONSTRUCTOR_UNIQUE_PROPERTIES_ERROR = 'The specified constructor includes the property "%s", which is defined more than once! Constructors cannot include non-unique properties.'
 CONSTRUCTOR_CONSTANT_PROPERTY_ERROR = 'The specified constructor includes the property "%s", which is defined as a constant! Constructors cannot include properties that are constants.'
 METHOD_NAME_ERROR = 'Method name "%s" is not a valid Java method name! %s'
 METHOD_TYPE_IN_LIST_TYPE_ERROR = 'The method type "%s" is not valid for the list type "%s"! Only wrapper types such as "Byte", "Short", "Character", "Integer", "Float", "Long", "Double", "Boolean", or "String" can be used for list methods.'
 UNKNOWN_OBJECT_ERROR = '%s! Please ensure that "%s" is a valid grammar object or check for any typos.'
+IMPORTED_UNKNOWN_OBJECT_ERROR = 'An imported grammar file can only refer to its own classes and to the classes of the grammar files it imports, not to the classes of the grammar file importing it. Please move the referenced class to an imported grammar file and import it where it is used.'
+JAVA_NOT_FOUND_ERROR = 'Java is not installed or not available on the PATH! Java is required to format the generated files with Google Java Format.'
 IS_NOT_UNIQUE_ERROR = 'Please ensure that the "%s" property is unique across all classes. Unfortunately, the JSD-MBRS Generator currently supports only unique properties across all classes.'
 # Additional Java explanation messages
 JAVA_CLASS_NAME_ERROR = 'To create a valid Java class name, start with an uppercase letter, followed by letters, digit, dollar signs, or underscores. No spaces or special characters like @, !, # are allowed.'
@@ -282,8 +314,7 @@ SQL_DATABASE_USERNAME_ERROR = 'To create a suitable SQL database username, begin
 SQL_DATABASE_PASSWORD_ERROR = 'To create a strong password, ensure it is at least 8 characters long and includes at least one uppercase letter, one lowercase letter, and one digit.'
 
 # REGEX
-PLANTUML_REGEX = r'^plantuml-\d+\.\d+\.\d+\.jar$'
-GOOGLE_FORMAT_REGEX = r'^google-java-format-\d+\.\d+\.\d+\-all-deps.jar$'
+RESOURCE_JAR_REGEX = r'^%s-\d+\.\d+\.\d+(-all-deps)?\.jar$'  # Versioned jar file in the resources folder, e.g. 'plantuml-1.2024.3.jar'
 JSD_MBRS_GENERATOR_REGEX = r'\w+\.jsdmbrs$'
 DATE_REGEX = r'%Y-%m-%d'
 TIME_REGEX = r'%H:%M:%S'
@@ -304,6 +335,45 @@ PROPERTY_VALUE_REGEX = r'=(.*?);'
 COMMENT_REGEX = r'//(.*)'
 OPEN_API_DEFINITION_REGEX = r'@OpenAPIDefinition'
 
+# GOOGLE JAVA FORMAT
+GOOGLE_FORMAT_OPTIONS = ['--skip-reflowing-long-strings', '--skip-javadoc-formatting', '--aosp']
+GOOGLE_FORMAT_BATCH_SIZE = 100  # Number of files formatted by one JVM (keeps the command line below the OS limit)
+GOOGLE_FORMAT_MIN_BATCH_SIZE = 25  # Smaller batches are not split across JVMs, since JVM start-up would dominate
+WINDOWS_COMMAND_LINE_TOO_LONG_ERROR = 206  # Windows error code of a command line above the OS limit (ERROR_FILENAME_EXCED_RANGE)
+FORMAT_CACHE_MAX_ENTRIES = 2000  # Maximum number of formatted files kept in the format cache (least recently used are removed first)
+
+# GENERATE
+GENERATE_WORKERS = None  # Number of Google Java Format JVMs run in parallel (None uses all CPU cores, 1 formats in a single JVM)
+
+# SEMANTIC CHECKS
+COLLECT_ALL_SEMANTIC_ERRORS = True  # Collect every semantic error in a single validation pass instead of stopping at the first one
+BATCH_MODEL_PROCESSING = True  # Process the parsed model in a single batched pass instead of per object during the model construction
+
+# EXPORT
+EXPORT_IMAGE_FORMAT = 'png'  # Image format rendered from the exported dot files ('png' or 'svg', SVG renders much faster for large models)
+EXPORT_IMAGE_FORMATS = ['png', 'svg']
+EXPORT_WORKERS = None  # Number of export jobs (metamodel and model diagrams) rendered in parallel (None uses all CPU cores, 1 disables parallel export)
+PARTITIONED_MODEL_EXPORT_MIN_ENTITIES = 100  # Models with at least this many entities are exported as one diagram per cluster and an index diagram (None disables)
+EXPORT_ENTITY_GROUPS = {}  # Export group name -> entity names exported together, the other entities are clustered by their relationships
+MODEL_CLUSTER_MAX_ENTITIES = 50  # Small connected components are packed into clusters of up to this many entities (larger components are kept whole)
+MODEL_INDEX_MAX_ENTITY_NAMES = 10  # Number of entity names listed for every cluster in the index diagram
+MODEL_INDEX_IMAGE_FORMAT = 'svg'  # Image format of the index diagram, always SVG since only SVG keeps the links to the cluster diagrams
+DOT_COMMAND = 'dot'  # Graphviz command which renders the dot content streamed to its standard input
+PLANTUML_WORKER = True  # Render the PlantUML diagrams with one long-running PlantUML process (False starts a new process for every export)
+PLANTUML_PIPE_DELIMITER = '__JSD_MBRS_PLANTUML_IMAGE_END__'  # Written by the PlantUML worker after every rendered image
+PLANTUML_PIPE_CHUNK_SIZE = 65536  # Maximum number of bytes read from the PlantUML worker output at once
+PLANTUML_WORKER_TIMEOUT = 60  # Seconds to wait for the PlantUML worker to render a diagram (includes the JVM startup on the first render)
+PLANTUML_WORKER_STOP_TIMEOUT = 5  # Seconds to wait for the PlantUML worker to exit before it is killed
+
+# STARTUP PROFILE
+STARTUP_PROFILE_ARGUMENT = '--startup-profile'  # Launch argument which logs the import cost per module and the time to the first window
+STARTUP_PROFILE_MODULE = 'src.gui'  # Module imported before the first window is shown
+STARTUP_PROFILE_DEFERRED_MODULES = ['src.textx_grammar', 'textx.export', 'bs4', 'psutil', 'pygetwindow']  # Modules imported on first use
+STARTUP_PROFILE_TOP_MODULES = 15  # Number of the most expensive modules logged for the startup module
+
+# JINJA FILTERS
+FILTER_CACHE_SIZE = 4096  # Maximum number of memoized results per pure Jinja filter (pluralize, java type, case conversions)
+
 # JINJA MAPPINGS
 VOWELS = ['a', 'e', 'i', 'o', 'u']
 # Java type mappings
@@ -19,3 +19,24 @@ class ModelCreationError(Exception):
         self.message = message
         super().__init__(self.message)
         logging.error(f"{self.__class__.__name__}: {self.message}")
+
+
+class JavaNotFoundError(Exception):
+    """
+    Exception raised when the Java executable needed by Google Java Format is not found.
+    """
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+        logging.error(f"{self.__class__.__name__}: {self.message}")
+
+
+class TemplateRenderError(Exception):
+    """
+    Exception raised for errors while rendering the Jinja templates of an entity.
+    """
+    def __init__(self, entity_name, message):
+        self.entity_name = entity_name
+        self.message = f'Failed to render templates for entity "{entity_name}": {message}'
+        super().__init__(self.message)
+        logging.error(f"{self.__class__.__name__}: {self.message}")
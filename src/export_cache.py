@@ -0,0 +1,53 @@
+import logging
+import threading
+
+import src.config as cfg
+import src.utils as utils
+
+
+logger = logging.getLogger(__name__)
+
+
+class ExportCache:
+    """
+    Class for tracking which exported diagrams have changed since the last export.
+    The cache stores a fingerprint of the exported content (dot or PlantUML) for every exported file,
+    so the Graphviz and PlantUML renders are skipped while the rendered images are still up to date.
+    """
+    def __init__(self, project_path):
+        """
+        Constructor for the ExportCache class.
+        """
+        self.cache_path = utils.get_path(project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, cfg.EXPORT_CACHE_FILE)
+        self.fingerprints = self.load()['exports']
+        self.lock = threading.Lock()  # Export jobs update the cache concurrently
+
+    def load(self):
+        """
+        Load the cache of the previous export. Returns an empty cache if it does not exist or is invalid.
+        """
+        return utils.load_versioned_json(self.cache_path, cfg.EXPORT_CACHE_VERSION) or {'exports': {}}
+
+    def save(self):
+        """
+        Save the cache of the current export.
+        """
+        logger.debug('Saving export cache to "%s"', self.cache_path)
+        with self.lock:
+            cache = {'exports': dict(self.fingerprints)}
+        utils.save_versioned_json(self.cache_path, cfg.EXPORT_CACHE_VERSION, cache)
+
+    def is_unchanged(self, file_name, fingerprint, output_paths):
+        """
+        Check if the file was exported with the same fingerprint before and all its outputs still exist.
+        """
+        with self.lock:
+            previous_fingerprint = self.fingerprints.get(file_name)
+        return previous_fingerprint == fingerprint and all(output_path.exists() for output_path in output_paths)
+
+    def set(self, file_name, fingerprint):
+        """
+        Store the fingerprint of the successfully exported file.
+        """
+        with self.lock:
+            self.fingerprints[file_name] = fingerprint
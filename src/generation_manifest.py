@@ -0,0 +1,120 @@
+import json
+import logging
+from os import listdir
+
+import src.config as cfg
+import src.grammar_classes as gc
+import src.utils as utils
+
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationManifest:
+    """
+    Class for tracking which entities have changed since the last generation.
+    The manifest stores a fingerprint of the whole model configuration (templates, package tree, database etc.)
+    and a fingerprint of every entity subtree, so only changed entities need to be rendered again.
+    """
+    def __init__(self, project_path, model, extra_fingerprint_values=None):
+        """
+        Constructor for the GenerationManifest class.
+        """
+        self.manifest_path = utils.get_path(project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.CACHE_FOLDER, cfg.GENERATION_MANIFEST_FILE)
+        self.previous_manifest = self.load()
+        self.global_fingerprint = self.get_global_fingerprint(model, extra_fingerprint_values)
+        self.entity_fingerprints = {entity.name: self.get_entity_fingerprint(entity) for entity in model.entities}
+
+    def load(self):
+        """
+        Load the manifest of the previous generation. Returns an empty manifest if it does not exist or is invalid.
+        """
+        return utils.load_versioned_json(self.manifest_path, cfg.GENERATION_MANIFEST_VERSION) or {'global': None, 'entities': {}}
+
+    def save(self):
+        """
+        Save the manifest of the current generation.
+        """
+        logger.debug('Saving generation manifest to "%s"', self.manifest_path)
+        manifest = {'global': self.global_fingerprint, 'entities': self.entity_fingerprints}
+        utils.save_versioned_json(self.manifest_path, cfg.GENERATION_MANIFEST_VERSION, manifest)
+
+    def get_removed_entities(self):
+        """
+        Get the names of the entities that were generated previously but no longer exist in the model.
+        """
+        return [entity_name for entity_name in self.previous_manifest['entities'] if entity_name not in self.entity_fingerprints]
+
+    def is_entity_changed(self, entity):
+        """
+        Check if the entity (or anything it is rendered from) changed since the last generation.
+        """
+        if self.previous_manifest['global'] != self.global_fingerprint:
+            return True
+        return self.previous_manifest['entities'].get(entity.name) != self.entity_fingerprints[entity.name]
+
+    def get_global_fingerprint(self, model, extra_fingerprint_values):
+        """
+        Get the fingerprint of everything that affects all generated entity files.
+        Every entity class imports all other entities, so the ordered list of entity names is part of it.
+        """
+        template_contents = [utils.read_file(utils.get_path(cfg.TEMPLATE_FOLDER, file_name)) for file_name in sorted(listdir(cfg.TEMPLATE_FOLDER))]
+        global_values = [
+            model.package_tree,
+            model.build_tool,
+            model.project_name,
+            model.app_file_name,
+            json.dumps(serialize_model_object(model.database)),
+            json.dumps([entity.name for entity in model.entities]),
+            *template_contents,
+            *(extra_fingerprint_values or []),
+        ]
+        return utils.get_content_hash(*global_values)
+
+    def get_entity_fingerprint(self, entity):
+        """
+        Get the fingerprint of the entity subtree (properties, constructors, methods) and of the related entities
+        whose relationship properties are used when rendering the entity (e.g. for the mapped-by value).
+        """
+        related_entities = list()
+        for property in entity.relationships:
+            related_entity = property.property_type
+            related_relationships = [[p.name, p.property_type.name, serialize_model_object(p.relationship)] for p in related_entity.relationships]
+            related_entities.append([related_entity.name, related_relationships])
+        entity_values = [serialize_model_object(entity), entity.id_property, related_entities]
+        return utils.get_content_hash(json.dumps(entity_values))
+
+
+def serialize_model_object(model_object):
+    """
+    Serialize the textX model object (and all objects it contains) into JSON compatible lists.
+    Referenced objects (entities, properties, types) are serialized only by their name to avoid cycles.
+    """
+    if model_object is None or isinstance(model_object, (str, int, float, bool)):
+        return model_object
+    if isinstance(model_object, list):
+        return [serialize_model_object(item) for item in model_object]
+    if isinstance(model_object, gc.PropertyType):
+        return [model_object.name, model_object.type]
+
+    serialized_attributes = list()
+    for attribute_name, attribute in type(model_object)._tx_attrs.items():
+        value = getattr(model_object, attribute_name)
+        if attribute.cont:
+            serialized_attributes.append([attribute_name, serialize_model_object(value)])
+        elif isinstance(value, list):
+            serialized_attributes.append([attribute_name, [serialize_reference(item) for item in value]])
+        else:
+            serialized_attributes.append([attribute_name, serialize_reference(value)])
+    return [type(model_object).__name__, serialized_attributes]
+
+
+def serialize_reference(model_object):
+    """
+    Serialize the referenced textX model object by its name.
+    """
+    if model_object is None:
+        return None
+    if isinstance(model_object, gc.PropertyType):
+        return [model_object.name, model_object.type]
+    return [type(model_object).__name__, model_object.name]
@@ -9,7 +9,6 @@ import src.config as cfg
 import src.utils as utils
 from src.build_tool_dependency import BuildToolDependency
 from src.run_generated_project import RunGeneratedProject
-from src.textx_grammar import TextXGrammar
 
 
 INITIAL_BACKGROUND_COLOR = utils.convert_rgb_to_hex(cfg.COLORS['initial_background'])
@@ -79,6 +78,7 @@ class MainWindowGUI:
         self.grammar_file_name = None
         self.grammar_file_content = None
         self.database_driver = None
+        self.textx_grammar = None  # Generation engine of the opened project (export uses its last generated model), see get_textx_grammar
         self.busy = False
         self.save_event = threading.Event()  # Event for synchronization
         self.symbol_index = 0
@@ -317,12 +317,12 @@ class MainWindowGUI:
                 self.remove_error_color()
                 loading_text = f'{cfg.CONSOLE_LOG_LEVEL_TAGS["INFO"]} Generating, please wait...'
                 self.update_loading_animation(loading_text)
-                response = TextXGrammar.generate(self.project_path, self.grammar_file_name, self.database_driver)
+                response = self.get_textx_grammar().generate(self.project_path, self.grammar_file_name, self.database_driver)
                 if response.status is cfg.OK:
                     self.busy = False
                     self.export_button.config(state=tk.NORMAL)
                     response_color = OK_COLOR
-                    response_text = f'{cfg.CONSOLE_LOG_LEVEL_TAGS["OK"]} Successfully executed generate action.'
+                    response_text = f'{cfg.CONSOLE_LOG_LEVEL_TAGS["OK"]} Successfully executed generate action ({response.message}).'
                     self.console_output.config(text=response_text, fg=response_color)
                     self.run_generated_project()
                 else:
@@ -362,7 +362,7 @@ class MainWindowGUI:
                 self.window.update_idletasks()
 
                 # Export the metamodel and model to the project folder
-                response = TextXGrammar.export()
+                response = self.get_textx_grammar().export()
                 if response.status is cfg.OK:
                     response_color = OK_COLOR
                     response_text = f'{cfg.CONSOLE_LOG_LEVEL_TAGS["OK"]} Successfully exported files to the "{export_folder}" folder.'
@@ -544,6 +544,7 @@ class MainWindowGUI:
         utils.create_folder(jsd_mbrs_generator_folder_path, cfg.GRAMMAR_FOLDER)
         utils.create_folder(jsd_mbrs_generator_folder_path, cfg.EXPORT_FOLDER)
         utils.create_folder(jsd_mbrs_generator_folder_path, cfg.RESOURCES_FOLDER)
+        utils.create_folder(jsd_mbrs_generator_folder_path, cfg.CACHE_FOLDER)
 
     def update_line_numbers(self, event=None):
         """
@@ -717,6 +718,15 @@ class MainWindowGUI:
         Set the error color in the text editor based on the error type.
         """
         logging.debug('Setting error color')
+        if response.errors:
+            # Highlight every semantic error collected in the validation pass
+            for error_response in response.errors:
+                self.set_error_color(error_response)
+            return
+        error_file_path = getattr(response.error, 'filename', None)
+        if error_file_path and utils.get_base_name(error_file_path) != self.grammar_file_name:
+            logging.debug(f'Error is in the imported grammar file "{error_file_path}", not highlighting it')
+            return
         if response.error_class == 'TextXSyntaxError':
             self.syntax_error_color(response)
         elif response.error_class == 'TextXSemanticError':
@@ -980,6 +990,16 @@ class MainWindowGUI:
         logging.debug(f'Retrieving project path: "{self.project_path}"')
         return self.project_path
     
+    def get_textx_grammar(self):
+        """
+        Get the generation engine, importing textX and Jinja on first use to keep the first window fast.
+        """
+        if self.textx_grammar is None:
+            from src.textx_grammar import TextXGrammar
+            logging.debug('Creating generation engine')
+            self.textx_grammar = TextXGrammar()
+        return self.textx_grammar
+
     def get_grammar_file_name(self):
         """
         Get the name of the grammar.
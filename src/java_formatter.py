@@ -0,0 +1,271 @@
+import errno
+import logging
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from os import listdir, utime
+from os.path import getmtime
+
+import src.config as cfg
+import src.error_handler as eh
+import src.utils as utils
+
+
+logger = logging.getLogger(__name__)
+
+
+class FormatCache:
+    """
+    Class for caching the Google Java Format output in the project folder.
+    Cache entries are keyed by the hash of the unformatted content, the formatter jar version and its options.
+    The cache remembers which entry holds the current content of every generated file, so the entries of
+    outdated content are pruned after each generation and the number of entries is bounded (least recently used first).
+    """
+    def __init__(self, project_path, google_format_jar_path):
+        """
+        Constructor for the FormatCache class.
+        """
+        self.project_path = project_path
+        self.cache_folder_path = utils.get_path(project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.CACHE_FOLDER, cfg.FORMAT_CACHE_FOLDER)
+        self.cache_index_path = utils.get_path(project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.CACHE_FOLDER, cfg.FORMAT_CACHE_FILE)
+        self.google_format_version = utils.get_base_name(google_format_jar_path)  # Jar file name contains the version
+        utils.create_folder(self.cache_folder_path.parent, self.cache_folder_path.name)
+        self.file_keys = self.load()['files']  # Generated file path (relative to the project) -> cache key of its content
+        self.lock = threading.Lock()  # Format batches update the cache concurrently
+
+    def load(self):
+        """
+        Load the cache index of the previous generation. Returns an empty index if it does not exist or is invalid.
+        """
+        return utils.load_versioned_json(self.cache_index_path, cfg.FORMAT_CACHE_VERSION) or {'files': {}}
+
+    def save(self):
+        """
+        Save the cache index of the current generation.
+        """
+        logger.debug('Saving format cache index to "%s"', self.cache_index_path)
+        with self.lock:
+            index = {'files': dict(self.file_keys)}
+        utils.save_versioned_json(self.cache_index_path, cfg.FORMAT_CACHE_VERSION, index)
+
+    def get_key(self, content):
+        """
+        Get the cache key for the given unformatted content.
+        """
+        return utils.get_content_hash(self.google_format_version, ' '.join(cfg.GOOGLE_FORMAT_OPTIONS), content)
+
+    def get(self, key):
+        """
+        Get the formatted content for the given cache key, or None if it is not cached.
+        """
+        cache_file_path = utils.get_path(self.cache_folder_path, key)
+        if not cache_file_path.exists():
+            logger.debug('Format cache miss for key "%s"', key)
+            return None
+        logger.debug('Format cache hit for key "%s"', key)
+        utime(cache_file_path)  # The modification time marks the last use of the entry (see prune)
+        return utils.read_file(cache_file_path)
+
+    def set(self, key, formatted_content):
+        """
+        Store the formatted content under the given cache key.
+        """
+        logger.debug('Storing formatted content in format cache under key "%s"', key)
+        cache_file_path = utils.get_path(self.cache_folder_path, key)
+        utils.write_to_file(cache_file_path, formatted_content)
+
+    def add_reference(self, file_path, key):
+        """
+        Record that the cache entry with the given key holds the current content of the generated file.
+        """
+        relative_path = file_path.relative_to(self.project_path) if file_path.is_relative_to(self.project_path) else file_path
+        with self.lock:
+            self.file_keys[relative_path.as_posix()] = key
+
+    def prune(self, max_entries=cfg.FORMAT_CACHE_MAX_ENTRIES):
+        """
+        Remove the entries which no generated file references anymore, then the least recently used entries above the limit.
+        Files which were not generated again (unchanged entities) keep the entry they referenced in the previous generation.
+        """
+        with self.lock:
+            self.file_keys = {file_path: key for file_path, key in self.file_keys.items() if utils.get_path(self.project_path, file_path).exists()}
+            referenced_keys = set(self.file_keys.values())
+        cache_file_paths = [utils.get_path(self.cache_folder_path, key) for key in listdir(self.cache_folder_path)]
+        unreferenced_paths = [cache_file_path for cache_file_path in cache_file_paths if cache_file_path.name not in referenced_keys]
+        referenced_paths = sorted((cache_file_path for cache_file_path in cache_file_paths if cache_file_path.name in referenced_keys), key=getmtime)
+        removed_paths = unreferenced_paths + referenced_paths[:max(0, len(referenced_paths) - max_entries)]
+        for cache_file_path in removed_paths:
+            utils.delete_file(cache_file_path)
+        if removed_paths:
+            logger.info('Removed %s outdated entries from the format cache', len(removed_paths))
+        self.save()
+
+
+class GoogleJavaFormatter:
+    """
+    Class for formatting the generated Java files using Google Java Format.
+    Files are collected during the generation and formatted in batches, so one JVM formats many files.
+    Formatting is done on staged copies in the cache folder, so the generated files are written only once, with their final content.
+    """
+    google_format_jar_path = None  # Resolved once per process and reused by every generate run
+
+    def __init__(self, project_path, batch_size=cfg.GOOGLE_FORMAT_BATCH_SIZE, workers=1):
+        """
+        Constructor for the GoogleJavaFormatter class.
+        """
+        self.batch_size = batch_size
+        self.workers = workers
+        self.project_path = project_path
+        self.staging_folder_path = utils.get_path(project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.CACHE_FOLDER, cfg.FORMAT_STAGING_FOLDER)
+        self.pending_files = list()
+        self.format_cache = None
+        google_format_jar_path = self.get_google_format_jar_path()
+        if google_format_jar_path:
+            self.format_cache = FormatCache(project_path, google_format_jar_path)
+
+    @classmethod
+    def get_google_format_jar_path(cls):
+        """
+        Find the Google Java Format jar file in the resources folder (see utils.find_resource_jar).
+        """
+        if cls.google_format_jar_path is None:
+            cls.google_format_jar_path = utils.find_resource_jar(cfg.GOOGLE_FORMAT_JAR_PREFIX)
+        return cls.google_format_jar_path
+
+    def get_formatted_content(self, file_path, content):
+        """
+        Get the already formatted content of the file for the given unformatted content from the format cache.
+        Returns None if the content has not been formatted before.
+        """
+        if not self.format_cache:
+            return None
+        key = self.format_cache.get_key(content)
+        formatted_content = self.format_cache.get(key)
+        if formatted_content is not None:
+            self.format_cache.add_reference(file_path, key)
+        return formatted_content
+
+    def prune_format_cache(self):
+        """
+        Remove the format cache entries which are no longer used by the generated files.
+        """
+        if self.format_cache:
+            self.format_cache.prune()
+
+    def add_file(self, file_path, content):
+        """
+        Add the file with its unformatted content to the list of files waiting to be formatted.
+        """
+        logger.debug('Adding file "%s" to the Google Java Format queue', file_path.name)
+        self.pending_files.append((file_path, content))
+
+    def format_pending_files(self):
+        """
+        Format all pending files using Google Java Format, one JVM per batch of files.
+        Returns the list of file paths and their formatted content (unformatted if no Google Java Format jar is found).
+        """
+        pending_files = self.pending_files
+        self.pending_files = list()
+        if not pending_files:
+            return list()
+        google_format_jar_path = self.get_google_format_jar_path()
+        if not google_format_jar_path:
+            return pending_files
+
+        try:
+            staged_files = [(file_path, self.stage_file(file_path, content), content) for file_path, content in pending_files]
+            batch_size = self.get_batch_size(len(staged_files))
+            batches = [staged_files[index:index + batch_size] for index in range(0, len(staged_files), batch_size)]
+            logger.info('Formatting %s file(s) using Google Java Format in %s batch(es)', len(staged_files), len(batches))
+            if len(batches) == 1:
+                self.format_and_cache_batch(google_format_jar_path, batches[0])
+            else:
+                # Run the JVMs in parallel and raise the error of the first failing batch (in file order)
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+                    futures = [executor.submit(self.format_and_cache_batch, google_format_jar_path, batch) for batch in batches]
+                    for future in futures:
+                        future.result()
+            logger.info('Files formatted successfully')
+            return [(file_path, utils.read_file(staging_path)) for file_path, staging_path, _ in staged_files]
+        finally:
+            # Staged files are removed even if formatting failed, so they do not pile up in the project folder
+            logger.debug('Removing the Google Java Format staging folder "%s"', self.staging_folder_path)
+            shutil.rmtree(self.staging_folder_path, ignore_errors=True)
+
+    def stage_file(self, file_path, content):
+        """
+        Write the unformatted content to a staging file which mirrors the file path relative to the project.
+        """
+        relative_path = file_path.relative_to(self.project_path) if file_path.is_relative_to(self.project_path) else file_path.name
+        staging_path = utils.get_path(self.staging_folder_path, relative_path)
+        utils.create_folder(staging_path.parent.parent, staging_path.parent.name)
+        utils.write_to_file(staging_path, content)
+        return staging_path
+
+    def get_batch_size(self, file_count):
+        """
+        Get the batch size so the files are spread across the workers, without making batches too small.
+        """
+        batch_size = ceil(file_count / self.workers)
+        return max(cfg.GOOGLE_FORMAT_MIN_BATCH_SIZE, min(self.batch_size, batch_size))
+
+    def format_and_cache_batch(self, google_format_jar_path, batch):
+        """
+        Format the given batch of staged files and store the formatted content in the format cache.
+        """
+        self.format_batch(google_format_jar_path, self.project_path, [staging_path for _, staging_path, _ in batch])
+        self.update_format_cache(batch)
+
+    def update_format_cache(self, batch):
+        """
+        Store the formatted content of the given batch of staged files in the format cache.
+        """
+        for file_path, staging_path, content in batch:
+            key = self.format_cache.get_key(content)
+            self.format_cache.set(key, utils.read_file(staging_path))
+            self.format_cache.add_reference(file_path, key)
+
+    def format_batch(self, google_format_jar_path, folder_path, batch):
+        """
+        Format the given batch of files with a single Google Java Format process.
+        Falls back to formatting file by file if the command line of the batch is too long for the OS.
+        Raise a JavaNotFoundError if Java is not installed.
+        """
+        try:
+            logger.debug('Formatting batch of %s file(s) using Google Java Format', len(batch))
+            command = ['java', '-jar', str(google_format_jar_path), *cfg.GOOGLE_FORMAT_OPTIONS, '--replace', *[str(file_path) for file_path in batch]]
+            subprocess.run(command, check=True, cwd=folder_path, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            error_message = str(e.stderr).replace('\n', '. ').rstrip('. ')
+            logger.error('Failed to format files using Google Java Format: %s', error_message)
+            raise
+        except FileNotFoundError as e:
+            raise eh.JavaNotFoundError(cfg.JAVA_NOT_FOUND_ERROR) from e
+        except OSError as e:
+            if not is_command_line_too_long_error(e):
+                raise
+            logger.warning('Command line of the Google Java Format batch is too long (%s). Formatting file by file', e)
+            for file_path in batch:
+                self.format_file(google_format_jar_path, folder_path, file_path)
+
+    def format_file(self, google_format_jar_path, folder_path, file_path):
+        """
+        Format a single file using Google Java Format.
+        """
+        try:
+            logger.debug('Formatting file "%s" using Google Java Format', file_path.name)
+            command = ['java', '-jar', str(google_format_jar_path), *cfg.GOOGLE_FORMAT_OPTIONS, '--replace', str(file_path)]
+            subprocess.run(command, check=True, cwd=folder_path, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            error_message = str(e.stderr).replace('\n', '. ').rstrip('. ')
+            logger.error('Failed to format file "%s" using Google Java Format: %s', file_path.name, error_message)
+            raise
+
+
+def is_command_line_too_long_error(error):
+    """
+    Check if the process could not be started because its command line exceeds the OS limit.
+    """
+    return error.errno == errno.E2BIG or getattr(error, 'winerror', None) == cfg.WINDOWS_COMMAND_LINE_TOO_LONG_ERROR
@@ -1,18 +1,31 @@
 import logging
-import subprocess
+import threading
+from functools import lru_cache
+from os import cpu_count, listdir
 
 import jinja2
 
 import src.config as cfg
+import src.error_handler as eh
 import src.grammar_classes as gc
 import src.utils as utils
 from src.build_tool_dependency import BuildToolDependency
+from src.generation_manifest import GenerationManifest
+from src.java_formatter import GoogleJavaFormatter
+
+
+logger = logging.getLogger(__name__)
 
 
 class Jinja:
     """
     Class for executing Jinja templates and writing grammar elements into the Java files
+    Every instance carries the state of its own generation, so several projects can be generated concurrently.
     """
+    cached_jinja_env = None  # Process-wide Jinja environment (with its loaded templates and filters) shared by all generate runs
+    cached_jinja_env_signature = None  # Modification times of the template files the cached Jinja environment was created from
+    jinja_env_lock = threading.Lock()  # Guards the creation of the cached Jinja environment by concurrent generate runs
+
     def __init__(self):
         """
         Constructor for the Jinja class.
@@ -21,170 +34,296 @@ class Jinja:
         self.project_path = None
         self.java_app_folder_path = None
         self.java_app_file_path = None
+        self.java_formatter = None
+        self.workers = None
+        self.file_counts = None
 
     def set_jinja_env(self, jinja_env):
         """
         Set the Jinja environment.
         """
-        logging.debug(f'Setting Jinja environment variable')
+        logger.debug('Setting Jinja environment variable')
         self.jinja_env = jinja_env
 
     def set_project_path(self, project_path):
         """
         Set the project path.
         """
-        logging.debug(f'Setting project path variable to "{project_path}"')
+        logger.debug('Setting project path variable to "%s"', project_path)
         self.project_path = project_path
 
     def set_java_app_file_path(self, java_app_file_path):
         """
         Set the Java app file path.
         """
-        logging.debug('Setting Java app file path')
+        logger.debug('Setting Java app file path')
         self.java_app_file_path = java_app_file_path
 
     def set_java_app_folder_path(self):
         """
         Set the Java app folder path.
         """
-        logging.debug('Setting Java app folder path')
+        logger.debug('Setting Java app folder path')
         java_folder = utils.get_path(self.project_path, cfg.PROJECT_JAVA_FOLDER)
         java_app_file_path = utils.find_java_app_file(java_folder)
-        self.set_java_app_file_path(self, java_app_file_path)
+        self.set_java_app_file_path(java_app_file_path)
         self.java_app_folder_path = java_app_file_path.parent
 
-    @classmethod
-    def generate(self, model, project_path):
+    def set_java_formatter(self, java_formatter):
+        """
+        Set the Java formatter.
+        """
+        logger.debug('Setting Java formatter')
+        self.java_formatter = java_formatter
+
+    def set_workers(self, workers):
+        """
+        Set the number of Google Java Format JVMs run in parallel (defaults to the number of CPU cores).
+        """
+        self.workers = max(1, workers or cpu_count() or 1)
+        logger.debug('Setting number of Google Java Format workers to %s', self.workers)
+
+    def reset_file_counts(self):
+        """
+        Reset the counts of written, unchanged and deleted files.
+        """
+        logger.debug('Resetting generated file counts')
+        self.file_counts = {cfg.WRITTEN: 0, cfg.UNCHANGED: 0, cfg.DELETED: 0}
+
+    def generate(self, model, project_path, workers=cfg.GENERATE_WORKERS):
         """
         Generate the grammar elements from the given model and project path.
         Save the generated Java files in the specified folder.
+        The formatting is spread over the given number of Google Java Format JVMs (None uses all CPU cores, 1 formats in a single JVM).
+        Returns the counts of written, unchanged and deleted files.
         """
-        logging.info('Starting to execute Jinja templates')
+        logger.info('Starting to execute Jinja templates')
         utils.folder_exists(cfg.TEMPLATE_FOLDER)
         utils.file_exists(cfg.TEMPLATE_FOLDER, cfg.JAVA_CLASS_TEMPLATE_FILE)
-        jinja_env = self.create_jinja_environment(cfg.TEMPLATE_FOLDER)  # Initialize template engine
-        self.register_jinja_filters(jinja_env)
-        self.set_jinja_env(self, jinja_env)
-        self.set_project_path(self, project_path)
-        self.set_java_app_folder_path(self)
+        self.set_jinja_env(self.get_jinja_environment(cfg.TEMPLATE_FOLDER))
+        self.set_project_path(project_path)
+        self.set_java_app_folder_path()
+        self.set_workers(workers)
+        self.reset_file_counts()
+        filter_cache_info = get_filter_cache_info()
+        self.set_java_formatter(GoogleJavaFormatter(self.project_path, workers=self.workers))
 
         # Add database dependency 
         if model.add_database_dependency:
-            self.add_database_dependency(self, model)
+            self.add_database_dependency(model)
 
-        # Render template for each entity
+        # Render template for each entity that changed since the last generation
+        google_format_jar_path = GoogleJavaFormatter.get_google_format_jar_path()
+        generation_manifest = GenerationManifest(self.project_path, model, extra_fingerprint_values=[google_format_jar_path])
+        changed_entities = list()
         for entity in model.entities:
-            self.execute_templates(self, model, entity)
+            if not generation_manifest.is_entity_changed(entity) and self.entity_files_exist(entity):
+                logger.info('Entity "%s" did not change since the last generation, skipping it', entity.name)
+                continue
+            changed_entities.append(entity)
+        self.execute_entities_templates(model, changed_entities)
+
+        # Delete the files of the entities removed from the model
+        for entity_name in generation_manifest.get_removed_entities():
+            self.delete_entity_files(entity_name)
         
         # Render template for repository configuration
-        self.render_template(self, model, entity, self.java_app_folder_path, cfg.JAVA_REPOSITORY_CONFIGURATION_TEMPLATE_FILE, cfg.JAVA_REPOSITORY_CONFIGURATION_FILE_NAME)
+        self.render_template(model, entity, self.java_app_folder_path, cfg.JAVA_REPOSITORY_CONFIGURATION_TEMPLATE_FILE, cfg.JAVA_REPOSITORY_CONFIGURATION_FILE_NAME)
         
         # Render template for Application
         if utils.check_app_file_content(self.java_app_file_path):
-            self.render_template(self, model, entity, self.java_app_folder_path, cfg.JAVA_APPLICATION_TEMPLATE_FILE, cfg.JAVA_APPLICATION_FILE_NAME)
+            self.render_template(model, entity, self.java_app_folder_path, cfg.JAVA_APPLICATION_TEMPLATE_FILE, cfg.JAVA_APPLICATION_FILE_NAME)
         
         # Render template for application.properties file
         resources_path = utils.get_path(self.project_path, cfg.PROJECT_RESOURCES_FOLDER)
         utils.folder_exists(resources_path)
-        self.render_template(self, model, None, resources_path, cfg.APPLICATION_PROPERTIES_TEMPLATE_FILE, cfg.APPLICATION_PROPERTIES_FILE_NAME)
+        self.render_template(model, None, resources_path, cfg.APPLICATION_PROPERTIES_TEMPLATE_FILE, cfg.APPLICATION_PROPERTIES_FILE_NAME)
 
-        logging.info('Jinja templates executed successfully')
+        # Format all generated files in batches (one JVM per batch instead of one per file)
+        for file_path, formatted_content in self.java_formatter.format_pending_files():
+            self.write_file_if_changed(file_path, formatted_content)
+        self.java_formatter.prune_format_cache()
+        generation_manifest.save()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Jinja filter caches: %s', get_filter_cache_usage(filter_cache_info))
+        logger.info('Generated files: %s written, %s unchanged, %s deleted', self.file_counts[cfg.WRITTEN], self.file_counts[cfg.UNCHANGED], self.file_counts[cfg.DELETED])
+        logger.info('Jinja templates executed successfully')
+        return self.file_counts
+
+    @classmethod
+    def get_jinja_environment(cls, template_folder):
+        """
+        Get the process-wide Jinja environment with the registered filters.
+        The environment is reused by the next generate runs, until a template file is added, removed or modified.
+        """
+        with cls.jinja_env_lock:
+            jinja_env_signature = cls.get_template_folder_signature(template_folder)
+            if cls.cached_jinja_env is not None and cls.cached_jinja_env_signature == jinja_env_signature:
+                logger.debug('Template files did not change, reusing the Jinja environment')
+                return cls.cached_jinja_env
+            jinja_env = cls.create_jinja_environment(template_folder)  # Initialize template engine
+            cls.register_jinja_filters(jinja_env)
+            cls.cached_jinja_env = jinja_env
+            cls.cached_jinja_env_signature = jinja_env_signature
+            return jinja_env
 
+    @staticmethod
+    def get_template_folder_signature(template_folder):
+        """
+        Get the names and modification times of all template files in the specified folder.
+        """
+        logger.debug('Getting modification times of the template files in folder "%s"', template_folder)
+        return tuple((file_name, utils.get_modification_time(utils.get_path(template_folder, file_name))) for file_name in sorted(listdir(template_folder)))
+
+    @staticmethod
     def create_jinja_environment(template_folder):
         """
         Initialize Jinja environment with templates from the specified folder.
-        """
-        logging.debug(f'Initializing Jinja environment with templates from folder "{template_folder}"')
-        return jinja2.Environment(loader=jinja2.FileSystemLoader(template_folder), trim_blocks=True, lstrip_blocks=True)
+        Compiled templates are stored in a bytecode cache in the generator folder (independent of the working directory),
+        which Jinja validates against the checksum of the template source.
+        """
+        logger.debug('Initializing Jinja environment with templates from folder "%s"', template_folder)
+        cache_folder_path = utils.get_path(utils.get_generator_path(), cfg.CACHE_FOLDER)
+        utils.create_folder(cache_folder_path, cfg.JINJA_CACHE_FOLDER)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(utils.get_path(cache_folder_path, cfg.JINJA_CACHE_FOLDER)))
+        return jinja2.Environment(loader=jinja2.FileSystemLoader(template_folder), bytecode_cache=bytecode_cache, trim_blocks=True, lstrip_blocks=True)
     
+    @staticmethod
     def register_jinja_filters(jinja_env):
         """
         Register Jinja filters.
         """
-        logging.debug('Registering Jinja filters')
+        logger.debug('Registering Jinja filters')
         JinjaFilters(jinja_env)
-        logging.debug('Jinja filters registered successfully')
+        logger.debug('Jinja filters registered successfully')
 
     def add_database_dependency(self, model):
         """
         Add database dependency to the project.
         """
-        logging.info('Adding database dependency to the project')
+        logger.info('Adding database dependency to the project')
         project_name = utils.get_base_name(self.project_path)
         build_tool_dependency = BuildToolDependency(project_name, self.project_path, model.build_tool, model.database)
         build_tool_dependency.add_driver_dependency()
-        logging.info('Database dependency added successfully')
+        logger.info('Database dependency added successfully')
+
+    def execute_entities_templates(self, model, entities):
+        """
+        Execute Jinja templates for the given entities and save the generated Java files.
+        Entities are rendered one by one, in the entity order of the model.
+        """
+        for entity in entities:
+            self.write_entity_files(entity, self.execute_templates(model, entity))
+
+    def write_entity_files(self, entity, rendered_files):
+        """
+        Write the rendered files of the given entity.
+        """
+        for file_path, content in rendered_files:
+            self.write_rendered_file(file_path, content)
+        logger.info('Jinja templates executed successfully for entity "%s"', entity.name)
 
     def execute_templates(self, model, entity):
         """
-        Execute Jinja templates for the given entity and save the generated Java files.
+        Execute Jinja templates for the given entity and return the rendered Java files.
+        Raise a TemplateRenderError with the entity name if any of the templates fails.
         """
-        logging.info(f'Starting to execute Jinja templates for entity "{entity.name}"')
-        utils.create_folder(self.java_app_folder_path, entity.name)
-        self.execute_template(self, model, entity, self.java_app_folder_path)
-        logging.info(f'Jinja templates executed successfully for entity "{entity.name}"')
+        try:
+            logger.info('Starting to execute Jinja templates for entity "%s"', entity.name)
+            utils.create_folder(self.java_app_folder_path, entity.name)
+            return self.execute_template(model, entity, self.java_app_folder_path)
+        except Exception as e:
+            raise eh.TemplateRenderError(entity.name, str(e)) from e
 
     def execute_template(self, model, entity, folder_path):
         """
-        Execute the Jinja template for the given entity and save the generated Java file in the specified folder.
+        Execute the Jinja template for the given entity and return the rendered Java files for the specified folder.
+        """
+        logger.debug('Executing Jinja template for entity "%s"', entity.name)
+        return [
+            self.render_content(model, entity, folder_path, cfg.JAVA_CLASS_TEMPLATE_FILE, cfg.JAVA_CLASS_FILE_NAME),
+            self.render_content(model, entity, folder_path, cfg.JAVA_CONTROLLER_TEMPLATE_FILE, cfg.JAVA_CONTROLLER_FILE_NAME),
+            self.render_content(model, entity, folder_path, cfg.JAVA_SERVICE_TEMPLATE_FILE, cfg.JAVA_SERVICE_FILE_NAME),
+            self.render_content(model, entity, folder_path, cfg.JAVA_REPOSITORY_TEMPLATE_FILE, cfg.JAVA_REPOSITORY_FILE_NAME),
+        ]
+
+    def get_entity_file_paths(self, entity_name):
+        """
+        Get the paths to all Java files generated for the entity with the given name.
+        """
+        entity_file_names = [cfg.JAVA_CLASS_FILE_NAME, cfg.JAVA_CONTROLLER_FILE_NAME, cfg.JAVA_SERVICE_FILE_NAME, cfg.JAVA_REPOSITORY_FILE_NAME]
+        return [utils.get_path(self.java_app_folder_path, entity_name, file_name % entity_name) for file_name in entity_file_names]
+
+    def entity_files_exist(self, entity):
+        """
+        Check if all Java files generated for the given entity exist.
+        """
+        return all(file_path.exists() for file_path in self.get_entity_file_paths(entity.name))
+
+    def delete_entity_files(self, entity_name):
+        """
+        Delete the Java files generated for the entity which no longer exists in the model.
         """
-        logging.debug(f'Executing Jinja template for entity "{entity.name}"')
-        self.render_template(self, model, entity, folder_path, cfg.JAVA_CLASS_TEMPLATE_FILE, cfg.JAVA_CLASS_FILE_NAME)
-        self.render_template(self, model, entity, folder_path, cfg.JAVA_CONTROLLER_TEMPLATE_FILE, cfg.JAVA_CONTROLLER_FILE_NAME)
-        self.render_template(self, model, entity, folder_path, cfg.JAVA_SERVICE_TEMPLATE_FILE, cfg.JAVA_SERVICE_FILE_NAME)
-        self.render_template(self, model, entity, folder_path, cfg.JAVA_REPOSITORY_TEMPLATE_FILE, cfg.JAVA_REPOSITORY_FILE_NAME)
+        logger.info('Entity "%s" was removed from the model, deleting its generated files', entity_name)
+        for file_path in self.get_entity_file_paths(entity_name):
+            if utils.delete_file(file_path):
+                self.file_counts[cfg.DELETED] += 1
+        utils.delete_empty_folder(utils.get_path(self.java_app_folder_path, entity_name))
 
     def render_template(self, model, entity, folder_path, template_name, file_name):
         """
         Load the Jinja template for the given entity and save the generated Java file.
         """
-        logging.debug(f'Loading Jinja template "{template_name}"')
+        file_path, content = self.render_content(model, entity, folder_path, template_name, file_name)
+        self.write_rendered_file(file_path, content)
+
+    def render_content(self, model, entity, folder_path, template_name, file_name):
+        """
+        Load and render the Jinja template for the given entity.
+        Returns the path of the Java file and its rendered content.
+        """
+        logger.debug('Loading Jinja template "%s"', template_name)
         template = self.jinja_env.get_template(template_name)
         content = template.render(model=model, entity=entity)
-        file_path = self.get_render_file_path(entity, folder_path, file_name)
-        logging.info(f'Writing content to file "{file_path.name}"')
-        utils.write_to_file(file_path, content)
-        self.format_java_file(folder_path, file_path)
+        file_path = self.get_render_file_path(model, entity, folder_path, file_name)
+        return file_path, content
+
+    def write_rendered_file(self, file_path, content):
+        """
+        Save the rendered content to the file, using the already formatted content if it is cached.
+        """
+        formatted_content = self.java_formatter.get_formatted_content(file_path, content)
+        if formatted_content is not None:
+            # Same content was already formatted, so there is no need to call Google Java Format again
+            self.write_file_if_changed(file_path, formatted_content)
+            return
+        self.java_formatter.add_file(file_path, content)
 
-    def get_render_file_path(entity, folder_path, file_name):
+    def write_file_if_changed(self, file_path, content):
+        """
+        Write the final content to the file if it differs from the content on disk, so unchanged files keep their modification time.
+        """
+        if utils.write_to_file_if_changed(file_path, content):
+            logger.info('Writing content to file "%s"', file_path.name)
+            self.file_counts[cfg.WRITTEN] += 1
+        else:
+            logger.debug('File "%s" is unchanged', file_path.name)
+            self.file_counts[cfg.UNCHANGED] += 1
+
+    @staticmethod
+    def get_render_file_path(model, entity, folder_path, file_name):
         """
         Get the path to the rendered Java file.
         """
         java_file_name = file_name
         if 'Application' in file_name:
-            java_file_name = file_name % str(entity.parent.build_tool).replace('-', '')
+            java_file_name = file_name % str(model.build_tool).replace('-', '')
         elif '%s' in file_name:
             java_file_name = file_name % entity.name
             folder_path = utils.get_path(folder_path, entity.name)
         file_path = utils.get_path(folder_path, java_file_name)
         return file_path
-
-    def format_java_file(folder_path, file_path):
-        """
-        Format the Java file using Google Java Format.
-        """
-        try:
-            logging.debug(f'Formatting file "{file_path.name}" using Google Java Format')
-            utils.folder_exists(cfg.RESOURCES_FOLDER)
-
-            # Find the Google Java Format jar file in the resources folder
-            google_format_file_name = utils.find_specific_file_regex(cfg.RESOURCES_FOLDER, cfg.GOOGLE_FORMAT_REGEX)
-            if not google_format_file_name:
-                logging.warning(f'No Google Java Format jar file found in the "{cfg.RESOURCES_FOLDER}" folder')
-                return
-            elif len(google_format_file_name) > 1:
-                logging.warning(f'More than one Google Java Format jar file found in the "{cfg.RESOURCES_FOLDER}" folder. Using the newest one: {google_format_file_name[0]}')
-
-            current_directory = utils.get_current_path()
-            google_format_jar_path = utils.get_path(current_directory, cfg.RESOURCES_FOLDER, google_format_file_name[0])
-            command = f'java -jar {google_format_jar_path} --skip-reflowing-long-strings --skip-javadoc-formatting --aosp --replace {file_path}'
-            subprocess.run(command, shell=True, check=True, cwd=folder_path, capture_output=True, text=True)
-        except subprocess.CalledProcessError as e:
-            error_message = str(e.stderr).replace('\n', '. ').rstrip('. ')
-            logging.error(f'Failed to format file "{file_path.name}" using Google Java Format: {error_message}')
-            raise
-        except Exception as e:
-            raise
         
 
 class JinjaFilters:
@@ -228,90 +367,90 @@ class JinjaFilters:
         """
         Convert the given word to lowercase.
         """
-        logging.debug(f'Converting "{word}" to lowercase')
+        logger.debug('Converting "%s" to lowercase', word)
         return str(word).lower()
     
     def plural(self, word):
         """
         Pluralize the given word.
         """
-        logging.debug(f'Pluralize "{word}"')
-        return utils.pluralize_word(word)
+        logger.debug('Pluralize "%s"', word)
+        return utils.pluralize_word(str(word))
     
     def plural_lowercase(self, word):
         """
         Pluralize the given word and convert it to lowercase.
         """
-        logging.debug(f'Pluralize "{word}" and convert it to lowercase')
-        return utils.pluralize_word(word).lower()
+        logger.debug('Pluralize "%s" and convert it to lowercase', word)
+        return utils.pluralize_word(str(word)).lower()
     
     def plural_capitalize(self, word):
         """
         Pluralize the given word and capitalize it.
         """
-        logging.debug(f'Pluralize "{word}" and capitalize it')
-        return utils.pluralize_word(word).capitalize()
+        logger.debug('Pluralize "%s" and capitalize it', word)
+        return utils.pluralize_word(str(word)).capitalize()
     
     def uppercase(self, word):
         """
         Convert the given word to uppercase.
         """
-        logging.debug(f'Converting "{word}" to uppercase')
+        logger.debug('Converting "%s" to uppercase', word)
         return str(word).upper()
     
     def uppercase_first(self, word):
         """
         Capitalize the first letter of the given word leaving the rest.
         """
-        logging.debug(f'Capitalizing first letter of "{word}" leaving the rest')
-        return f'{str(word[0]).upper()}{word[1:]}'
+        logger.debug('Capitalizing first letter of "%s" leaving the rest', word)
+        return utils.uppercase_first_letter(str(word))
     
     def lowercase_first(self, word):
         """
         Convert the first character of the given word to lowercase.
         """
-        logging.debug(f'Converting first character of "{word}" to lowercase')
-        return f'{str(word[0]).lower()}{word[1:]}'
+        logger.debug('Converting first character of "%s" to lowercase', word)
+        return utils.lowercase_first_letter(str(word))
     
     def url(self, database_name):
         """
         Get the url.
         """
-        logging.debug(f'Getting url')
+        logger.debug('Getting url')
         url = cfg.DATABASE_MAPPINGS[database_name]['url']
-        logging.debug(f'url: {url}')
+        logger.debug('url: %s', url)
         return url
     
     def driver(self, database_name):
         """
         Get the driver.
         """
-        logging.debug(f'Getting driver')
+        logger.debug('Getting driver')
         driver = cfg.DATABASE_MAPPINGS[database_name]['driver']
-        logging.debug(f'Driver: {driver}')
+        logger.debug('Driver: %s', driver)
         return driver
     
     def dialect(self, database_name):
         """
         Get the dialect.
         """
-        logging.debug(f'Getting dialect')
+        logger.debug('Getting dialect')
         dialect = cfg.DATABASE_MAPPINGS[database_name]['dialect']
-        logging.debug(f'Dialect: {dialect}')
+        logger.debug('Dialect: %s', dialect)
         return dialect
     
     def is_transient(self, list_type):
         """
         Check if the given list type is transient. Only HashMap and HashSet are transient.
         """
-        logging.debug(f'Checking if list type "{list_type}" is transient')
+        logger.debug('Checking if list type "%s" is transient', list_type)
         return list_type in {cfg.LIST_TYPE_MAPPING[cfg.HASHMAP], cfg.LIST_TYPE_MAPPING[cfg.TREEMAP]}
     
     def default_constructor_properties(self, constructors):
         """
         Get the default constructor properties.
         """
-        logging.debug(f'Getting default constructor properties')
+        logger.debug('Getting default constructor properties')
         for constructor in constructors:
             if not constructor.default_constructor:
                 continue
@@ -325,21 +464,21 @@ class JinjaFilters:
         """
         Get the generated objects names.
         """
-        logging.debug(f'Getting generated objects names')
+        logger.debug('Getting generated objects names')
         return ', '.join([f'{entity_name}_{i}' for i in range(1, 4)])
     
     def toString(self, property):
         """
         Return the string representation of the given word.
         """
-        logging.debug(f'Returning string representation of "{property.name}"')
+        logger.debug('Returning string representation of "%s"', property.name)
         return str(property.name) if not property.constant else str(property.name).upper()
     
     def repository_configuration_value(self, property):
         """
         Get the repository configuration value.
         """
-        logging.debug(f'Getting repository configuration value for property "{property.name}"')
+        logger.debug('Getting repository configuration value for property "%s"', property.name)
         list_type = property.list_type
         property_type = property.property_type
         if isinstance(list_type, gc.ListType):
@@ -359,7 +498,7 @@ class JinjaFilters:
         """
         prefix = 'an' if str(word[0]).lower() in cfg.VOWELS else 'a'
         description = f'Defines {prefix} {word} entity with essential attributes and functionalities.'
-        logging.debug(f'Returning description "{description}"')
+        logger.debug('Returning description "%s"', description)
         return description
     
     def method_type(self, method):
@@ -368,7 +507,7 @@ class JinjaFilters:
         """
         method_declaration = method.method_declaration
         method_type = method_declaration.method_type
-        logging.debug(f'Converting method type "{method_type}" to Java type')
+        logger.debug('Converting method type "%s" to Java type', method_type)
         if isinstance(method_type, gc.IDType):
             return 'UUID'
         if type(method_declaration).__name__ == 'ListMethodType':
@@ -386,7 +525,7 @@ class JinjaFilters:
         """
         method_declaration = method.method_declaration
         method_type = method_declaration.method_type
-        logging.debug(f'Returning default value for method "{method_type}"')
+        logger.debug('Returning default value for method "%s"', method_type)
         if type(method_declaration).__name__ == 'ListMethodType':
             java_list_type = self.map_method_list_default_value(method_declaration.list_type)
             java_method_type = self.java_type(method_declaration)
@@ -399,72 +538,18 @@ class JinjaFilters:
     def java_type(self, type_object):
         """
         Convert the given type from provided object to Java type.
+        The conversion is memoized by the type category and value (see map_java_type).
         """
-        logging.debug(f'Converting data type "{type_object}" to Java type')
+        logger.debug('Converting data type "%s" to Java type', type_object)
         if type_object == 'void': return type_object
-
-        if isinstance(type_object, gc.IDType):
-            return {
-                cfg.ID: cfg.LONG.capitalize(),
-                cfg.IDENTIFIER: cfg.LONG.capitalize(),
-                cfg.UNIQUE_ID: cfg.LONG.capitalize(),
-                cfg.KEY: cfg.LONG.capitalize(),
-                cfg.PRIMARY_KEY: cfg.LONG.capitalize(),
-            }.get(type_object.type, type_object.type)
-        
-        elif isinstance(type_object, gc.OtherDataType):
-            return {
-                cfg.STR: cfg.STRING.capitalize(),
-                cfg.STRING: cfg.STRING.capitalize(),
-                cfg.STRING_C: cfg.STRING.capitalize(),
-            }.get(type_object.type, type_object.type)
-        
-        elif isinstance(type_object, gc.DateType):
-            return {
-                cfg.DATE: cfg.MAP_JAVA_TYPES[cfg.DATE],
-                cfg.TIME: cfg.MAP_JAVA_TYPES[cfg.TIME],
-                cfg.DATETIME: cfg.MAP_JAVA_TYPES[cfg.DATETIME],
-            }.get(type_object.type, type_object.type)
-        
-        elif isinstance(type_object, gc.ListType):
-            return {
-                cfg.ARRAY: cfg.MAP_JAVA_TYPES[cfg.ARRAY],
-                cfg.LINKED: cfg.MAP_JAVA_TYPES[cfg.LINKED],
-                cfg.HASHMAP: cfg.MAP_JAVA_TYPES[cfg.HASHMAP],
-                cfg.HASHSET: cfg.MAP_JAVA_TYPES[cfg.HASHSET],
-                cfg.TREEMAP: cfg.MAP_JAVA_TYPES[cfg.TREEMAP],
-                cfg.LIST: cfg.LIST.capitalize(),
-            }.get(type_object.type, type_object.type)
-        
-        elif type(type_object).__name__ == 'Entity':
-            return {}.get(type_object.name, type_object.name)
-        
-        elif type(type_object).__name__ == 'ListMethodType':
-            if type(type_object.method_type).__name__ == 'Entity':
-                return {}.get(type_object.method_type.name, type_object.method_type.name)
-            return {
-                cfg.BYTE: cfg.BYTE_W,
-                cfg.SHORT: cfg.SHORT_W,
-                cfg.CHAR: cfg.CHARACTER_W,
-                cfg.INT: cfg.INTEGER_W,
-                cfg.FLOAT: cfg.FLOAT_W,
-                cfg.LONG: cfg.LONG_W,
-                cfg.DOUBLE: cfg.DOUBLE_W,
-                cfg.BOOLEAN: cfg.BOOLEAN_W,
-                cfg.STR: cfg.STRING.capitalize(),
-                cfg.STRING: cfg.STRING.capitalize(),
-                cfg.STRING_C: cfg.STRING.capitalize(),
-            }.get(type_object.method_type.type, type_object.method_type.type)
-        
-        else:
-            return {}.get(type_object.type, type_object.type)
+        return map_java_type(*get_java_type_key(type_object))
 
     def map_list_type(self, list_type):
         """
         Map a list type to the corresponding Java type.
         """
         mapped_list_type = cfg.LIST_TYPE_MAPPING.get(list_type.type, '{}')
-        logging.debug(f'Mapping list type "{list_type.type}" to "{mapped_list_type}"')
+        logger.debug('Mapping list type "%s" to "%s"', list_type.type, mapped_list_type)
         return mapped_list_type
     
     def map_method_list_type(self, list_type):
@@ -472,7 +557,7 @@ class JinjaFilters:
         Map a method list type to the corresponding Java type.
         """
         mapped_list_type = cfg.METHOD_LIST_TYPE_MAPPING.get(list_type.type, '{}')
-        logging.debug(f'Mapping list type "{list_type.type}" to "{mapped_list_type}"')
+        logger.debug('Mapping list type "%s" to "%s"', list_type.type, mapped_list_type)
         return mapped_list_type
     
     def map_method_list_default_value(self, list_type):
@@ -480,7 +565,7 @@ class JinjaFilters:
         Map a method list default value to the corresponding Java value.
         """
         mapped_list_type = cfg.METHOD_LIST_DEFAULT_VALUE_MAPPING.get(list_type.type, '{}')
-        logging.debug(f'Mapping list type "{list_type.type}" to "{mapped_list_type}"')
+        logger.debug('Mapping list type "%s" to "%s"', list_type.type, mapped_list_type)
         return mapped_list_type
     
     def map_repository_configuration_list_type(self, list_type):
@@ -488,7 +573,7 @@ class JinjaFilters:
         Map a repository configuration list type to the corresponding Java type.
         """
         mapped_list_type = cfg.REPOSITORY_CONFIGURATION_LIST_TYPE_MAPPING.get(list_type.type, '{}')
-        logging.debug(f'Mapping list type "{list_type.type}" to "{mapped_list_type}"')
+        logger.debug('Mapping list type "%s" to "%s"', list_type.type, mapped_list_type)
         return mapped_list_type
 
     def map_relationship_type(self, relationship_type):
@@ -496,28 +581,24 @@ class JinjaFilters:
         Map a relationship type to the corresponding Java type.
         """
         mapped_relationship_type = cfg.RELATIONSHIP_TYPE_MAPPING.get(relationship_type)
-        logging.debug(f'Mapping relationship type "{relationship_type}" to "{mapped_relationship_type}"')
+        logger.debug('Mapping relationship type "%s" to "%s"', relationship_type, mapped_relationship_type)
         return mapped_relationship_type
     
-    def mapped_by(self, property):
+    def mapped_by(self, property, model):
         """
         Return the mapped-by property for a given property.
+        The rendered model is passed explicitly, since the entity may be defined in an imported grammar file.
         """
-        logging.debug(f'Getting mapped-by property for property "{property.name}"')
+        logger.debug('Getting mapped-by property for property "%s"', property.name)
         current_entity = property.parent
-        model = current_entity.parent
-        for entity in model.entities:
-            if entity.name != property.property_type.name:
-                continue
-            for relationship in entity.relationships:
-                if relationship.property_type.name == current_entity.name:
-                    return relationship.name
+        relationship = model.model_index.get_relationship(property.property_type.name, current_entity.name)
+        return relationship.name if relationship else None
 
     def get_default_value(self, property):
         """
         Return the default value for a given property.
         """
-        logging.debug(f'Getting default value for property "{property.name}"')
+        logger.debug('Getting default value for property "%s"', property.name)
         property_type = property.property_type
         list_type = property.list_type
         property_type_class = property_type.__class__.__name__
@@ -546,6 +627,109 @@ class JinjaFilters:
             property_type_obj = property.property_type
             property_type_class = property_type_obj.__class__.__name__
             if not property.constant and property_type_class != 'IDType':
-                logging.debug(f'Adding property "{property.name}" to constructor properties')
+                logger.debug('Adding property "%s" to constructor properties', property.name)
                 constructor_properties.append(property)
         return constructor_properties
+
+
+def get_java_type_key(type_object):
+    """
+    Get the hashable key (type category, type value) which determines the Java type of the given type object.
+    """
+    if isinstance(type_object, gc.IDType):
+        return 'IDType', type_object.type
+    elif isinstance(type_object, gc.OtherDataType):
+        return 'OtherDataType', type_object.type
+    elif isinstance(type_object, gc.DateType):
+        return 'DateType', type_object.type
+    elif isinstance(type_object, gc.ListType):
+        return 'ListType', type_object.type
+    elif type(type_object).__name__ == 'Entity':
+        return 'Entity', type_object.name
+    elif type(type_object).__name__ == 'ListMethodType':
+        if type(type_object.method_type).__name__ == 'Entity':
+            return 'Entity', type_object.method_type.name
+        return 'ListMethodType', type_object.method_type.type
+    return None, type_object.type
+
+
+@lru_cache(maxsize=cfg.FILTER_CACHE_SIZE)
+def map_java_type(type_category, type_value):
+    """
+    Map the given type category and type value to Java type.
+    """
+    if type_category == 'IDType':
+        return {
+            cfg.ID: cfg.LONG.capitalize(),
+            cfg.IDENTIFIER: cfg.LONG.capitalize(),
+            cfg.UNIQUE_ID: cfg.LONG.capitalize(),
+            cfg.KEY: cfg.LONG.capitalize(),
+            cfg.PRIMARY_KEY: cfg.LONG.capitalize(),
+        }.get(type_value, type_value)
+    
+    elif type_category == 'OtherDataType':
+        return {
+            cfg.STR: cfg.STRING.capitalize(),
+            cfg.STRING: cfg.STRING.capitalize(),
+            cfg.STRING_C: cfg.STRING.capitalize(),
+        }.get(type_value, type_value)
+    
+    elif type_category == 'DateType':
+        return {
+            cfg.DATE: cfg.MAP_JAVA_TYPES[cfg.DATE],
+            cfg.TIME: cfg.MAP_JAVA_TYPES[cfg.TIME],
+            cfg.DATETIME: cfg.MAP_JAVA_TYPES[cfg.DATETIME],
+        }.get(type_value, type_value)
+    
+    elif type_category == 'ListType':
+        return {
+            cfg.ARRAY: cfg.MAP_JAVA_TYPES[cfg.ARRAY],
+            cfg.LINKED: cfg.MAP_JAVA_TYPES[cfg.LINKED],
+            cfg.HASHMAP: cfg.MAP_JAVA_TYPES[cfg.HASHMAP],
+            cfg.HASHSET: cfg.MAP_JAVA_TYPES[cfg.HASHSET],
+            cfg.TREEMAP: cfg.MAP_JAVA_TYPES[cfg.TREEMAP],
+            cfg.LIST: cfg.LIST.capitalize(),
+        }.get(type_value, type_value)
+    
+    elif type_category == 'ListMethodType':
+        return {
+            cfg.BYTE: cfg.BYTE_W,
+            cfg.SHORT: cfg.SHORT_W,
+            cfg.CHAR: cfg.CHARACTER_W,
+            cfg.INT: cfg.INTEGER_W,
+            cfg.FLOAT: cfg.FLOAT_W,
+            cfg.LONG: cfg.LONG_W,
+            cfg.DOUBLE: cfg.DOUBLE_W,
+            cfg.BOOLEAN: cfg.BOOLEAN_W,
+            cfg.STR: cfg.STRING.capitalize(),
+            cfg.STRING: cfg.STRING.capitalize(),
+            cfg.STRING_C: cfg.STRING.capitalize(),
+        }.get(type_value, type_value)
+    
+    return type_value  # Entity names and other data types are used as they are
+
+
+def get_filter_caches():
+    """
+    Get the memoized functions backing the pure Jinja filters.
+    """
+    return [utils.pluralize_word, utils.uppercase_first_letter, utils.lowercase_first_letter, map_java_type]
+
+
+def get_filter_cache_info():
+    """
+    Get the hits, misses and size of every memoized Jinja filter function.
+    The filters are pure, so the caches are kept for the whole process and shared by concurrent generate runs.
+    """
+    return {function.__name__: function.cache_info() for function in get_filter_caches()}
+
+
+def get_filter_cache_usage(previous_cache_info):
+    """
+    Get the hits and misses of every memoized Jinja filter function since the given cache info, and the current cache size.
+    """
+    cache_usage = dict()
+    for function_name, cache_info in get_filter_cache_info().items():
+        previous_info = previous_cache_info[function_name]
+        cache_usage[function_name] = {'hits': cache_info.hits - previous_info.hits, 'misses': cache_info.misses - previous_info.misses, 'size': cache_info.currsize}
+    return cache_usage
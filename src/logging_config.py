@@ -1,5 +1,8 @@
+import atexit
 import logging
 import logging.config
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 
 # Define the logging configuration
@@ -24,15 +27,58 @@ log_config = {
             "level": "INFO",
         },
     },
+    # Per-subsystem levels, so the render and validate hot paths can be silenced independently
+    "loggers": {
+        "src.jinja": {"level": "INFO"},  # Template rendering and Jinja filters
+        "src.textx_grammar": {"level": "INFO"},  # Parsing and semantic checks
+        "src.utils": {"level": "INFO"},  # Path, file and regex helpers
+        "src.java_formatter": {"level": "INFO"},  # Google Java Format batches and format cache
+        "src.generation_manifest": {"level": "INFO"},  # Incremental generation manifest
+        "src.export_cache": {"level": "INFO"},  # Skip-if-unchanged export cache
+        "src.model_index": {"level": "INFO"},  # Model entity and relationship index
+        "src.model_partition": {"level": "INFO"},  # Partitioned model export
+        "src.plantuml_worker": {"level": "INFO"},  # Long-running PlantUML renderer
+    },
     "root": {
         "handlers": ["console", "file"],
         "level": "INFO",
     },
 }
 
+queue_listener = None  # Writes the queued log records to the configured handlers in a background thread
+
 def setup_logging():
     """
     Configure the logging module using the defined configuration.
     """
     logging.config.dictConfig(log_config)
+    start_queue_listener()
     logging.debug("Logging configuration set")
+
+def start_queue_listener():
+    """
+    Move the root handlers behind a queue, so logging calls do not block on console and file I/O.
+    """
+    global queue_listener
+    if queue_listener:
+        stop_queue_listener()
+    else:
+        atexit.register(stop_queue_listener)
+
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    log_queue = SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_listener.start()
+
+def stop_queue_listener():
+    """
+    Write the remaining queued log records and stop the queue listener.
+    """
+    global queue_listener
+    if queue_listener:
+        queue_listener.stop()
+        queue_listener = None
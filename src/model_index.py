@@ -0,0 +1,187 @@
+import logging
+from weakref import WeakKeyDictionary
+
+from textx import TextXSemanticError, get_children, get_model, textx_isinstance
+from textx.scoping.tools import get_parser
+
+
+logger = logging.getLogger(__name__)
+
+
+class ModelIndex:
+    """
+    Class for indexing the model entities and their relationships.
+    The index is built once after parsing, so lookups used by the semantic checks and Jinja filters are O(1).
+    """
+    def __init__(self, model):
+        """
+        Constructor for the ModelIndex class.
+        """
+        self.entities = dict()  # Entity name -> entity
+        self.duplicate_entities = list()  # Entities whose name is already used by a previous entity
+        self.relationships = dict()  # (entity name, related entity name) -> relationship property of the entity
+        self.build(model)
+
+    def build(self, model):
+        """
+        Build the index from the given model in a single traversal of its entities.
+        """
+        logger.debug('Building model index')
+        for entity in model.entities:
+            if entity.name in self.entities:
+                self.duplicate_entities.append(entity)
+            else:
+                self.entities[entity.name] = entity
+            for property in entity.relationships:
+                self.relationships.setdefault((entity.name, property.property_type.name), property)
+        logger.debug('Model index built with %s entities and %s relationships', len(self.entities), len(self.relationships))
+
+    def get_entity(self, entity_name):
+        """
+        Get the entity with the given name.
+        """
+        return self.entities.get(entity_name)
+
+    def get_relationship(self, entity_name, related_entity_name):
+        """
+        Get the relationship property of the entity which points to the related entity (the inverse side of a relationship).
+        """
+        return self.relationships.get((entity_name, related_entity_name))
+
+
+class EntityIndex:
+    """
+    Class for indexing the properties, constructors and methods of an entity in a single traversal.
+    Duplicates are recorded while indexing, so the uniqueness checks do not rescan the entity.
+    """
+    def __init__(self, entity):
+        """
+        Constructor for the EntityIndex class.
+        """
+        self.properties = dict()  # Property name -> first property with that name
+        self.property_ids = set()  # Identities of the entity properties, used for the constructor property checks
+        self.duplicate_properties = list()
+        self.id_properties = list()  # Primary key properties
+        self.relationships = list()  # Properties with a relationship
+        self.constructors = dict()  # Constructor name (signature) -> first constructor with that name
+        self.duplicate_constructors = list()  # (constructor, constructor name)
+        self.empty_constructor_count = 0
+        self.default_constructor_count = 0
+        self.methods = dict()  # Method signature -> first method with that signature
+        self.duplicate_methods = list()  # (method, method types)
+        self.build(entity)
+
+    def build(self, entity):
+        """
+        Build the index from the given entity.
+        """
+        logger.debug('Building index for entity "%s"', entity.name)
+        for property in entity.properties:
+            self.property_ids.add(id(property))
+            if property.name in self.properties:
+                self.duplicate_properties.append(property)
+            else:
+                self.properties[property.name] = property
+            if property.property_type.is_primary_key:
+                self.id_properties.append(property)
+            if property.relationship:
+                self.relationships.append(property)
+
+        for constructor in entity.constructors:
+            self.empty_constructor_count += 1 if constructor.empty_constructor else 0
+            self.default_constructor_count += 1 if constructor.default_constructor else 0
+            constructor_name = get_constructor_name(constructor)
+            if constructor_name in self.constructors:
+                self.duplicate_constructors.append((constructor, constructor_name))
+            else:
+                self.constructors[constructor_name] = constructor
+
+        for method in entity.methods:
+            if method.method_properties is None:
+                continue
+            method_types = get_method_types(method)
+            method_signature = (method.name, method_types)
+            if method_signature in self.methods:
+                self.duplicate_methods.append((method, method_types))
+            else:
+                self.methods[method_signature] = method
+
+
+def get_constructor_name(constructor):
+    """
+    Creates a constructor name from the provided constructor object.
+    """
+    logger.debug('Creating constructor name from the provided constructor')
+    if constructor.default_constructor:
+        # A default constructor contains all non-constant properties from the class
+        constructor.property_list = [property for property in constructor.parent.properties if not property.constant]
+        return "default"
+    elif constructor.empty_constructor:
+        return "empty"
+    elif constructor.property_list:
+        constructor_property_names = ', '.join(property.name for property in constructor.property_list)
+        return f"[{constructor_property_names}]"
+    else:
+        return None
+
+
+def get_method_types(method):
+    """
+    Get the comma separated property types of the method, used together with the method name as the method signature.
+    """
+    method_types_obj = []
+    for property in method.method_properties.property_list:
+        if property.__class__.__name__ == 'Entity':
+            type_value = property.name
+        elif not property.property_type.__class__.__name__ == 'Entity':
+            type_value = property.property_type.type
+        else:
+            type_value = property.property_type.name
+        method_types_obj.append(type_value)
+
+    # Sort properties alphabetically by name for consistent comparison
+    method_types_obj.sort(key=lambda x: x[0])
+    return ', '.join(type for type in method_types_obj)
+
+
+class NameIndexScopeProvider:
+    """
+    Class for resolving the model references by their plain name, with the same semantics as the default textX provider.
+    The default provider searches the whole model for every reference, which makes the reference resolution quadratic.
+    This provider indexes the named model objects once per model, so every reference is resolved with a dictionary lookup.
+    """
+    def __init__(self):
+        """
+        Constructor for the NameIndexScopeProvider class.
+        """
+        self.name_indexes = WeakKeyDictionary()  # Model -> name index of the model (see get_name_index)
+
+    def __call__(self, obj, attr, obj_ref):
+        """
+        Resolve the given reference. Returns None if no model object matches, so textX falls back to the builtins.
+        Raise a TextXSemanticError if more than one model object matches.
+        """
+        if obj_ref is None:
+            return None
+        model = get_model(obj)
+        name_index = self.name_indexes.get(model)
+        if name_index is None:
+            name_index = get_name_index(model)
+            self.name_indexes[model] = name_index
+
+        matching_objects = [named_object for named_object in name_index.get(obj_ref.obj_name, []) if textx_isinstance(named_object, obj_ref.cls)]
+        if len(matching_objects) > 1:
+            line, col = get_parser(obj).pos_to_linecol(obj_ref.position)
+            raise TextXSemanticError(f'name {obj_ref.obj_name} is not unique.', line=line, col=col, filename=model._tx_filename)
+        return matching_objects[0] if matching_objects else None
+
+
+def get_name_index(model):
+    """
+    Get the named objects of the model grouped by their name, in model (containment) order.
+    """
+    logger.debug('Building name index for reference resolution')
+    name_index = dict()
+    for named_object in get_children(lambda model_object: hasattr(model_object, 'name'), model):
+        name_index.setdefault(named_object.name, []).append(named_object)
+    return name_index
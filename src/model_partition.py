@@ -0,0 +1,196 @@
+import logging
+import re
+from itertools import count
+
+from textx.const import MULT_ONE, MULT_ONEORMORE, MULT_ZEROORMORE
+from textx.export import HEADER, PRIMITIVE_PYTHON_TYPES, dot_escape, dot_repr
+
+import src.config as cfg
+
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCluster:
+    """
+    Class for a cluster of model entities which is exported as its own diagram.
+    """
+    def __init__(self, name, entities, file_name):
+        """
+        Constructor for the ModelCluster class.
+        """
+        self.name = name
+        self.entities = entities
+        self.file_name = file_name  # e.g. 'model_cluster_1.dot', unique within the exported clusters (see get_cluster_file_name)
+
+
+def get_cluster_file_name(cluster_name, used_file_names):
+    """
+    Get the dot file name of the cluster, which is not used by another cluster or the index diagram.
+    Names are compared case-insensitively, since the export folder may be on a case-insensitive file system.
+    The file name is added to the used file names.
+    """
+    base_name = re.sub(r'\W', '_', cluster_name)
+    file_name = cfg.MODEL_CLUSTER_FILE_NAME % base_name
+    suffix = 2
+    while file_name.lower() in used_file_names:
+        file_name = cfg.MODEL_CLUSTER_FILE_NAME % f'{base_name}_{suffix}'
+        suffix += 1
+    used_file_names.add(file_name.lower())
+    return file_name
+
+
+def get_model_clusters(entities, entity_groups):
+    """
+    Partition the model entities into clusters, in model order.
+    Every configured entity group is one cluster, the remaining entities are partitioned into the connected components of the relationship graph.
+    Small components (e.g. entities without relationships) are packed together, up to MODEL_CLUSTER_MAX_ENTITIES entities per cluster.
+    """
+    entity_group_names = {entity_name: group_name for group_name, entity_names in entity_groups.items() for entity_name in entity_names}
+    grouped_entities = {group_name: list() for group_name in entity_groups}
+    component_roots = dict()  # Entity name -> parent entity name in the union-find forest of the ungrouped entities
+
+    def get_component_root(entity_name):
+        while component_roots[entity_name] != entity_name:
+            component_roots[entity_name] = component_roots[component_roots[entity_name]]  # Path halving
+            entity_name = component_roots[entity_name]
+        return entity_name
+
+    for entity in entities:
+        if entity.name in entity_group_names:
+            grouped_entities[entity_group_names[entity.name]].append(entity)
+        else:
+            component_roots.setdefault(entity.name, entity.name)
+    for entity in entities:
+        if entity.name not in component_roots:
+            continue
+        for property in entity.relationships:
+            related_entity_name = property.property_type.name
+            if related_entity_name in component_roots:
+                component_roots[get_component_root(related_entity_name)] = get_component_root(entity.name)
+
+    components = dict()  # Component root -> entities, in the order of the first entity of each component
+    for entity in entities:
+        if entity.name in component_roots:
+            components.setdefault(get_component_root(entity.name), []).append(entity)
+
+    clusters = list()
+    used_file_names = {cfg.MODEL_INDEX_NAME.lower()}  # The index diagram is exported to the same folder
+    for group_name, group_entities in grouped_entities.items():
+        if not group_entities:
+            logger.warning('None of the entities of the "%s" export group exist in the model', group_name)
+            continue
+        clusters.append(ModelCluster(group_name, group_entities, get_cluster_file_name(group_name, used_file_names)))
+    packed_components = list()
+    for component_entities in components.values():
+        if packed_components and len(packed_components[-1]) + len(component_entities) <= cfg.MODEL_CLUSTER_MAX_ENTITIES:
+            packed_components[-1].extend(component_entities)
+        else:
+            packed_components.append(list(component_entities))
+    component_names = (cfg.MODEL_COMPONENT_NAME % index for index in count(start=1))
+    for component_entities in packed_components:
+        # Component names used as export group names are skipped, since the cluster names identify the clusters
+        component_name = next(component_name for component_name in component_names if component_name not in entity_groups)
+        clusters.append(ModelCluster(component_name, component_entities, get_cluster_file_name(component_name, used_file_names)))
+    logger.debug('Model partitioned into %s cluster(s)', len(clusters))
+    return clusters
+
+
+def get_entity_cluster_names(clusters):
+    """
+    Get the name of the cluster of every entity.
+    """
+    return {entity.name: cluster.name for cluster in clusters for entity in cluster.entities}
+
+
+def export_cluster_to_file(f, cluster, entity_cluster_names):
+    """
+    Export the entities of the cluster (and all objects they contain) to the file in the textX model dot format.
+    Entities of other clusters are exported as dashed nodes without their content, so every cluster diagram is laid out on its own.
+    Nodes are numbered in export order (textX uses object ids), so the same cluster always produces the same dot content.
+    Names are escaped like the other label values (see textX dot_repr), so they cannot break the record labels.
+    """
+    node_ids = dict()  # Object id -> node id
+    exported_objects = set()
+
+    def get_node_id(obj):
+        return node_ids.setdefault(id(obj), len(node_ids) + 1)
+
+    def export_object(obj):
+        if obj is None or id(obj) in exported_objects or type(obj) in PRIMITIVE_PYTHON_TYPES:
+            return
+        exported_objects.add(id(obj))
+
+        obj_cls = obj.__class__
+        if obj_cls.__name__ == 'Entity' and entity_cluster_names.get(obj.name) != cluster.name:
+            f.write(f'{get_node_id(obj)}[label="{{{dot_escape(obj.name)}:Entity|{dot_escape(entity_cluster_names.get(obj.name, ""))}\\l}}" style="filled,dashed"]\n')
+            return
+
+        attrs = ''
+        name = ''
+        for attr_name, attr in getattr(obj_cls, '_tx_attrs', {}).items():
+            attr_value = getattr(obj, attr_name)
+            if attr_value is None:
+                continue
+            endmark = 'arrowtail=diamond dir=both' if attr.cont else ''
+            required = '+' if attr.mult in [MULT_ONE, MULT_ONEORMORE] else ''
+
+            if attr.mult in [MULT_ONEORMORE, MULT_ZEROORMORE]:
+                if all(type(list_obj) in PRIMITIVE_PYTHON_TYPES for list_obj in attr_value):
+                    attrs += f'{required}{attr_name}:list=[{",".join(dot_repr(list_obj) for list_obj in attr_value)}]\\l'
+                    continue
+                for index, list_obj in enumerate(attr_value):
+                    if list_obj is None:
+                        continue
+                    if type(list_obj) in PRIMITIVE_PYTHON_TYPES:
+                        f.write(f'{get_node_id(obj)} -> "{dot_escape(str(list_obj))}:{type(list_obj).__name__}" [label="{attr_name}:{index}" {endmark}]\n')
+                    else:
+                        f.write(f'{get_node_id(obj)} -> {get_node_id(list_obj)} [label="{attr_name}:{index}" {endmark}]\n')
+                        export_object(list_obj)
+            elif type(attr_value) in PRIMITIVE_PYTHON_TYPES:
+                if attr_name == 'name':
+                    name = attr_value
+                else:
+                    attr_value = dot_repr(attr_value) if isinstance(attr_value, str) else attr_value
+                    attrs += f'{required}{attr_name}:{type(attr_value).__name__}={attr_value}\\l'
+            else:
+                f.write(f'{get_node_id(obj)} -> {get_node_id(attr_value)} [label="{attr_name}" {endmark}]\n')
+                export_object(attr_value)
+
+        f.write(f'{get_node_id(obj)}[label="{{{dot_escape(name)}:{obj_cls.__name__}|{attrs}}}"]\n')
+
+    f.write(HEADER)
+    for entity in cluster.entities:
+        export_object(entity)
+    f.write('\n}\n')
+
+
+def export_index_to_file(f, clusters, entity_cluster_names, image_format):
+    """
+    Export the index diagram of the partitioned model to the file in the dot format.
+    Every cluster is a node linking to the cluster diagram rendered in the given image format,
+    and the edges count the relationships between the entities of different clusters.
+    NOTE: The links work only if the index diagram itself is rendered as SVG (see MODEL_INDEX_IMAGE_FORMAT).
+    """
+    f.write(HEADER)
+    cluster_node_ids = {cluster.name: index for index, cluster in enumerate(clusters, start=1)}
+    for cluster in clusters:
+        entity_names = [entity.name for entity in cluster.entities[:cfg.MODEL_INDEX_MAX_ENTITY_NAMES]]
+        if len(cluster.entities) > cfg.MODEL_INDEX_MAX_ENTITY_NAMES:
+            entity_names.append(f'... ({len(cluster.entities) - cfg.MODEL_INDEX_MAX_ENTITY_NAMES} more)')
+        entity_list = ''.join(f'{dot_escape(entity_name)}\\l' for entity_name in entity_names)
+        image_file_name = f'{cluster.file_name}.{image_format}'
+        label = f'{{{dot_escape(cluster.name)} ({len(cluster.entities)} entities)|{entity_list}|{image_file_name}\\l}}'
+        f.write(f'{cluster_node_ids[cluster.name]}[label="{label}" URL="{image_file_name}"]\n')
+
+    cluster_relationships = dict()  # (cluster name, related cluster name) -> number of relationships
+    for cluster in clusters:
+        for entity in cluster.entities:
+            for property in entity.relationships:
+                related_cluster_name = entity_cluster_names.get(property.property_type.name)
+                if related_cluster_name is not None and related_cluster_name != cluster.name:
+                    relationship_key = (cluster.name, related_cluster_name)
+                    cluster_relationships[relationship_key] = cluster_relationships.get(relationship_key, 0) + 1
+    for (cluster_name, related_cluster_name), relationship_count in cluster_relationships.items():
+        f.write(f'{cluster_node_ids[cluster_name]} -> {cluster_node_ids[related_cluster_name]} [label="{relationship_count}"]\n')
+    f.write('\n}\n')
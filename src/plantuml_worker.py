@@ -0,0 +1,116 @@
+import atexit
+import logging
+import queue
+import subprocess
+import threading
+
+import src.config as cfg
+import src.utils as utils
+
+
+logger = logging.getLogger(__name__)
+
+
+class PlantUmlWorker:
+    """
+    Class for rendering PlantUML diagrams to PNG images with one long-running PlantUML process.
+    The process is started on the first render and fed the diagrams over its standard input ('-pipe' mode),
+    so the JVM startup is paid once per session instead of once per export.
+    """
+    plantuml_jar_path = None  # Resolved once per process and reused by every export
+    process = None  # Running PlantUML process, started on the first render
+    output_chunks = None  # Chunks of the process standard output, read by a background thread (None marks the end of the output)
+    pending_output = b''  # Output received after the delimiter of the previous image
+    lock = threading.Lock()  # The process renders one diagram at a time
+    exit_handler_registered = False
+
+    @classmethod
+    def get_plantuml_jar_path(cls):
+        """
+        Find the PlantUML jar file in the resources folder (see utils.find_resource_jar).
+        """
+        if cls.plantuml_jar_path is None:
+            cls.plantuml_jar_path = utils.find_resource_jar(cfg.PLANTUML_JAR_PREFIX)
+        return cls.plantuml_jar_path
+
+    @classmethod
+    def render(cls, plantuml_content):
+        """
+        Render the PlantUML diagram to a PNG image using the running PlantUML process.
+        Returns None if the process failed or did not return a PNG image, so the caller can fall back to a separate PlantUML process.
+        """
+        with cls.lock:
+            try:
+                if cls.process is None or cls.process.poll() is not None:
+                    cls.start(cls.get_plantuml_jar_path())
+                cls.process.stdin.write(f'{plantuml_content.rstrip()}\n'.encode('utf-8'))
+                cls.process.stdin.flush()
+                image = cls.read_image()
+            except (OSError, EOFError, queue.Empty) as e:
+                logger.warning('PlantUML worker failed (%s). Rendering with a separate PlantUML process', str(e) or 'timeout')
+                cls.stop()
+                return None
+        if not image.startswith(cfg.PNG_SIGNATURE):
+            logger.warning('PlantUML worker did not return a PNG image. Rendering with a separate PlantUML process')
+            return None
+        return image
+
+    @classmethod
+    def start(cls, plantuml_jar_path):
+        """
+        Start the PlantUML process in the pipe mode and the thread which reads its output.
+        """
+        logger.info('Starting PlantUML worker')
+        command = ['java', '-Djava.awt.headless=true', '-jar', str(plantuml_jar_path), '-pipe', '-tpng', '-pipedelimitor', cfg.PLANTUML_PIPE_DELIMITER]
+        cls.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        cls.output_chunks = queue.Queue()
+        cls.pending_output = b''
+        threading.Thread(target=cls.read_output, args=(cls.process, cls.output_chunks), daemon=True).start()
+        if not cls.exit_handler_registered:
+            atexit.register(cls.stop)
+            cls.exit_handler_registered = True
+
+    @staticmethod
+    def read_output(process, output_chunks):
+        """
+        Read the standard output of the PlantUML process until it exits.
+        Reading in a separate thread lets the renders time out without platform specific non-blocking reads.
+        """
+        while True:
+            chunk = process.stdout.read1(cfg.PLANTUML_PIPE_CHUNK_SIZE)
+            if not chunk:
+                output_chunks.put(None)
+                return
+            output_chunks.put(chunk)
+
+    @classmethod
+    def read_image(cls):
+        """
+        Read the next image from the process output, up to the delimiter written after every image.
+        """
+        delimiter = cfg.PLANTUML_PIPE_DELIMITER.encode('utf-8')
+        output = cls.pending_output
+        while delimiter not in output:
+            chunk = cls.output_chunks.get(timeout=cfg.PLANTUML_WORKER_TIMEOUT)
+            if chunk is None:
+                raise EOFError('PlantUML process exited')
+            output += chunk
+        image, _, cls.pending_output = output.partition(delimiter)
+        # The delimiter is written on its own line, so the line break after it precedes the next image
+        return image.lstrip(b'\r\n')
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop the PlantUML process.
+        """
+        if cls.process is None:
+            return
+        logger.debug('Stopping PlantUML worker')
+        process = cls.process
+        cls.process = None
+        try:
+            process.stdin.close()
+            process.wait(timeout=cfg.PLANTUML_WORKER_STOP_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
@@ -3,9 +3,6 @@ import subprocess
 import time
 import webbrowser
 
-import pygetwindow as gw
-import psutil
-
 import src.config as cfg
 
 
@@ -37,6 +34,7 @@ class RunGeneratedProject:
         """
         Check if the specified port is in use.
         """
+        import psutil  # Imported on first use to keep the application startup fast
         logging.debug(f'Checking if port {self.port} is in use')
         for conn in psutil.net_connections(kind='inet'):
             if conn.laddr.port == self.port:
@@ -49,6 +47,7 @@ class RunGeneratedProject:
         """
         Kill the process using the specified port.
         """
+        import psutil  # Imported on first use to keep the application startup fast
         logging.debug(f'Killing the process using port {self.port}')
         for proc in psutil.process_iter(['pid', 'name']):
             for conn in proc.connections(kind='inet'):
@@ -63,6 +62,7 @@ class RunGeneratedProject:
         Returns a Response object with the status and message.
         """
         try:
+            import pygetwindow as gw  # Imported on first use to keep the application startup fast
             logging.info('Starting to run the generated project...')
             if self.is_port_in_use():
                 self.kill_process_using_port()
@@ -1,26 +1,44 @@
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+from io import StringIO
+from os import cpu_count, listdir
+from os.path import abspath, splitext
 
-import pydot
 from textx import TextXSyntaxError, TextXSemanticError, metamodel_from_file, get_location
-from textx.export import PlantUmlRenderer, metamodel_export, model_export
+from textx import __version__ as textx_version
+from textx.scoping.providers import ImportURI
 
 import src.config as cfg
 import src.error_handler as eh
 import src.grammar_classes as gc
 import src.utils as utils
-from src.jinja import Jinja as jinja
+from src.export_cache import ExportCache
+from src.jinja import Jinja
+from src.model_index import EntityIndex, ModelIndex, NameIndexScopeProvider, get_constructor_name
+from src.plantuml_worker import PlantUmlWorker
+
+
+logger = logging.getLogger(__name__)
+
+# TextXGrammar instance whose model is being parsed, used by the object processors registered on the shared metamodel
+current_textx_grammar = ContextVar('current_textx_grammar')
 
 
 class Response:
     """
     Class for creating the response object from a functions.
     """
-    def __init__(self, status, error=None, error_msg=None, near_part=None, found_part=None, error_class=None):
+    def __init__(self, status, error=None, error_msg=None, near_part=None, found_part=None, error_class=None, message=None, errors=None):
         """
         Constructor for the Response class.
         """
         self.status = status
+        self.message = message
+        self.errors = errors or list()  # Responses of all collected semantic errors
         self.error = error
         self.error_msg = error_msg
         self.near_part = near_part
@@ -47,20 +65,42 @@ class SemanticError(TextXSemanticError):
     Class representing a semantic error in TextX.
     Inherits from TextXSemanticError.
     """
-    def __init__(self, message, line=None, col=None, err_type=None, expected_obj_cls=None, filename=None, search_value=None):
+    def __init__(self, message, line=None, col=None, err_type=None, expected_obj_cls=None, filename=None, search_value=None, nchar=None):
         """
         Constructor for the SemanticError class.
+        The nchar location value (returned by get_location in newer textX versions) is not used.
         """
-        super().__init__(message, line, col, err_type, filename)
+        # Keyword arguments, since the positional parameters of TextXSemanticError differ between textX versions
+        super().__init__(message, line=line, col=col, err_type=err_type, filename=filename)
         self.expected_obj_cls = expected_obj_cls
         self.search_value = search_value
 
 
+class SemanticErrors(Exception):
+    """
+    Class representing all semantic errors collected in a single validation pass.
+    """
+    def __init__(self, errors, main_file_path=None):
+        """
+        Constructor for the SemanticErrors class.
+        The errors of the main grammar file are sorted before the errors of the imported grammar files.
+        """
+        super().__init__(f'{len(errors)} semantic error(s) found')
+        self.errors = sorted(errors, key=lambda error: (is_imported_file_error(error, main_file_path), error.line or 0, error.col or 0))
+
+
 class TextXGrammar:
     """
     Class for handling all kind of work regarding textX grammar files, such as
     generating the metamodel and model, exporting the dot and PlantUML files, doing syntax and semantic checks etc.
+    Every instance carries the state of its own generation, so several projects can be generated concurrently.
+    The metamodel and the parsed models are shared by all instances of the process.
     """
+    metamodel_cache = dict()  # Grammar file hash -> metamodel, built once per process and reused by every generate run
+    model_file_hashes = dict()  # Grammar file path -> content hash of the file when its model was cached in the model repository
+    model_repository_contexts = dict()  # Main grammar file path -> project path and database driver its cached model was validated for
+    parse_lock = threading.Lock()  # Serializes the access to the shared metamodel and model repository (parsing is CPU bound anyway)
+
     def __init__(self):
         """
         Constructor for the TextXGrammar class.
@@ -69,391 +109,827 @@ class TextXGrammar:
         self.model = None
         self.project_path = None
         self.database_driver = None
+        self.main_model_path = None  # Absolute path of the grammar file used for generation (the other grammar files are imported)
+        self.semantic_errors = list()  # Semantic errors collected during the current parse (see cfg.COLLECT_ALL_SEMANTIC_ERRORS)
+        self.invalid_property_ids = set()  # Identities of the properties which failed a semantic check during the current parse
+        self.export_cache = None  # Fingerprints of the rendered diagrams, loaded for every export
 
     def set_metamodel(self, metamodel):
         """
         Set the metamodel.
         """
-        logging.debug('Setting metamodel')
+        logger.debug('Setting metamodel')
         self.metamodel = metamodel
 
     def set_model(self, model):
         """
         Set the model.
         """
-        logging.debug('Setting model')
+        logger.debug('Setting model')
         self.model = model
 
     def set_project_path(self, project_path):
         """
         Set the project path.
         """
-        logging.debug(f'Setting project path variable to "{project_path}"')
+        logger.debug('Setting project path variable to "%s"', project_path)
         self.project_path = project_path
 
     def set_database_driver(self, database_driver):
         """
         Set the database driver.
         """
-        logging.debug(f'Setting database driver variable to "{database_driver}"')
+        logger.debug('Setting database driver variable to "%s"', database_driver)
         self.database_driver = database_driver
 
-    @classmethod
     def generate(self, project_path, grammar_file_name, database_driver) -> Response:
         """
         Generate the metamodel and model from the given project path and grammar file name.
         """
         try:
-            logging.info('Generating metamodel and model')
+            logger.info('Generating metamodel and model')
             utils.folder_exists(cfg.GRAMMAR_FOLDER)
-            self.set_project_path(self, project_path)
-            self.set_database_driver(self, database_driver)
+            self.set_project_path(project_path)
+            self.set_database_driver(database_driver)
             project_grammar_folder_path = utils.get_path(self.project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.GRAMMAR_FOLDER)
             current_grammar_folder_path = utils.get_path(utils.get_current_path(), cfg.GRAMMAR_FOLDER)
             utils.file_exists(current_grammar_folder_path, cfg.GRAMMAR_FILE)
             utils.file_exists(project_grammar_folder_path, grammar_file_name)
             file_path = utils.get_path(project_grammar_folder_path, grammar_file_name)
-            metamodel = self.get_metamodel(self, utils.get_path(cfg.GRAMMAR_FOLDER, cfg.GRAMMAR_FILE))
-            model = self.get_model(metamodel, file_path, grammar_file_name)
-            self.set_metamodel(self, metamodel)
-            self.set_model(self, model)
-            logging.info('Metamodel and model generated successfully')
-            jinja.generate(model, self.project_path)
-            return Response(status=cfg.OK)
+            with self.parse_lock:
+                metamodel = self.get_metamodel(utils.get_path(cfg.GRAMMAR_FOLDER, cfg.GRAMMAR_FILE))
+                model = self.get_model(metamodel, file_path, grammar_file_name)
+            self.set_metamodel(metamodel)
+            self.set_model(model)
+            logger.info('Metamodel and model generated successfully')
+            file_counts = Jinja().generate(model, self.project_path)
+            message = f'{file_counts[cfg.WRITTEN]} file(s) written, {file_counts[cfg.UNCHANGED]} unchanged, {file_counts[cfg.DELETED]} deleted'
+            return Response(status=cfg.OK, message=message)
         except TextXSyntaxError as e:
             error_msg, near_part, found_part = utils.create_syntax_error_message(e)
+            error_msg = error_msg.replace(f'at position ({e.line},{e.col})', self.get_error_position(e), 1)
             return Response(status=cfg.ERROR, error=e, error_msg=error_msg, near_part=near_part, found_part=found_part, error_class='TextXSyntaxError')
+        except SemanticErrors as e:
+            responses = [self.get_semantic_error_response(error) for error in e.errors]
+            first_response = responses[0]
+            error_msg = first_response.error_msg
+            if len(responses) > 1:
+                error_msg = cfg.MULTIPLE_SEMANTIC_ERRORS % (error_msg, len(responses) - 1)
+            return Response(status=cfg.ERROR, error=first_response.error, error_msg=error_msg, error_class=first_response.error_class, errors=responses)
         except (SemanticError, TextXSemanticError) as e:
-            error_msg = f'at position ({str(e.line)},{str(e.col)}): {str(e.message)}'
-            error_class = type(e).__name__
-
-            # Determine if the error is due to an unknown object
-            if e.err_type == 'Unknown object':
-                e.search_value = utils.get_unknown_object_name(e)
-                error_msg = cfg.UNKNOWN_OBJECT_ERROR % (error_msg, e.search_value)
-                return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
-            
-            # Determine if the error is due to an is not unique object
-            if str(e.message).endswith('is not unique.'):
-                property_name = utils.get_is_not_unique_name(e)
-                error_explanation = cfg.IS_NOT_UNIQUE_ERROR % (property_name)
-                error_msg = f'at position ({str(e.line)},{str(e.col)}): {error_explanation}'
-                return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
-
-            return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
+            return self.get_semantic_error_response(e)
+        except eh.JavaNotFoundError as e:
+            return Response(status=cfg.ERROR, error=e, error_msg=e.message, error_class='JavaNotFoundError')
         except subprocess.CalledProcessError as e:
             jinja_error = utils.extract_jinja_subprocess_output(e.stderr)
             error_msg = f'Error while formatting Jinja template: {jinja_error}'
-            logging.error(error_msg)
+            logger.error(error_msg)
             return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class='CalledProcessError')
         except Exception as e:
             error_msg = f'{str(e)}'
-            logging.error(error_msg)
+            logger.error(error_msg)
             return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class='Exception')
 
-    @classmethod
+    def get_semantic_error_response(self, e):
+        """
+        Create the error response for the given semantic error.
+        """
+        error_position = self.get_error_position(e)
+        error_msg = f'{error_position}: {str(e.message)}'
+        error_class = type(e).__name__
+
+        # Determine if the error is due to an unknown object
+        if e.err_type == 'Unknown object':
+            e.search_value = utils.get_unknown_object_name(e)
+            error_msg = cfg.UNKNOWN_OBJECT_ERROR % (error_msg, e.search_value)
+            # Imported grammar files are parsed on their own, so they cannot refer to classes of the importing grammar file
+            if is_imported_file_error(e, self.main_model_path):
+                error_msg = f'{error_msg} {cfg.IMPORTED_UNKNOWN_OBJECT_ERROR}'
+            return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
+        
+        # Determine if the error is due to an is not unique object
+        if str(e.message).endswith('is not unique.'):
+            property_name = utils.get_is_not_unique_name(e)
+            error_explanation = cfg.IS_NOT_UNIQUE_ERROR % (property_name)
+            error_msg = f'{error_position}: {error_explanation}'
+            return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
+
+        return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class=error_class)
+
+    def get_error_position(self, e):
+        """
+        Get the position of the error, including the grammar file name if the error is in an imported grammar file.
+        """
+        error_position = f'at position ({str(e.line)},{str(e.col)})'
+        if is_imported_file_error(e, self.main_model_path):
+            error_position = f'in "{utils.get_base_name(e.filename)}" {error_position}'
+        return error_position
+
     def export(self) -> Response:
         """
         Export the metamodel and model files to specified paths using different (dot and PlantUML) tools.
+        The export jobs are dominated by the external Graphviz and Java processes, so they run concurrently.
         NOTE: PlantUML output is not yet available for model files.
         """
         try:
-            metamodel_export_response = self.export_metamodel(self)
-            model_export_response = self.export_model(self)
-            
-            # Return 'WARNING' if either metamodel or model export failed with warnings
-            if metamodel_export_response == cfg.WARNING or model_export_response == cfg.WARNING:
-                logging.info('Export completed successfully with warnings')
+            self.create_export_folders()
+            self.export_cache = ExportCache(self.project_path)
+            export_jobs = [self.export_metamodel_dot, self.export_metamodel_plantuml, *self.get_model_export_jobs()]
+            export_responses = self.run_export_jobs(export_jobs)
+            self.export_cache.save()
+
+            # Return 'WARNING' if any export job finished with warnings
+            if cfg.WARNING in export_responses:
+                logger.info('Export completed successfully with warnings')
                 return Response(status=cfg.WARNING)
             
-            # Return 'OK' if both metamodel and model export succeeded
-            logging.info('Export completed successfully')
+            # Return 'OK' if all export jobs succeeded
+            logger.info('Export completed successfully')
             return Response(status=cfg.OK)
         except Exception as e:
             error_msg = f'Failed to export the textX grammar metamodel and/or model: {str(e)}'
-            logging.error(error_msg)
+            logger.error(error_msg)
             return Response(status=cfg.ERROR, error=e, error_msg=error_msg, error_class='Exception')
 
+    @staticmethod
+    def run_export_jobs(export_jobs):
+        """
+        Run the export jobs on a bounded worker pool and return their statuses in the job order.
+        Every job runs to completion, then the error of the first failing job (in job order) is raised.
+        """
+        workers = max(1, min(cfg.EXPORT_WORKERS or cpu_count() or 1, len(export_jobs)))
+        logger.debug('Running %s export job(s) using %s worker(s)', len(export_jobs), workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(export_job) for export_job in export_jobs]
+        return [future.result() for future in futures]
+
     def get_metamodel(self, grammar_path):
         """
         Get the metamodel from the given grammar file path.
+        The metamodel is cached by the hash of the grammar file, so the grammar is compiled again only when it changes.
+        """
+        # The processing mode is part of the key, since the object processors are registered only in the per-object mode
+        grammar_hash = (utils.get_content_hash(utils.read_file(grammar_path)), cfg.BATCH_MODEL_PROCESSING)
+        metamodel = self.metamodel_cache.get(grammar_hash)
+        if metamodel is not None:
+            logger.info('Grammar file did not change, reusing the cached metamodel')
+            return metamodel
+        metamodel = self.create_metamodel(grammar_path)
+        self.metamodel_cache.clear()  # Keep only the metamodel of the current grammar
+        self.model_file_hashes.clear()  # Cached models belong to the model repository of the previous metamodel
+        self.model_repository_contexts.clear()
+        self.metamodel_cache[grammar_hash] = metamodel
+        return metamodel
+
+    def create_metamodel(self, grammar_path):
+        """
+        Create the metamodel from the given grammar file path and register the object processors.
         """
-        logging.info(f'Getting metamodel from textX file')
+        logger.info('Getting metamodel from textX file')
         type_builtins = gc.get_type_builtins()
         # Generate the metamodel from the textX grammar file
+        # The global repository caches the model of every parsed grammar file (see get_model)
         metamodel = metamodel_from_file(grammar_path, 
                                         classes=[gc.IDType, gc.PrimitiveDataType, gc.WrapperDataType, gc.OtherDataType, gc.DateType, gc.ListType],
-                                        builtins=type_builtins)
+                                        builtins=type_builtins,
+                                        global_repository=True)
 
         # Raise an exception if the metamodel is not generated
         if metamodel is None:
             raise eh.MetamodelCreationError('Failed to generate metamodel from textX grammar file!')
         
+        # Resolve references against a name index instead of searching the whole model for every reference
+        # The references are resolved in the current grammar file first and then in the imported grammar files
+        metamodel.register_scope_providers({'*.*': ImportURI(NameIndexScopeProvider())})
+
+        # In the batch mode textX only builds the model, which is then processed in a single pass (see batch_model_processor)
+        if cfg.BATCH_MODEL_PROCESSING:
+            logger.info('Metamodel generated')
+            return metamodel
+
         # Register object processors to validate (or alter) the object being constructed
+        # The metamodel is shared by all instances, so the processors dispatch to the instance whose model is being parsed
         metamodel.register_obj_processors({
-            'EntityModel': lambda model: self.model_processor(self, model),
-            'Database': lambda database: self.database_processor(self, database),
-            'Entity': lambda entity: self.entity_processor(self, entity),
-            'Property': lambda property: self.property_processor(self, property),
-            'Constructor': lambda constructor: self.constructor_processor(self, constructor),
-            'Method': lambda method: self.method_processor(self, method),
+            'EntityModel': lambda model: current_textx_grammar.get().model_processor(model),
+            'Database': lambda database: current_textx_grammar.get().database_processor(database),
+            'Entity': lambda entity: current_textx_grammar.get().entity_processor(entity),
+            'Property': lambda property: current_textx_grammar.get().property_processor(property),
+            'Constructor': lambda constructor: current_textx_grammar.get().constructor_processor(constructor),
+            'Method': lambda method: current_textx_grammar.get().method_processor(method),
         })
 
-        logging.info('Metamodel generated')
+        logger.info('Metamodel generated')
         return metamodel
 
-    def get_model(metamodel, model_file_path, grammar_file_name):
+    def get_model(self, metamodel, model_file_path, grammar_file_name):
         """
         Get the model from the given metamodel and model file path.
-        """
-        logging.info(f'Getting model from file: "{grammar_file_name}"')
-        # Generate the model from the model file
-        model = metamodel.model_from_file(model_file_path)
+        The models of the main and imported grammar files are cached in the global model repository of the metamodel,
+        so only the changed grammar files (and the files importing them) are parsed and checked again.
+        """
+        self.set_main_model_path(abspath(model_file_path))
+        self.invalidate_model_repository(metamodel)
+        model_repository = metamodel._tx_model_repository.all_models
+        if model_repository.has_model(self.main_model_path):
+            logger.info('Grammar file "%s" and its imported grammar files did not change, reusing the cached model', grammar_file_name)
+            model = model_repository[self.main_model_path]
+            self.set_project_variables(model)  # Project files (e.g. the app file) may have changed since the model was cached
+            return model
+
+        logger.info('Getting model from file: "%s"', grammar_file_name)
+        # Generate the model from the model file (imported grammar files are loaded from the model repository or parsed)
+        self.semantic_errors.clear()
+        self.invalid_property_ids.clear()
+        model = None
+        current_textx_grammar_token = current_textx_grammar.set(self)
+        try:
+            model = metamodel.model_from_file(model_file_path)
+            if cfg.BATCH_MODEL_PROCESSING:
+                self.batch_model_processor(model)
+            # textX calls the object processors of the main model before the ones of the imported models
+            self.main_model_processor(model)
+            if self.semantic_errors:
+                raise SemanticErrors(self.semantic_errors, self.main_model_path)
+        except Exception:
+            # Models of invalid grammar files must not be reused (textX already removed the models of a failed parse)
+            self.evict_model_files(metamodel, [abspath(model._tx_filename) for model in get_imported_models(model)] if model is not None else [self.main_model_path])
+            raise
+        finally:
+            current_textx_grammar.reset(current_textx_grammar_token)
 
         # Raise an exception if the metamodel is not generated
         if model is None:
             raise eh.ModelCreationError('Failed to generate model from model file!')
         
-        logging.info('Model generated')
+        self.update_model_file_hashes(metamodel)
+        logger.info('Model generated')
         return model
+
+    def set_main_model_path(self, main_model_path):
+        """
+        Set the absolute path of the grammar file used for generation.
+        """
+        logger.debug('Setting main model path variable to "%s"', main_model_path)
+        self.main_model_path = main_model_path
+
+    def invalidate_model_repository(self, metamodel):
+        """
+        Remove the cached models of the changed grammar files, and of all grammar files importing them, from the model repository.
+        The cached main model is removed if the project path or database driver changed, since its database checks depend on them.
+        """
+        model_repository = metamodel._tx_model_repository.all_models
+        model_repository_context = (str(self.project_path), self.database_driver)
+        if self.model_repository_contexts.get(self.main_model_path) != model_repository_context:
+            self.evict_model_files(metamodel, [self.main_model_path])
+            self.model_repository_contexts[self.main_model_path] = model_repository_context
+
+        changed_files = [file_path for file_path, file_hash in self.model_file_hashes.items() if get_model_file_hash(file_path) != file_hash]
+        importing_files = get_importing_files(model_repository)
+        invalid_files = set()
+        while changed_files:
+            file_path = changed_files.pop()
+            if file_path in invalid_files:
+                continue
+            invalid_files.add(file_path)
+            changed_files.extend(importing_files.get(file_path, []))
+
+        for file_path in invalid_files:
+            logger.info('Grammar file "%s" changed, it will be parsed again', utils.get_base_name(file_path))
+        self.evict_model_files(metamodel, invalid_files)
+
+    def evict_model_files(self, metamodel, file_paths):
+        """
+        Remove the cached models of the given grammar files from the model repository.
+        """
+        model_repository = metamodel._tx_model_repository.all_models
+        for file_path in file_paths:
+            logger.debug('Removing the cached model of grammar file "%s"', file_path)
+            model_repository.filename_to_model.pop(file_path, None)
+            self.model_file_hashes.pop(file_path, None)
+
+    def update_model_file_hashes(self, metamodel):
+        """
+        Store the content hashes of all grammar files whose models are cached in the model repository.
+        """
+        for file_path in metamodel._tx_model_repository.all_models.filename_to_model:
+            if file_path not in self.model_file_hashes:
+                self.model_file_hashes[file_path] = get_model_file_hash(file_path)
     
-    def export_metamodel(self):
-        """
-        Export the metamodel files to specified path using the 'dot' and 'PlantUML' tools.
-        """
-        has_warning = False
-        export_folders = [cfg.EXPORT_DOT_FOLDER, cfg.EXPORT_PLANTUML_FOLDER]
-        for folder in export_folders:
-            export_folder = utils.get_path(cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, folder)  # e.g. 'export/dot'
-            utils.create_folder(self.project_path, export_folder)
-            metamodel_path = utils.get_path(self.project_path, export_folder)
-            if folder == cfg.EXPORT_DOT_FOLDER:
-                # Export the metamodel using the 'dot' tool
-                logging.info('Exporting metamodel using dot tool')
-                metamodel_name = f'{cfg.METAMODEL_NAME}{cfg.DOT_FILE_EXTENSION}'
-                metamodel_export_path = utils.get_path(metamodel_path, metamodel_name)
-                metamodel_export(self.metamodel, metamodel_export_path)
-                result = self.execute_dot_cmd_command(metamodel_name, metamodel_path)
-            else:
-                # Export the metamodel using the 'PlantUML' tool
-                logging.info('Exporting metamodel using PlantUML tool')
-                metamodel_name = f'{cfg.METAMODEL_NAME}{cfg.PLANTUML_FILE_EXTENSION}'
-                metamodel_export_path = utils.get_path(metamodel_path, metamodel_name)
-                metamodel_export(self.metamodel, metamodel_export_path, renderer=PlantUmlRenderer())
-                result = self.execute_plantuml_cmd_command(metamodel_name, metamodel_path)
-            
-            # Set the flag if the export has warnings
-            if result == cfg.WARNING:
-                has_warning = True
-        
-        # Return 'WARNING' if export succeeded with warnings else 'OK'
-        return cfg.WARNING if has_warning else cfg.OK
+    def create_export_folders(self):
+        """
+        Create the export folders (e.g. 'export/dot') in the project folder.
+        """
+        for folder in [cfg.EXPORT_DOT_FOLDER, cfg.EXPORT_PLANTUML_FOLDER]:
+            utils.create_folder(self.project_path, utils.get_path(cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, folder))
+
+    def export_metamodel_dot(self):
+        """
+        Export the metamodel files to specified path using the 'dot' tool.
+        """
+        from textx.export import metamodel_export_tofile  # Exporters are imported on first export to keep the startup fast
+        logger.info('Exporting metamodel using dot tool')
+        metamodel_path = utils.get_path(self.project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, cfg.EXPORT_DOT_FOLDER)
+        metamodel_name = f'{cfg.METAMODEL_NAME}{cfg.DOT_FILE_EXTENSION}'
+        dot_content = StringIO()
+        metamodel_export_tofile(self.metamodel, dot_content)
+        return self.export_dot_content(dot_content.getvalue(), metamodel_name, metamodel_path, self.get_export_fingerprint_values())
+
+    def export_metamodel_plantuml(self):
+        """
+        Export the metamodel files to specified path using the 'PlantUML' tool.
+        """
+        from textx.export import PlantUmlRenderer, metamodel_export_tofile  # Exporters are imported on first export to keep the startup fast
+        logger.info('Exporting metamodel using PlantUML tool')
+        metamodel_path = utils.get_path(self.project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, cfg.EXPORT_PLANTUML_FOLDER)
+        metamodel_name = f'{cfg.METAMODEL_NAME}{cfg.PLANTUML_FILE_EXTENSION}'
+        metamodel_export_path = utils.get_path(metamodel_path, metamodel_name)
+        plantuml_content = StringIO()
+        metamodel_export_tofile(self.metamodel, plantuml_content, renderer=PlantUmlRenderer())
+
+        def render_plantuml_content():
+            utils.write_to_file(metamodel_export_path, plantuml_content.getvalue())
+            return self.execute_plantuml_cmd_command(metamodel_name, metamodel_path)
+
+        # PlantUML replaces the file extension of the rendered file (e.g. 'metamodel.pu' -> 'metamodel.png')
+        image_path = utils.get_path(metamodel_path, f'{cfg.METAMODEL_NAME}{cfg.PNG_FILE_EXTENSION}')
+        return self.run_cached_export(metamodel_name, [metamodel_export_path, image_path], self.get_export_fingerprint_values(), render_plantuml_content)
 
     def export_model(self):
         """
         Export the model files to specified path using the 'dot' tool (PlantUML output is not yet available for model files).
         """
-        logging.info('Exporting model using dot tool')
+        from textx.export import model_export_to_file  # Exporters are imported on first export to keep the startup fast
+        logger.info('Exporting model using dot tool')
         model_export_path = utils.get_path(self.project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, cfg.EXPORT_DOT_FOLDER)
-        model_path = utils.get_path(model_export_path, cfg.MODEL_NAME)
-        model_export(self.model, model_path)
-        result = self.execute_dot_cmd_command(cfg.MODEL_NAME, model_export_path)
+        dot_content = StringIO()
+        model_export_to_file(dot_content, self.model)
+        result = self.export_dot_content(dot_content.getvalue(), cfg.MODEL_NAME, model_export_path, self.get_export_fingerprint_values(self.model))
         return result
 
-    def execute_dot_cmd_command(file_name, folder_path):
+    def get_model_export_jobs(self):
+        """
+        Get the export jobs of the model diagram.
+        Graphviz layout is superlinear, so large models are exported as one diagram per cluster of related entities and an index diagram.
+        """
+        dot_path = utils.get_path(self.project_path, cfg.JSD_MBRS_GENERATOR_FOLDER, cfg.EXPORT_FOLDER, cfg.EXPORT_DOT_FOLDER)
+        clusters_path = utils.get_path(dot_path, cfg.EXPORT_MODEL_CLUSTERS_FOLDER)
+        if cfg.PARTITIONED_MODEL_EXPORT_MIN_ENTITIES is None or len(self.model.entities) < cfg.PARTITIONED_MODEL_EXPORT_MIN_ENTITIES:
+            # Diagrams of a previous partitioned export no longer match the model
+            if clusters_path.exists():
+                self.delete_stale_model_cluster_files(clusters_path, [])
+                utils.delete_empty_folder(clusters_path)
+            return [self.export_model]
+
+        # Diagram of a previous unpartitioned export no longer matches the model
+        for file_name in [cfg.MODEL_NAME, *[f'{cfg.MODEL_NAME}.{image_format}' for image_format in cfg.EXPORT_IMAGE_FORMATS]]:
+            if utils.delete_file(utils.get_path(dot_path, file_name)):
+                logger.debug('Deleted unpartitioned model export file "%s"', file_name)
+
+        from src.model_partition import get_entity_cluster_names, get_model_clusters  # Imported on first export to keep the startup fast
+        clusters = get_model_clusters(self.model.entities, cfg.EXPORT_ENTITY_GROUPS)
+        entity_cluster_names = get_entity_cluster_names(clusters)
+        logger.info('Exporting model with %s entities as %s partitioned diagram(s)', len(self.model.entities), len(clusters))
+        utils.create_folder(clusters_path.parent, clusters_path.name)
+        self.delete_stale_model_cluster_files(clusters_path, [cfg.MODEL_INDEX_NAME, *[cluster.file_name for cluster in clusters]])
+        export_jobs = [partial(self.export_model_cluster, cluster, entity_cluster_names, clusters_path) for cluster in clusters]
+        export_jobs.append(partial(self.export_model_index, clusters, entity_cluster_names, clusters_path))
+        return export_jobs
+
+    def export_model_cluster(self, cluster, entity_cluster_names, clusters_path):
+        """
+        Export the diagram of the model cluster using the 'dot' tool.
+        The cluster dot content is deterministic, so only the clusters whose content changed are rendered again.
+        """
+        from src.model_partition import export_cluster_to_file  # Imported on first export to keep the startup fast
+        logger.debug('Exporting model cluster "%s" with %s entities using dot tool', cluster.name, len(cluster.entities))
+        dot_content = StringIO()
+        export_cluster_to_file(dot_content, cluster, entity_cluster_names)
+        return self.export_dot_content(dot_content.getvalue(), cluster.file_name, clusters_path, [dot_content.getvalue()])
+
+    def export_model_index(self, clusters, entity_cluster_names, clusters_path):
+        """
+        Export the index diagram of the partitioned model (one node per cluster) using the 'dot' tool.
+        The index is always rendered as SVG, since the links to the cluster diagrams work only in SVG.
+        """
+        from src.model_partition import export_index_to_file  # Imported on first export to keep the startup fast
+        logger.info('Exporting model index diagram using dot tool')
+        dot_content = StringIO()
+        export_index_to_file(dot_content, clusters, entity_cluster_names, cfg.EXPORT_IMAGE_FORMAT)
+        return self.export_dot_content(dot_content.getvalue(), cfg.MODEL_INDEX_NAME, clusters_path, [dot_content.getvalue()], cfg.MODEL_INDEX_IMAGE_FORMAT)
+
+    @staticmethod
+    def delete_stale_model_cluster_files(clusters_path, cluster_file_names):
         """
-        Execute the dot command to convert the dot file to PNG format.
+        Delete the dot files and images of the clusters (and the index) which are not in the given dot file names (e.g. after the entities were regrouped).
+        """
+        current_file_names = set(cluster_file_names)
+        for file_name in listdir(clusters_path):
+            dot_file_name = file_name if file_name.endswith(cfg.DOT_FILE_EXTENSION) else splitext(file_name)[0]
+            if dot_file_name not in current_file_names:
+                logger.debug('Deleting stale model cluster file "%s"', file_name)
+                utils.delete_file(utils.get_path(clusters_path, file_name))
+
+    def export_dot_content(self, dot_content, file_name, folder_path, fingerprint_values, image_format=None):
+        """
+        Export the dot content to the dot file and render it, unless it was already rendered from the same inputs in the same image format.
+        The image format defaults to EXPORT_IMAGE_FORMAT.
+        """
+        image_format = image_format or cfg.EXPORT_IMAGE_FORMAT
+        output_paths = [utils.get_path(folder_path, file_name), utils.get_path(folder_path, f'{file_name}.{image_format}')]
+        return self.run_cached_export(file_name, output_paths, [image_format, *fingerprint_values], lambda: self.execute_dot_cmd_command(dot_content, file_name, folder_path, image_format))
+
+    def get_export_fingerprint_values(self, model=None):
         """
+        Get the values the exported diagram depends on: the textX version, the grammar file and (for the model diagram) the model grammar files.
+        The exported content cannot be used as the fingerprint, since the textX exporters name the diagram nodes by object ids.
+        """
+        fingerprint_values = [textx_version, get_model_file_hash(utils.get_path(cfg.GRAMMAR_FOLDER, cfg.GRAMMAR_FILE))]
+        if model is not None:
+            for file_path in sorted(abspath(imported_model._tx_filename) for imported_model in get_imported_models(model)):
+                # Hashes stored when the model was parsed, so a grammar file edited after the generation does not match the exported model
+                file_hash = self.model_file_hashes.get(file_path) or get_model_file_hash(file_path)
+                fingerprint_values.extend([file_path, file_hash])
+        return fingerprint_values
+
+    def run_cached_export(self, file_name, output_paths, fingerprint_values, render):
+        """
+        Run the render function of the exported file, unless its fingerprint matches the previous export and all its outputs still exist.
+        The fingerprint is stored only if the render succeeded, so failed or incomplete renders are retried on the next export.
+        """
+        fingerprint = utils.get_content_hash(*fingerprint_values)
+        if self.export_cache.is_unchanged(file_name, fingerprint, output_paths):
+            logger.info('"%s" did not change since the last export, reusing the rendered image', file_name)
+            return cfg.OK
+        result = render()
+        if result == cfg.OK:
+            self.export_cache.set(file_name, fingerprint)
+        return result
+
+    @staticmethod
+    def execute_dot_cmd_command(dot_content, file_name, folder_path, image_format=None):
+        """
+        Write the dot file and render it to an image by streaming the dot content to the Graphviz 'dot' command.
+        The image format is PNG or SVG (see EXPORT_IMAGE_FORMAT, SVG renders much faster for large models).
+        """
+        image_format = image_format or cfg.EXPORT_IMAGE_FORMAT
+        if image_format not in cfg.EXPORT_IMAGE_FORMATS:
+            raise ValueError(f'Unsupported export image format "{image_format}". Supported formats: {", ".join(cfg.EXPORT_IMAGE_FORMATS)}')
         try:
-            logging.info(f'Converting DOT file "{file_name}" to PNG')
-            dot_file_path = utils.get_path(folder_path, file_name)
-            graphs = pydot.graph_from_dot_file(dot_file_path)
-            if graphs:
-                graph = graphs[0]
-                png_file_name = f'{file_name}{cfg.PNG_FILE_EXTENSION}'
-                output_file_path = utils.get_path(folder_path, png_file_name)
-                graph.write_png(output_file_path)
-                logging.info(f'DOT file "{file_name}" converted to "{png_file_name}" successfully')
-                return cfg.OK
-            else:
-                logging.warning(f'No graphs found in "{dot_file_path}"')
+            logger.info('Converting DOT file "%s" to %s', file_name, image_format.upper())
+            utils.write_to_file(utils.get_path(folder_path, file_name), dot_content)
+            if not dot_content.strip():
+                logger.warning('No graphs found in "%s"', file_name)
                 return cfg.WARNING
+            image_file_name = f'{file_name}.{image_format}'
+            command = [cfg.DOT_COMMAND, f'-T{image_format}', '-o', str(utils.get_path(folder_path, image_file_name))]
+            subprocess.run(command, input=dot_content, check=True, capture_output=True, text=True)
+            logger.info('DOT file "%s" converted to "%s" successfully', file_name, image_file_name)
+            return cfg.OK
+        except subprocess.CalledProcessError as e:
+            error_message = str(e.stderr).replace('\n', '. ').rstrip('. ')
+            logger.error('Failed to convert DOT file "%s" to %s: %s', file_name, image_format.upper(), error_message)
+            raise
         except Exception as e:
-            logging.error(f'Failed to convert DOT file "{file_name}" to PNG: {str(e)}')
+            logger.error('Failed to convert DOT file "%s" to %s: %s', file_name, image_format.upper(), e)
             raise
 
+    @staticmethod
     def execute_plantuml_cmd_command(file_name, folder_path):
         """
-        Execute the PlantUML command to convert the PlantUML file to PNG format.
+        Convert the PlantUML file to PNG format.
+        The diagram is rendered by the long-running PlantUML worker, falling back to a separate PlantUML process if the worker fails.
         """
         try:
-            logging.info(f'Converting PlantUML file "{file_name}" to PNG')
-            utils.folder_exists(cfg.RESOURCES_FOLDER)
-
-            # Find the PlantUML jar file in the resources folder
-            plantuml_file_name = utils.find_specific_file_regex(cfg.RESOURCES_FOLDER, cfg.PLANTUML_REGEX)
-            if not plantuml_file_name:
-                logging.warning(f'No PlantUML jar file found in the "{cfg.RESOURCES_FOLDER}" folder')
+            logger.info('Converting PlantUML file "%s" to PNG', file_name)
+            plantuml_path = PlantUmlWorker.get_plantuml_jar_path()
+            if not plantuml_path:
                 return
-            elif len(plantuml_file_name) > 1:
-                logging.warning(f'More than one PlantUML jar file found in the "{cfg.RESOURCES_FOLDER}" folder. Using the newest one: {plantuml_file_name[0]}')
-            
-            current_directory = utils.get_current_path()
-            plantuml_path = utils.get_path(current_directory, cfg.RESOURCES_FOLDER, plantuml_file_name[0])
-            command = f'java -jar {plantuml_path} -Tpng {file_name}'
-            subprocess.run(command, shell=True, check=True, cwd=folder_path, capture_output=True, text=True)
-            png_file_name = f'{file_name}{cfg.PNG_FILE_EXTENSION}'
-            logging.info(f'PlantUML file "{file_name}" converted to "{png_file_name}" successfully')
+
+            # PlantUML replaces the file extension of the rendered file (e.g. 'metamodel.pu' -> 'metamodel.png')
+            png_file_name = f'{splitext(file_name)[0]}{cfg.PNG_FILE_EXTENSION}'
+            image = PlantUmlWorker.render(utils.read_file(utils.get_path(folder_path, file_name))) if cfg.PLANTUML_WORKER else None
+            if image is not None:
+                utils.write_binary_file(utils.get_path(folder_path, png_file_name), image)
+            else:
+                try:
+                    command = ['java', '-jar', str(plantuml_path), '-Tpng', file_name]
+                    subprocess.run(command, check=True, cwd=folder_path, capture_output=True, text=True)
+                except OSError as e:
+                    logger.warning('Failed to start PlantUML: %s', e)
+                    return cfg.WARNING
+            logger.info('PlantUML file "%s" converted to "%s" successfully', file_name, png_file_name)
             return cfg.OK
         except subprocess.CalledProcessError as e:
             error_message = str(e.stderr).replace('\n', '. ').rstrip('. ')
-            logging.warning(f'{error_message}')
+            logger.warning('%s', error_message)
             return cfg.WARNING
         except FileNotFoundError as e:
             raise
         except Exception as e:
-            logging.error(f'Failed to convert PlantUML file "{file_name}" to PNG: {str(e)}')
+            logger.error('Failed to convert PlantUML file "%s" to PNG: %s', file_name, e)
             raise
 
+    def run_semantic_check(self, check, *args):
+        """
+        Run the given semantic check and return True if it passed.
+        In the collect-all-errors mode the SemanticError is collected instead of raised, so the remaining checks still run.
+        """
+        try:
+            check(*args)
+            return True
+        except SemanticError as e:
+            if not cfg.COLLECT_ALL_SEMANTIC_ERRORS:
+                raise
+            self.semantic_errors.append(e)
+            return False
+
+    def run_semantic_checks(self, checks, *args):
+        """
+        Run the given semantic checks in order and return True if all of them passed.
+        The remaining checks are skipped once a check fails, since they may depend on the conditions of the failed check.
+        """
+        return all(self.run_semantic_check(check, *args) for check in checks)
+
     def model_processor(self, model):
         """
-        Perform semantic checks on the model.
+        Perform semantic checks on the model of each grammar file.
+        The main model is checked by main_model_processor, once the models of all imported grammar files are processed.
+        """
+        if abspath(model._tx_filename) != self.main_model_path:
+            logger.info('Starting semantic checks for imported grammar file "%s"', utils.get_base_name(model._tx_filename))
+            self.run_semantic_check(self.check_imported_model_database, model)
+
+    def main_model_processor(self, model):
+        """
+        Perform semantic checks on the main model, which also contains the entities of the imported grammar files.
         """
         class_name = model.__class__.__name__
-        logging.info(f'Setting variables for class "{class_name}"')
-        self.set_package_tree(self, model)
-        self.set_build_tool(self, model)
-        self.set_database_driver_flag(self, model)
-        self.set_project_name(self, model)
-        self.set_app_file_name(self, model)
-        logging.info(f'Successfully set variables for class "{class_name}"')
-        logging.info(f'Starting semantic checks for JSD-MBRS Generator "{class_name}"')
-        self.check_unique_class_names(model)
-        self.check_entity_relationships(self, model)
-        logging.info(f'Successfully finished semantic checks for JSD-MBRS Generator "{class_name}"')
+        logger.info('Setting variables for class "%s"', class_name)
+        self.set_imported_entities(model)
+        self.set_project_variables(model)
+        self.set_model_index(model)
+        logger.info('Successfully set variables for class "%s"', class_name)
+        logger.info('Starting semantic checks for JSD-MBRS Generator "%s"', class_name)
+        self.run_semantic_check(self.check_model_database, model)
+        self.run_semantic_check(self.check_model_entities, model)
+        self.run_semantic_check(self.check_unique_class_names, model)
+        for entity in model.entities:
+            for property in entity.relationships:
+                if id(property) in self.invalid_property_ids:
+                    continue  # The relationship of an invalid property is already reported by the property checks
+                self.run_semantic_check(self.check_entity_relationship, model, entity, property)
+        logger.info('Successfully finished semantic checks for JSD-MBRS Generator "%s"', class_name)
+
+    def batch_model_processor(self, model):
+        """
+        Process the models parsed by the current run in a single pass, instead of per object during the model construction.
+        The objects are grouped by type and each check runs over the whole group, in the order textX calls the object processors
+        (properties, constructors and methods before their class, classes and the database before the model).
+        The models of unchanged imported grammar files were already processed when they were cached.
+        """
+        parsed_models = [imported_model for imported_model in get_imported_models(model) if abspath(imported_model._tx_filename) not in self.model_file_hashes]
+        entities = [entity for parsed_model in parsed_models for entity in parsed_model.entities]
+        properties = [property for entity in entities for property in entity.properties]
+        constructors = [constructor for entity in entities for constructor in entity.constructors]
+        methods = [method for entity in entities for method in entity.methods]
+        databases = [parsed_model.database for parsed_model in parsed_models if parsed_model.database is not None]
+        logger.info('Processing %s model(s) with %s classes, %s properties, %s constructors and %s methods',
+                    len(parsed_models), len(entities), len(properties), len(constructors), len(methods))
+
+        for property in properties:
+            self.set_primary_key_flag_to_entity_property(property)
+        valid_properties = self.run_batch_semantic_checks(properties, [
+            self.check_property_name,
+            self.check_id_property_value,
+            self.check_id_property_encapsulation,
+            self.check_entity_property,
+            self.check_property_relationship,
+            self.check_list_type_and_relationship,
+            self.check_property_type_and_list_type,
+            self.check_constant_and_value,
+            self.check_constant_and_encapsulation,
+            self.check_value_of_constant_property,
+            self.check_value_of_list_elements,
+        ])
+        self.invalid_property_ids.update(id(property) for property in properties)
+        for property in valid_properties:
+            self.invalid_property_ids.discard(id(property))
+            self.update_property_value(property)  # The property value is updated only for valid properties
+
+        for constructor in constructors:
+            get_constructor_name(constructor)  # Sets the property list of the default constructors
+        self.run_batch_semantic_checks(constructors, [self.check_constructor_unique_properties, self.check_constructor_constant_property])
+        self.run_batch_semantic_checks(methods, [self.check_method_name, self.check_method_type_in_list_type])
+
+        for entity in entities:
+            self.set_entity_index(entity)
+            self.set_entity_id_property_value(entity)
+            self.set_entity_relationships(entity)
+        self.run_batch_semantic_checks(entities, [
+            self.check_class_name,
+            self.check_unique_property_names,
+            self.check_id_property,
+            self.check_empty_and_default_constructor,
+            self.check_properties_inside_constructors,
+            self.check_unique_constructors,
+            self.check_unique_methods,
+        ])
+
+        for database in databases:
+            self.database_processor(database)
+        for parsed_model in parsed_models:
+            self.model_processor(parsed_model)
+        logger.info('Successfully processed %s model(s)', len(parsed_models))
+
+    def run_batch_semantic_checks(self, model_objects, checks):
+        """
+        Run every semantic check over all given model objects of the same type.
+        The remaining checks of a model object are skipped once one of its checks fails (see run_semantic_checks).
+        Returns the model objects which passed all checks.
+        """
+        valid_objects = model_objects
+        for check in checks:
+            valid_objects = [model_object for model_object in valid_objects if self.run_semantic_check(check, model_object)]
+        return valid_objects
 
     def database_processor(self, database):
         """
         Perform semantic checks on the database.
         """
-        logging.info(f'Starting semantic checks for the database parameters')
-        self.check_database_name(database)
-        self.check_database_driver(self, database)
-        self.check_database_username(database)
-        self.check_database_password(database)
-        logging.info(f'Successfully finished semantic checks for the database parameters')
+        if abspath(database.parent._tx_filename) != self.main_model_path:
+            return  # Database of an imported grammar file is reported by check_imported_model_database
+        logger.info('Starting semantic checks for the database parameters')
+        self.run_semantic_check(self.check_database_name, database)
+        self.run_semantic_check(self.check_database_driver, database)
+        self.run_semantic_check(self.check_database_username, database)
+        self.run_semantic_check(self.check_database_password, database)
+        logger.info('Successfully finished semantic checks for the database parameters')
 
     def entity_processor(self, entity):
         """
         Perform semantic checks on each class in the model.
         """
-        logging.info(f'Setting variables for class "{entity.name}"')
+        logger.info('Setting variables for class "%s"', entity.name)
+        self.set_entity_index(entity)
         self.set_entity_id_property_value(entity)
         self.set_entity_relationships(entity)
-        logging.info(f'Successfully set variables for class "{entity.name}"')
-        logging.info(f'Starting semantic checks for class "{entity.name}"')
-        self.check_class_name(entity)
-        self.check_unique_property_names(entity)
-        self.check_id_property(entity)
-        self.check_empty_and_default_constructor(self, entity)
-        self.check_properties_inside_constructors(entity),
-        self.check_unique_constructors(self, entity)
-        self.check_unique_methods(self, entity)
-        logging.info(f'Successfully finished semantic checks for class "{entity.name}"')
+        logger.info('Successfully set variables for class "%s"', entity.name)
+        logger.info('Starting semantic checks for class "%s"', entity.name)
+        self.run_semantic_checks([
+            self.check_class_name,
+            self.check_unique_property_names,
+            self.check_id_property,
+            self.check_empty_and_default_constructor,
+            self.check_properties_inside_constructors,
+            self.check_unique_constructors,
+            self.check_unique_methods,
+        ], entity)
+        logger.info('Successfully finished semantic checks for class "%s"', entity.name)
 
     def property_processor(self, property):
         """
         Perform semantic checks on each property in the model.
         """
-        logging.info(f'Setting variables for property "{property.name}"')
+        logger.info('Setting variables for property "%s"', property.name)
         self.set_primary_key_flag_to_entity_property(property)
-        logging.info(f'Successfully set variables for property "{property.name}"')
-        logging.info(f'Starting semantic checks for property "{property.name}"')
-        self.check_property_name(property)
-        self.check_id_property_value(property)
-        self.check_id_property_encapsulation(property)
-        self.check_entity_property(property)
-        self.check_property_relationship(property)
-        self.check_list_type_and_relationship(property)
-        self.check_property_type_and_list_type(property)
-        self.check_constant_and_value(property)
-        self.check_constant_and_encapsulation(property)
-        self.check_value_of_constant_property(property)
-        self.check_value_of_list_elements(property)
-        logging.info(f'Successfully finished semantic checks for property "{property.name}"')
-        logging.info(f'Updating property value for property "{property.name}"')
+        logger.info('Successfully set variables for property "%s"', property.name)
+        logger.info('Starting semantic checks for property "%s"', property.name)
+        checks_passed = self.run_semantic_checks([
+            self.check_property_name,
+            self.check_id_property_value,
+            self.check_id_property_encapsulation,
+            self.check_entity_property,
+            self.check_property_relationship,
+            self.check_list_type_and_relationship,
+            self.check_property_type_and_list_type,
+            self.check_constant_and_value,
+            self.check_constant_and_encapsulation,
+            self.check_value_of_constant_property,
+            self.check_value_of_list_elements,
+        ], property)
+        logger.info('Successfully finished semantic checks for property "%s"', property.name)
+        if not checks_passed:
+            self.invalid_property_ids.add(id(property))
+            return  # The property value is updated only for valid properties (see the collect-all-errors mode)
+        logger.info('Updating property value for property "%s"', property.name)
         self.update_property_value(property)
-        logging.info(f'Successfully updated property value for property "{property.name}"')
+        logger.info('Successfully updated property value for property "%s"', property.name)
 
     def constructor_processor(self, constructor):
         """
         Perform semantic checks on each constructor in the model.
         """
-        constructor_name = self.get_constructor_name(constructor)
-        logging.info(f'Starting semantic checks for "{constructor_name}" constructor')
-        self.check_constructor_unique_properties(constructor)
-        self.check_constructor_constant_property(constructor)
-        logging.info(f'Successfully finished semantic checks for constructor "{constructor_name}"')
+        constructor_name = get_constructor_name(constructor)
+        logger.info('Starting semantic checks for "%s" constructor', constructor_name)
+        self.run_semantic_checks([
+            self.check_constructor_unique_properties,
+            self.check_constructor_constant_property,
+        ], constructor)
+        logger.info('Successfully finished semantic checks for constructor "%s"', constructor_name)
 
     def method_processor(self, method):
         """
         Perform semantic checks on each method in the model.
         """
-        logging.info(f'Starting semantic checks for method "{method.name}"')
-        self.check_method_name(self, method)
-        self.check_method_type_in_list_type(method)
-        logging.info(f'Successfully finished semantic checks for method "{method.name}"')
+        logger.info('Starting semantic checks for method "%s"', method.name)
+        self.run_semantic_checks([
+            self.check_method_name,
+            self.check_method_type_in_list_type,
+        ], method)
+        logger.info('Successfully finished semantic checks for method "%s"', method.name)
 
     # MODEL SET FUNCTIONS
+    @staticmethod
+    def set_imported_entities(model):
+        """
+        Add the entities of the imported grammar files (and of the files they import) to the main model.
+        """
+        logger.debug('Adding entities of the imported grammar files to the JSD-MBRS model')
+        imported_entities = list()
+        visited_models = {id(model)}
+
+        def add_imported_entities(importing_model):
+            for model_import in importing_model.imports:
+                for imported_model in model_import._tx_loaded_models:
+                    if id(imported_model) in visited_models:
+                        continue
+                    visited_models.add(id(imported_model))
+                    add_imported_entities(imported_model)
+                    imported_entities.extend(imported_model.entities)
+
+        add_imported_entities(model)
+        model.entities = imported_entities + model.entities
+
+    def set_project_variables(self, model):
+        """
+        Set the model variables derived from the project (package tree, build tool, database driver flag, project and app file name).
+        """
+        self.set_package_tree(model)
+        self.set_build_tool(model)
+        self.set_database_driver_flag(model)
+        self.set_project_name(model)
+        self.set_app_file_name(model)
+
     def set_package_tree(self, model):
         """
         Create and add the package tree to the model.
         """
-        logging.debug('Finding package tree for JSD-MBRS model')
+        logger.debug('Finding package tree for JSD-MBRS model')
         java_folder = utils.get_path(self.project_path, cfg.PROJECT_JAVA_FOLDER)
         java_app_file_path = utils.find_java_app_file(java_folder)
         java_app_folder_path = java_app_file_path.parent
         package_tree = utils.get_import_package_tree(java_app_folder_path, cfg.PROJECT_JAVA_FOLDER)
-        logging.debug(f'Package tree for JSD-MBRS model: "{package_tree}"')
+        logger.debug('Package tree for JSD-MBRS model: "%s"', package_tree)
         model.package_tree = package_tree
 
     def set_build_tool(self, model):
         """
         Set the build tool to the model.
         """
-        logging.debug('Setting build tool for JSD-MBRS model')
+        logger.debug('Setting build tool for JSD-MBRS model')
         build_tool = utils.detect_build_tool(self.project_path)
         model.build_tool = build_tool
-        logging.debug(f'Build tool for JSD-MBRS model: "{build_tool}"')
+        logger.debug('Build tool for JSD-MBRS model: "%s"', build_tool)
 
     def set_database_driver_flag(self, model):
         """
         Set the database driver flag to the model used for indicating if the dependency should be added.
         """
-        logging.debug('Setting database driver flag for JSD-MBRS model')
+        logger.debug('Setting database driver flag for JSD-MBRS model')
+        if model.database is None:
+            return  # Reported by check_model_database
         grammar_database_driver = cfg.DATABASE_MAPPINGS[model.database.driver]['name']
         model.add_database_dependency = False if self.database_driver is not None and self.database_driver == grammar_database_driver else True
-        logging.debug(f'Add database driver for JSD-MBRS model: "{model.add_database_dependency}"')
+        logger.debug('Add database driver for JSD-MBRS model: "%s"', model.add_database_dependency)
 
     def set_project_name(self, model):
         """
         Set the project name to the model.
         """
-        logging.debug('Setting project name for JSD-MBRS model')
+        logger.debug('Setting project name for JSD-MBRS model')
         model.project_name = self.project_path.name
-        logging.debug(f'Project name for JSD-MBRS model: "{model.project_name}"')
+        logger.debug('Project name for JSD-MBRS model: "%s"', model.project_name)
 
     def set_app_file_name(self, model):
         """
         Set the app file name to the model.
         """
-        logging.debug('Setting app file name for JSD-MBRS model')
+        logger.debug('Setting app file name for JSD-MBRS model')
         java_folder = utils.get_path(self.project_path, cfg.PROJECT_JAVA_FOLDER)
         java_app_file_path = utils.find_java_app_file(java_folder)
         model.app_file_name = java_app_file_path.stem
-        logging.debug(f'App file name for JSD-MBRS model: "{java_app_file_path.name}"')
+        logger.debug('App file name for JSD-MBRS model: "%s"', java_app_file_path.name)
+
+    @staticmethod
+    def set_model_index(model):
+        """
+        Build the index of the model entities and relationships used for O(1) lookups.
+        """
+        logger.debug('Setting model index for JSD-MBRS model')
+        model.model_index = ModelIndex(model)
 
     # CONSTRUCTOR FUNCTIONS
+    @staticmethod
     def validate_entity_relationships(model, entity, property):
         """
         Validate the relationship between an entity and a property in the given model.
@@ -462,7 +938,7 @@ class TextXGrammar:
             """
             Validate the relationship type between two types.
             """
-            logging.debug(f'Validating relationship type "{first_type}" and "{second_type}"')
+            logger.debug('Validating relationship type "%s" and "%s"', first_type, second_type)
             is_valid_relationship_type = cfg.VALID_RELATIONSHIP_TYPE_MAPPING[first_type] != second_type
             return is_valid_relationship_type
         
@@ -470,8 +946,11 @@ class TextXGrammar:
         relationship_owner = property.relationship.owner
         relationship_type = property.relationship.type
 
-        matching_entity = next((e for e in model.entities if e.name == property_type_name), None)
-        matching_property = next((p for p in matching_entity.properties if p.property_type.name == entity.name), None)
+        matching_entity = model.model_index.get_entity(property_type_name)
+        if matching_entity is None:
+            logger.debug('Property "%s" is not of a class type, its relationship is checked by the property checks', property.name)
+            return ValidationResponse(cfg.OK)
+        matching_property = model.model_index.get_relationship(matching_entity.name, entity.name)
         if not matching_property:
             error_message = cfg.ENTITY_RELATIONSHIP_PROPERTY_ERROR % (property.property_type.name, entity.name)
             return ValidationResponse(cfg.ERROR, error_message, type=property.property_type, search_value=property_type_name)
@@ -490,37 +969,70 @@ class TextXGrammar:
             error_message = cfg.ENTITY_RELATIONSHIP_TYPE_ERROR % (entity.name, matching_property.relationship.type, property.property_type.name, relationship_type)
             return ValidationResponse(cfg.ERROR, error_message, type=property, search_value=search_value)
         
-        logging.debug('Entity relationship is valid')
+        logger.debug('Entity relationship is valid')
         return ValidationResponse(cfg.OK)
 
     # MODEL SEMANTIC CHECKS
+    @staticmethod
+    def check_model_database(model):
+        """
+        Check if the grammar file used for generation defines the database.
+        Raise a SemanticError if the database is not defined.
+        """
+        if model.database is None:
+            file_name = utils.get_base_name(model._tx_filename)
+            error_message = cfg.MISSING_DATABASE_ERROR % (file_name)
+            logger.error(error_message)
+            raise SemanticError(error_message, line=1, col=1, filename=model._tx_filename, search_value='Database', err_type='missing_database_error')
+
+    @staticmethod
+    def check_imported_model_database(model):
+        """
+        Check if the imported grammar file does not define the database.
+        Raise a SemanticError if the database is defined.
+        """
+        if model.database is not None:
+            file_name = utils.get_base_name(model._tx_filename)
+            error_message = cfg.IMPORTED_DATABASE_ERROR % (file_name)
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(model.database), search_value='Database', err_type='imported_database_error')
+
+    @staticmethod
+    def check_model_entities(model):
+        """
+        Check if the model (together with the imported grammar files) defines at least one class.
+        Raise a SemanticError if no class is defined.
+        """
+        if not model.entities:
+            file_name = utils.get_base_name(model._tx_filename)
+            error_message = cfg.NO_CLASSES_ERROR % (file_name)
+            logger.error(error_message)
+            raise SemanticError(error_message, line=1, col=1, filename=model._tx_filename, search_value='class', err_type='no_classes_error')
+
+    @staticmethod
     def check_unique_class_names(model):
         """
         Check if class names are unique.
         Raise a SemanticError if a class name is not unique.
         """
-        class_names = set()
-        for entity in model.entities:
-            if entity.name in class_names:
-                error_message = cfg.UNIQUE_CLASS_NAMES_ERROR % (entity.name)
-                logging.error(error_message)
-                raise SemanticError(error_message, **get_location(entity), search_value=entity.name, err_type='unique_class_names_error')
-            class_names.add(entity.name)
+        for entity in model.model_index.duplicate_entities:
+            error_message = cfg.UNIQUE_CLASS_NAMES_ERROR % (entity.name)
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(entity), search_value=entity.name, err_type='unique_class_names_error')
 
-    def check_entity_relationships(self, model):
+    def check_entity_relationship(self, model, entity, property):
         """
-        Check if the entity relationships are valid.
-        Raise a SemanticError if the entity relationships are invalid.
+        Check if the entity relationship of the property is valid.
+        Raise a SemanticError if the entity relationship is invalid.
         """
-        for entity in model.entities:
-            for property in entity.relationships:
-                response = self.validate_entity_relationships(model, entity, property)
-                if response.status == cfg.ERROR:
-                    error_message = response.message
-                    logging.error(error_message)
-                    raise SemanticError(error_message, **get_location(response.type), search_value=response.search_value, err_type='entity_relationships_error')
+        response = self.validate_entity_relationships(model, entity, property)
+        if response.status == cfg.ERROR:
+            error_message = response.message
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(response.type), search_value=response.search_value, err_type='entity_relationships_error')
 
     # DATABASE SEMANTIC CHECKS
+    @staticmethod
     def check_database_name(database):
         """
         Check if the database name is a valid SQL database name.
@@ -528,7 +1040,7 @@ class TextXGrammar:
         """
         if not utils.check_value_regex(cfg.SQL_DATABASE_NAME_REGEX, database.name):
             error_message = cfg.DATABASE_NAME_ERROR % (str(database.driver).capitalize(), database.name, cfg.SQL_DATABASE_NAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(database), search_value=database.name, err_type='database_name_error')
         
     def check_database_driver(self, database):
@@ -539,9 +1051,10 @@ class TextXGrammar:
         grammar_database_driver = cfg.DATABASE_MAPPINGS[database.driver]['name']
         if self.database_driver and grammar_database_driver is not self.database_driver:
             error_message = cfg.DATABASE_DRIVER_ERROR % (self.database_driver, grammar_database_driver)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(database), search_value=database.driver, err_type='database_driver_error')
 
+    @staticmethod
     def check_database_username(database):
         """
         Check if the database username (if provided) is a valid SQL database username.
@@ -549,9 +1062,10 @@ class TextXGrammar:
         """
         if database.credentials and not utils.check_value_regex(cfg.SQL_DATABASE_USERNAME_REGEX, database.credentials.username):
             error_message = cfg.DATABASE_USERNAME_ERROR % (str(database.driver).capitalize(), database.credentials.username, cfg.SQL_DATABASE_USERNAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(database), search_value=database.credentials.username, err_type='database_username_error')
         
+    @staticmethod
     def check_database_password(database):
         """
         Check if the database password (if provided) is a valid SQL database password.
@@ -559,32 +1073,38 @@ class TextXGrammar:
         """
         if database.credentials and not utils.check_value_regex(cfg.SQL_DATABASE_PASSWORD_REGEX, database.credentials.password):
             error_message = cfg.DATABASE_PASSWORD_ERROR % (str(database.driver).capitalize(), database.credentials.password, cfg.SQL_DATABASE_PASSWORD_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(database), search_value=database.credentials.password, err_type='database_password_error')
         
     # CLASS SET FUNCTIONS
+    @staticmethod
+    def set_entity_index(entity):
+        """
+        Build the index of the entity properties, constructors and methods used by the class semantic checks.
+        """
+        logger.debug('Setting index for entity "%s"', entity.name)
+        entity.entity_index = EntityIndex(entity)
+
+    @staticmethod
     def set_entity_id_property_value(entity):
         """
         Set the primary key property value for the entity.
         """
-        logging.debug(f'Setting primary key property value for entity "{entity.name}"')
-        for property in entity.properties:
-            if property.property_type.is_primary_key:
-                entity.id_property = property.name
-                break
+        logger.debug('Setting primary key property value for entity "%s"', entity.name)
+        id_properties = entity.entity_index.id_properties
+        if id_properties:
+            entity.id_property = id_properties[0].name
 
+    @staticmethod
     def set_entity_relationships(entity):
         """
         Set the relationships for the entity.
         """
-        logging.debug(f'Setting relationships for entity "{entity.name}"')
-        entity_relationships = list()
-        for property in entity.properties:
-            if property.relationship:
-                entity_relationships.append(property)
-        entity.relationships = entity_relationships
+        logger.debug('Setting relationships for entity "%s"', entity.name)
+        entity.relationships = list(entity.entity_index.relationships)
 
     # CLASS SEMANTIC CHECKS
+    @staticmethod
     def check_class_name(entity):
         """
         Check if the class name is a valid Java class name.
@@ -592,119 +1112,96 @@ class TextXGrammar:
         """
         if not utils.check_value_regex(cfg.JAVA_CLASS_NAME_REGEX, entity.name):
             error_message = cfg.CLASS_NAME_ERROR % (entity.name, cfg.JAVA_CLASS_NAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(entity), search_value=entity.name, err_type='class_name_error')
         
+    @staticmethod
     def check_unique_property_names(entity):
         """
         Check if property names are unique within a class.
         Raise a SemanticError if a property name is not unique.
         """
-        property_names = set()
-        for property in entity.properties:
-            if property.name in property_names:
-                error_message = cfg.UNIQUE_PROPERTY_NAMES_ERROR % (property.name, entity.name)
-                logging.error(error_message)
-                raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='unique_property_names_error')
-            property_names.add(property.name)
+        for property in entity.entity_index.duplicate_properties:
+            error_message = cfg.UNIQUE_PROPERTY_NAMES_ERROR % (property.name, entity.name)
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='unique_property_names_error')
 
+    @staticmethod
     def check_id_property(entity):
         """
         Check if the class has a primary key property and if it is unique'.
         Raise a SemanticError if the primary key property is not present or if it is not unique.
         """
-        id_type_count = 0
-        id_property_list = list()
-        for property in entity.properties:
-            if property.property_type.is_primary_key:
-                id_type_count += 1
-                id_property_list.append(property.name)
+        id_property_list = [property.name for property in entity.entity_index.id_properties]
+        id_type_count = len(id_property_list)
 
         if id_type_count == 0:
             error_message = cfg.NO_ID_PROPERTY_ERROR % (entity.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(entity), search_value=entity.name, err_type='no_id_property_error')
         elif id_type_count > 1:
             id_property_names = ', '.join(f'"{item}"' for item in id_property_list)
             error_message = cfg.MULTIPLE_ID_PROPERTIES_ERROR % (entity.name, id_property_names)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(entity), search_value=id_property_list, err_type='multiple_id_property_error')
         
-    def check_empty_and_default_constructor(self, entity):
+    @staticmethod
+    def check_empty_and_default_constructor(entity):
         """
         Check if the empty and default constructors are provided.
         Raise a SemanticError if the empty and default constructors are not provided.
         """
-        empty_constructors = [constructor for constructor in entity.constructors if constructor.empty_constructor]
-        default_constructors = [constructor for constructor in entity.constructors if constructor.default_constructor]
+        entity_index = entity.entity_index
         last_constructor = entity.constructors[-1]
-        last_constructor_name = self.get_constructor_name(last_constructor)
-        if len(empty_constructors) == 0:
+        last_constructor_name = get_constructor_name(last_constructor)
+        if entity_index.empty_constructor_count == 0:
             error_message = cfg.EMPTY_CONSTRUCTOR_ERROR % (entity.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(last_constructor), search_value=last_constructor_name, err_type='empty_constructor_error')
-        elif len(default_constructors) == 0:
+        elif entity_index.default_constructor_count == 0:
             error_message = cfg.DEFAULT_CONSTRUCTOR_ERROR % (entity.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(last_constructor), search_value=last_constructor_name, err_type='default_constructor_error')
         
+    @staticmethod
     def check_properties_inside_constructors(entity):
         """
         Check if the provided constructor properties are part of specific class.
         Raise a SemanticError if a constructor property is not part of the class.
         """
+        property_ids = entity.entity_index.property_ids
         for constructor in entity.constructors:
             for property in constructor.property_list:
-                if property not in entity.properties:
+                if id(property) not in property_ids:
                     error_message = cfg.CONSTRUCTOR_PROPERTY_ERROR % (property.name, entity.name)
-                    logging.error(error_message)
+                    logger.error(error_message)
                     raise SemanticError(error_message, **get_location(constructor), search_value=property.name, err_type='constructor_property_error')
         
-    def check_unique_constructors(self, entity):
+    @staticmethod
+    def check_unique_constructors(entity):
         """
         Check if the constructors are unique within a class.
         Raise a SemanticError if a constructor is not unique.
         """
-        constructors = set()
-        for constructor in entity.constructors:
-            constructor_name = self.get_constructor_name(constructor)
-            if constructor_name in constructors:
-                error_message = cfg.UNIQUE_CONSTRUCTORS_ERROR % (constructor_name, entity.name)
-                logging.error(error_message)
-                raise SemanticError(error_message, **get_location(constructor), search_value=constructor_name, err_type='unique_constructors_error')
-            constructors.add(constructor_name)
+        for constructor, constructor_name in entity.entity_index.duplicate_constructors:
+            error_message = cfg.UNIQUE_CONSTRUCTORS_ERROR % (constructor_name, entity.name)
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(constructor), search_value=constructor_name, err_type='unique_constructors_error')
 
-    def check_unique_methods(self, entity):
+    @staticmethod
+    def check_unique_methods(entity):
         """
         Check if the methods are unique within a class by checking method name and property types.
         Raise a SemanticError if a method is not unique.
         """
-        methods = set()
-        for method in entity.methods:
-            method_types_obj = []
-            if method.method_properties is None:
-                continue
-            for property in method.method_properties.property_list:
-                if property.__class__.__name__ == 'Entity':
-                    type_value = property.name
-                elif not property.property_type.__class__.__name__ == 'Entity':
-                    type_value = property.property_type.type
-                else:
-                    type_value = property.property_type.name
-                method_types_obj.append(type_value)
-
-            # Sort properties alphabetically by name for consistent comparison
-            method_types_obj.sort(key=lambda x: x[0])
-            method_types = ', '.join(type for type in method_types_obj)
-            method_name = f'{method.name}({method_types})' if method_types else method.name
-            if method_name in methods:
-                additional_text = f' with property types "({method_types})"' if method_types else ''
-                error_message = cfg.UNIQUE_METHODS_ERROR % (method.name, additional_text, entity.name)
-                logging.error(error_message)
-                raise SemanticError(error_message, **get_location(method), search_value=method.name, err_type='unique_methods_error')
-            methods.add(method_name)
+        for method, method_types in entity.entity_index.duplicate_methods:
+            additional_text = f' with property types "({method_types})"' if method_types else ''
+            error_message = cfg.UNIQUE_METHODS_ERROR % (method.name, additional_text, entity.name)
+            logger.error(error_message)
+            raise SemanticError(error_message, **get_location(method), search_value=method.name, err_type='unique_methods_error')
 
     # PROPERTY SET FUNCTIONS
+    @staticmethod
     def set_primary_key_flag_to_entity_property(property):
         """
         Set the primary key flag to the entity property.
@@ -714,6 +1211,7 @@ class TextXGrammar:
             property.property_type.is_primary_key = False
     
     # PROPERTY SEMANTIC CHECKS
+    @staticmethod
     def check_property_name(property):
         """
         Check if the property name is a valid Java variable name.
@@ -721,14 +1219,15 @@ class TextXGrammar:
         """
         if not utils.check_value_regex(cfg.JAVA_PROPERTY_AND_METHOD_NAME_REGEX, property.name):
             error_message = cfg.PROPERTY_NAME_ERROR % (property.name, cfg.JAVA_PROPERTY_AND_METHOD_NAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='property_name_error')
         
         if str(property.name).lower() == 'id':
             error_message = cfg.ID_PROPERTY_NAME_ERROR % (property.name, cfg.JAVA_PROPERTY_AND_METHOD_NAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='property_name_error')
         
+    @staticmethod
     def check_id_property_value(property):
         """
         Check if the primary key property is declared as constant.
@@ -738,9 +1237,10 @@ class TextXGrammar:
             search_values = [property.name, 'const', 'constant']
             search_values.extend(property.property_value.value) if property.property_value else None
             error_message = cfg.ID_PROPERTY_VALUE_ERROR % (property.name, property.property_type.type)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='id_property_value_error')
         
+    @staticmethod
     def check_id_property_encapsulation(property):
         """
         Check getter and setter methods for the primary key property.
@@ -749,14 +1249,15 @@ class TextXGrammar:
         if property.property_type.is_primary_key:
             if not property.encapsulation or not property.encapsulation.getter:
                 error_message = cfg.ID_PROPERTY_GETTER_ENCAPSULATION_ERROR % (property.name, property.property_type.type)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='id_property_encapsulation_error')
             elif property.encapsulation.setter:
                 search_values = [property.name, 'set', 'setter']
                 error_message = cfg.ID_PROPERTY_SETTER_ENCAPSULATION_ERROR % (property.name, property.property_type.type)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='id_property_encapsulation_error')
 
+    @staticmethod
     def check_entity_property(property):
         """
         Check if a class property is valid.
@@ -767,18 +1268,19 @@ class TextXGrammar:
             if property.constant:
                 search_values = [property.name, 'const', 'constant']
                 error_message = cfg.ENTITY_PROPERTY_CONSTANT_ERROR % (property.name, property.property_type.name, property_type_class)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='entity_property_error')
             elif property.property_value:
                 search_values = [property.name, property.property_value.value]
                 error_message = cfg.ENTITY_PROPERTY_VALUE_ERROR % (property.name, property.property_type.name)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='entity_property_error')
             elif not property.relationship:
                 error_message = cfg.ENTITY_PROPERTY_RELATIONSHIP_ERROR % (property.name, property.property_type.name)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='entity_property_error')
     
+    @staticmethod
     def check_property_relationship(property):
         """
         Check if the property relationship is valid for the list type and/or class.
@@ -788,9 +1290,10 @@ class TextXGrammar:
         if property.relationship and not property.list_type and property_type_class not in ['ListType', 'Entity']:
             search_values = [property.name, property.relationship.type]
             error_message = cfg.PROPERTY_RELATIONSHIP_ERROR % (property.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='property_relationship_error')
         
+    @staticmethod
     def check_list_type_and_relationship(property):
         """
         Check if the list type and property relationship are valid.
@@ -800,9 +1303,10 @@ class TextXGrammar:
         if property.list_type and property.relationship and not property_type_class == 'Entity':
             search_values = [property.name, property.list_type.type, property.relationship.type]
             error_message = cfg.LIST_TYPE_AND_RELATIONSHIP_ERROR % (property.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='list_type_and_relationship_error')
         
+    @staticmethod
     def check_property_type_and_list_type(property):
         """
         Check if the property type and list type are valid.
@@ -812,9 +1316,10 @@ class TextXGrammar:
         if property.list_type and property.list_type.type in [cfg.ARRAY, cfg.LINKED, cfg.HASHMAP, cfg.HASHSET, cfg.TREEMAP] and property_type_class not in ['Entity', 'OtherDataType', 'WrapperDataType']:
             search_values = [property.name, property.property_type.type, property.list_type.type]
             error_message = cfg.PROPERTY_TYPE_AND_LIST_TYPE_ERROR % (property.name, property.property_type.type, property.list_type.type)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=search_values, err_type='property_type_and_list_type')
     
+    @staticmethod
     def check_constant_and_value(property):
         """
         Check if either const (or constant) keyword or property value is set and the other is not.
@@ -823,9 +1328,10 @@ class TextXGrammar:
         if property.constant ^ bool(property.property_value):  # ^ is the XOR operator
             missing_element = 'constant keyword' if not property.constant else f'constant property {property.property_type.type} value'
             error_message = cfg.CONSTANT_AND_VALUE_ERROR % (missing_element, property.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property), search_value=property.name, err_type='constant_and_value')
         
+    @staticmethod
     def check_constant_and_encapsulation(property):
         """
         Check if property is constant and has setter encapsulation.
@@ -834,58 +1340,70 @@ class TextXGrammar:
         if property.constant and property.encapsulation and property.encapsulation.setter:
             search_values = [property.name, 'set', 'setter']
             error_message = cfg.CONSTANT_AND_ENCAPSULATION_ERROR % (property.name)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(property.encapsulation), search_value=search_values, err_type='constant_and_encapsulation_error')
 
+    @staticmethod
     def check_value_of_constant_property(property):
         """
         Check if the constant value of a property is valid for its type.
         Raise a SemanticError if the value is invalid.
         """
         try:
-            # Skip if property is not constant
-            if not property.constant:
+            # Skip if property is not constant or has no value (reported by check_constant_and_value)
+            if not property.constant or not property.property_value:
+                return
+
+            # Skip if property is a class (reported by check_entity_property)
+            if property.property_type.__class__.__name__ == 'Entity':
                 return
             
             checking_type = property.list_type.type if property.list_type else property.property_type.type
             value = property.property_value.value.rstrip()
-            logging.debug(f'Checking property "{property.name}" with type "{checking_type}" and value "{value}"')
+            logger.debug('Checking property "%s" with type "%s" and value "%s"', property.name, checking_type, value)
             response = utils.check_property_value(checking_type, value)
             if response is not cfg.OK:
                 search_value = [property.name, value]
                 error_message = cfg.CONSTANT_PROPERTY_VALUE_ERROR % (value, property.name, checking_type, response)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(property), search_value=search_value, err_type='property_value_error')
         except SemanticError as e:
             raise
         except Exception as e:
-            logging.error(f'Error checking property "{property.name}": {str(e)}')
+            logger.error('Error checking property "%s": %s', property.name, e)
             raise
 
+    @staticmethod
     def check_value_of_list_elements(property):
         """
         Check if the each value of a list type property is valid for its type.
-        Raise a SemanticError if an element is invalid.
+        Raise a SemanticError with the indexes of all invalid elements if any element is invalid.
         """
-        # Skip if property is not constant or list type is not set
-        if not property.constant or not property.list_type:
+        # Skip if property is not constant, has no value or list type is not set
+        if not property.constant or not property.property_value or not property.list_type:
             return
         
         value = property.property_value.value.rstrip()
         list_type = property.list_type.type
         property_type = property.property_type.type
-        logging.debug(f'Checking list elements for property "{property.name}" with type "{property_type}" and value "{value}"')
-        elements = value.strip('[]').split(',')
-        for element in elements:
-            element = element.strip()
-            response = utils.check_property_value(property_type, element)
-            if response is not cfg.OK:
-                search_value = [property.name, element]
-                error_message = cfg.LIST_ELEMENTS_ERROR % (element, value, list_type, property.name, property_type, response)
-                logging.error(error_message)
-                raise SemanticError(error_message, **get_location(property), search_value=search_value, err_type='list_value_error')
+        logger.debug('Checking list elements for property "%s" with type "%s" and value "%s"', property.name, property_type, value)
+        elements = [element.strip() for element in value.strip('[]').split(',')]
+        # Check all elements at once, so every invalid element is reported in a single error
+        invalid_indexes, response = utils.get_invalid_property_values(property_type, elements)
+        if not invalid_indexes:
+            return
+        invalid_elements = [elements[index] for index in invalid_indexes]
+        search_value = [property.name, *dict.fromkeys(invalid_elements)]  # Each distinct invalid element is highlighted once
+        if len(invalid_indexes) == 1:
+            error_message = cfg.LIST_ELEMENTS_ERROR % (invalid_elements[0], value, list_type, property.name, property_type, response)
+        else:
+            indexes = ', '.join(str(index) for index in invalid_indexes)
+            error_message = cfg.MULTIPLE_LIST_ELEMENTS_ERROR % (len(invalid_indexes), list_type, property.name, property_type, indexes, response)
+        logger.error(error_message)
+        raise SemanticError(error_message, **get_location(property), search_value=search_value, err_type='list_value_error')
 
     # PROPERTY UPDATE FUNCTIONS
+    @staticmethod
     def update_property_value(property):
         """
         Updates the value of a property based on its type.
@@ -903,14 +1421,14 @@ class TextXGrammar:
             """
             Generates a string of method statements (add or put) for a given property type and property value list.
             """
-            logging.debug(f'Generating method statements for property type "{property_type}" and property value list "{property_value_list}"')
+            logger.debug('Generating method statements for property type "%s" and property value list "%s"', property_type, property_value_list)
             return '; '.join([format_statement(index, value, key_value_pair) for index, value in enumerate(property_value_list)])
         
         def update_property_list_value(mapped_list_type, property_type, property_value, key_value_pair=False):
             """
             Updates the value of a property with a list type.
             """
-            logging.debug(f'Updating property list value for property "{property.name}" with mapped list type "{mapped_list_type}" and property type "{property_type}"')
+            logger.debug('Updating property list value for property "%s" with mapped list type "%s" and property type "%s"', property.name, mapped_list_type, property_type)
             property_value = str(property_value).replace("'", '"')
             property_value_list = utils.convert_string_to_list(property_value)
             method_statements = generate_method_statements(property_type, property_value_list, key_value_pair)
@@ -926,20 +1444,20 @@ class TextXGrammar:
             """
             list_type = property.list_type.type
             if list_type == cfg.LIST:
-                logging.debug(f'Handling list type property "{property.name}" with list type "{list_type}" and property value "{property_value}"')
+                logger.debug('Handling list type property "%s" with list type "%s" and property value "%s"', property.name, list_type, property_value)
                 property.property_value.value = property_value.replace('[', '{').replace(']', '}')
             elif list_type in [cfg.ARRAY, cfg.LINKED, cfg.HASHSET,]:
                 mapped_list_type = cfg.MAP_JAVA_TYPES[list_type]
                 updated_value = update_property_list_value(mapped_list_type, property_type, property_value)
-                logging.debug(f'Updating property value for property "{property.name}" with mapped list type "{mapped_list_type}" and updated value "{updated_value}"')
+                logger.debug('Updating property value for property "%s" with mapped list type "%s" and updated value "%s"', property.name, mapped_list_type, updated_value)
                 property.property_value.value = updated_value
             elif list_type in [cfg.HASHMAP, cfg.TREEMAP]:
                 mapped_list_type = cfg.MAP_JAVA_TYPES[list_type]
                 updated_value = update_property_list_value(mapped_list_type, property_type, property_value, key_value_pair=True)
-                logging.debug(f'Updating property value for property "{property.name}" with mapped list type "{mapped_list_type}" and updated value "{updated_value}"')
+                logger.debug('Updating property value for property "%s" with mapped list type "%s" and updated value "%s"', property.name, mapped_list_type, updated_value)
                 property.property_value.value = updated_value
 
-        logging.debug(f'Updating property value for property "{property.name}"')
+        logger.debug('Updating property value for property "%s"', property.name)
         if not property.property_value:
             return
         property_type = property.property_type.type
@@ -951,25 +1469,8 @@ class TextXGrammar:
         elif property_type in [cfg.BOOLEAN, cfg.BOOLEAN_W]:
             property.property_value.value = property_value.lower()
 
-    # CONSTRUCTOR FUNCTIONS
-    def get_constructor_name(constructor):
-        """
-        Creates a constructor name from the provided constructor object.
-        """
-        logging.debug(f'Creating constructor name from the provided constructor')
-        if constructor.default_constructor:
-            # A default constructor contains all non-constant properties from the class
-            constructor.property_list = [property for property in constructor.parent.properties if not property.constant]
-            return "default"
-        elif constructor.empty_constructor:
-            return "empty"
-        elif constructor.property_list:
-            constructor_property_names = ', '.join(property.name for property in constructor.property_list)
-            return f"[{constructor_property_names}]"
-        else:
-            return None
-
     # CONSTRUCTOR SEMANTIC CHECKS
+    @staticmethod
     def check_constructor_unique_properties(constructor):
         """
         Check if a constructor contains properties that are defined more than once.
@@ -980,10 +1481,11 @@ class TextXGrammar:
             if constructor_property.name in constructor_property_names:
                 search_value = 'default' if constructor.default_constructor else constructor_property.name
                 error_message = cfg.CONSTRUCTOR_UNIQUE_PROPERTIES_ERROR % (constructor_property.name)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(constructor), search_value=search_value, err_type='constructor_unique_properties_error')
             constructor_property_names.add(constructor_property.name)
 
+    @staticmethod
     def check_constructor_constant_property(constructor):
         """
         Check if constructor contain constant properties.
@@ -992,7 +1494,7 @@ class TextXGrammar:
         for constructor_property in constructor.property_list:
             if constructor_property.constant:
                 error_message = cfg.CONSTRUCTOR_CONSTANT_PROPERTY_ERROR % (constructor_property.name)
-                logging.error(error_message)
+                logger.error(error_message)
                 raise SemanticError(error_message, **get_location(constructor), search_value=constructor_property.name, err_type='constructor_constant_property_error')
 
     # METHOD SEMANTIC CHECKS
@@ -1005,9 +1507,10 @@ class TextXGrammar:
             method_properties = ', '.join(property.name for property in method.property_list)
             method_name = f'{method.name}({method_properties})' if method_properties else method.name
             error_message = cfg.METHOD_NAME_ERROR % (method.name, cfg.JAVA_PROPERTY_AND_METHOD_NAME_ERROR)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(method), search_value=method_name, err_type='method_name_error')
 
+    @staticmethod
     def check_method_type_in_list_type(method):
         """
         Check if the method type inside the list type is valid.
@@ -1019,5 +1522,52 @@ class TextXGrammar:
         if hasattr(method_declaration, 'list_type') and not (is_valid_type or is_entity):
             search_value = [method_declaration.method_type.type, method_declaration.list_type.type]
             error_message = cfg.METHOD_TYPE_IN_LIST_TYPE_ERROR % (method_declaration.method_type.type, method_declaration.list_type.type)
-            logging.error(error_message)
+            logger.error(error_message)
             raise SemanticError(error_message, **get_location(method), search_value=search_value, err_type='method_type_in_list_type_error')
+
+
+def get_model_file_hash(file_path):
+    """
+    Get the content hash of the grammar file, or None if the file no longer exists.
+    """
+    try:
+        return utils.get_content_hash(utils.read_file(file_path))
+    except OSError:
+        return None
+
+
+def get_imported_models(model):
+    """
+    Get the model and the models of all grammar files it imports (directly or indirectly).
+    """
+    imported_models = dict()  # Grammar file path -> model
+    models = [model]
+    while models:
+        current_model = models.pop()
+        file_path = abspath(current_model._tx_filename)
+        if file_path in imported_models:
+            continue
+        imported_models[file_path] = current_model
+        for model_import in getattr(current_model, 'imports', []):
+            models.extend(getattr(model_import, '_tx_loaded_models', []))
+    return list(imported_models.values())
+
+
+def get_importing_files(model_repository):
+    """
+    Get the paths of the grammar files importing each cached grammar file.
+    """
+    importing_files = dict()
+    for file_path, model in model_repository.filename_to_model.items():
+        for model_import in getattr(model, 'imports', []):
+            for imported_model in getattr(model_import, '_tx_loaded_models', []):
+                importing_files.setdefault(abspath(imported_model._tx_filename), []).append(file_path)
+    return importing_files
+
+
+def is_imported_file_error(error, main_file_path):
+    """
+    Check if the error is located in a grammar file imported by the main grammar file.
+    """
+    error_file_path = getattr(error, 'filename', None)
+    return bool(error_file_path and main_file_path and abspath(error_file_path) != main_file_path)
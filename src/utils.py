@@ -1,31 +1,40 @@
 import glob
+import hashlib
 import json
 import logging
 import re
 import string
 from datetime import datetime
-from os import getcwd, listdir, makedirs
-from os.path import basename, commonpath, exists, isdir, join
+from functools import lru_cache
+from os import getcwd, listdir, makedirs, remove, rmdir
+from os.path import basename, commonpath, exists, getmtime, isdir, join
 from pathlib import Path
 
-from bs4 import BeautifulSoup
-
 import src.config as cfg
 
 
+logger = logging.getLogger(__name__)
+
+
 def get_current_path():
     """
     Returns the current working directory.
     """
     current_directory = getcwd()
-    logging.debug(f'Getting current working directory: "{current_directory}"')
+    logger.debug('Getting current working directory: "%s"', current_directory)
     return current_directory
 
+def get_generator_path():
+    """
+    Returns the root folder of the JSD-MBRS Generator (the folder containing the src package).
+    """
+    return Path(__file__).resolve().parent.parent
+
 def get_base_name(path):
     """
     Gets the base name of a given path.
     """
-    logging.debug(f'Getting base name of path: "{path}"')
+    logger.debug('Getting base name of path: "%s"', path)
     return basename(path)
 
 def get_path(*paths):
@@ -33,12 +42,12 @@ def get_path(*paths):
     Joins multiple paths together using the pathlib.Path / operator.
     """
     if len(paths) < 2:
-        logging.error('At least two paths must be provided')
+        logger.error('At least two paths must be provided')
         raise ValueError('At least two paths must be provided')
     
     combined_path = Path(paths[0])
     for path in paths[1:]:
-        logging.debug(f'Joining "{path}" to "{combined_path}"')
+        logger.debug('Joining "%s" to "%s"', path, combined_path)
         combined_path /= Path(path)
     
     return combined_path
@@ -47,7 +56,7 @@ def compare_paths(path1, path2):
     """
     Compares two paths and returns True if they are the same.
     """
-    logging.debug(f'Comparing paths: "{path1}" and "{path2}"')
+    logger.debug('Comparing paths: "%s" and "%s"', path1, path2)
     return commonpath([path1]) == commonpath([path1, path2])
 
 def create_folder(base_path, folder_name):
@@ -56,15 +65,15 @@ def create_folder(base_path, folder_name):
     """
     folder_path = get_path(base_path, folder_name)
     makedirs(str(folder_path), exist_ok=True)
-    logging.debug(f'Folder "{folder_path}" created')
+    logger.debug('Folder "%s" created', folder_path)
 
 def folder_exists(folder_path):
     """
     Checks if a folder exists at the given path and if it is a directory.
     """
-    logging.debug(f'Checking if folder "{folder_path}" exists and is a directory')
+    logger.debug('Checking if folder "%s" exists and is a directory', folder_path)
     if not (exists(folder_path) and isdir(folder_path)):
-        logging.error(f'The "{folder_path}" folder does not exist in the current directory!')
+        logger.error('The "%s" folder does not exist in the current directory!', folder_path)
         raise FileNotFoundError(f'The "{folder_path}" folder does not exist in the current directory!')
 
 def file_exists(folder_path, file_name):
@@ -72,38 +81,118 @@ def file_exists(folder_path, file_name):
     Checks if a file exists in a folder.
     """
     file_path = get_path(folder_path, file_name)
-    logging.debug(f'Checking if file "{file_name}" exists in folder "{folder_path}"')
+    logger.debug('Checking if file "%s" exists in folder "%s"', file_name, folder_path)
     if not exists(file_path):
-        logging.error(f'The "{file_name}" file does not exist in the "{folder_path}" folder!')
+        logger.error('The "%s" file does not exist in the "%s" folder!', file_name, folder_path)
         raise FileNotFoundError(f'The "{file_name}" file does not exist in the "{folder_path}" folder!')
     
 def read_file(file_path, encoding='utf-8'):
     """
     Reads the contents of a file.
     """
-    logging.debug(f'Reading file: "{file_path}"')
+    logger.debug('Reading file: "%s"', file_path)
     with open(file_path, mode='r', encoding=encoding) as file:
         content = file.read()
-    logging.debug(f'Successfully read "{file_path}" file')
+    logger.debug('Successfully read "%s" file', file_path)
     return content
 
-def parse_html_content(content) -> BeautifulSoup:
+def parse_html_content(content) -> 'BeautifulSoup':
     """
     Parses the given HTML content and returns a JSON object.
     """
-    logging.debug('Parsing HTML content')
+    from bs4 import BeautifulSoup  # Imported on first use (Help window) to keep the application startup fast
+    logger.debug('Parsing HTML content')
     soup = BeautifulSoup(content, 'html.parser')
-    logging.debug('Successfully parsed HTML content')
+    logger.debug('Successfully parsed HTML content')
     return soup
 
 def write_to_file(file_path, content, encoding='utf-8'):
     """
     Writes the given content to a file.
     """
-    logging.debug(f'Writing to file: "{file_path}"')
+    logger.debug('Writing to file: "%s"', file_path)
     with open(file_path, mode='w', encoding=encoding) as file:
         file.write(content)
-    logging.debug(f'Successfully wrote to "{file_path}" file')
+    logger.debug('Successfully wrote to "%s" file', file_path)
+
+def write_binary_file(file_path, content):
+    """
+    Writes the given binary content (e.g. an image) to a file.
+    """
+    logger.debug('Writing binary content to file: "%s"', file_path)
+    with open(file_path, mode='wb') as file:
+        file.write(content)
+
+def get_modification_time(file_path):
+    """
+    Returns the last modification time of the file at the given path.
+    """
+    return getmtime(file_path)
+
+def get_content_hash(*contents):
+    """
+    Returns the SHA-256 hash (hex digest) of the given contents.
+    """
+    content_hash = hashlib.sha256()
+    for content in contents:
+        content_hash.update(str(content).encode('utf-8'))
+        content_hash.update(b'\0')  # Separator so ('ab', 'c') and ('a', 'bc') do not collide
+    return content_hash.hexdigest()
+
+def load_versioned_json(file_path, version):
+    """
+    Loads the JSON content saved by save_versioned_json.
+    Returns None if the file does not exist, is invalid or was saved with another version.
+    """
+    if not exists(file_path):
+        logger.debug('File "%s" does not exist yet', file_path)
+        return None
+    try:
+        content = json.loads(read_file(file_path))
+    except (ValueError, OSError) as e:
+        logger.warning('Failed to load "%s", ignoring its content: %s', file_path, e)
+        return None
+    if not isinstance(content, dict) or content.get('version') != version:
+        logger.debug('Version of "%s" changed, ignoring its content', file_path)
+        return None
+    return content
+
+def save_versioned_json(file_path, version, content):
+    """
+    Saves the given content (a dictionary) as JSON together with the version, creating the parent folder if needed.
+    """
+    logger.debug('Saving version %s of "%s"', version, file_path)
+    makedirs(Path(file_path).parent, exist_ok=True)
+    write_to_file(file_path, json.dumps({'version': version, **content}, indent=4))
+
+def write_to_file_if_changed(file_path, content, encoding='utf-8'):
+    """
+    Writes the given content to a file only if the file does not exist or its content is different.
+    Unchanged files keep their modification time. Returns True if the file was written.
+    """
+    if exists(file_path) and read_file(file_path, encoding) == content:
+        logger.debug('Content of "%s" file did not change, skipping write', file_path)
+        return False
+    write_to_file(file_path, content, encoding)
+    return True
+
+def delete_file(file_path):
+    """
+    Deletes the file at the given path if it exists. Returns True if the file was deleted.
+    """
+    if not exists(file_path):
+        return False
+    remove(file_path)
+    logger.debug('File "%s" deleted', file_path)
+    return True
+
+def delete_empty_folder(folder_path):
+    """
+    Deletes the folder at the given path if it exists and is empty.
+    """
+    if isdir(folder_path) and not listdir(folder_path):
+        rmdir(folder_path)
+        logger.debug('Empty folder "%s" deleted', folder_path)
 
 def find_specific_file_regex(folder_path, regex):
     """
@@ -111,28 +200,45 @@ def find_specific_file_regex(folder_path, regex):
     """
     result_files = list()
     compiled_regex = re.compile(regex)
-    logging.debug(f'Searching for file matching regex "{regex}" in folder "{folder_path}"')
+    logger.debug('Searching for file matching regex "%s" in folder "%s"', regex, folder_path)
     files = listdir(folder_path)
     for file_name in files:
         if compiled_regex.search(file_name):
-            logging.debug(f'Found file "{file_name}" matching regex in folder')
+            logger.debug('Found file "%s" matching regex in folder', file_name)
             result_files.append(file_name)
     result_files.sort(reverse=True)
-    logging.debug(f'Found {len(result_files)} files matching regex in folder')
+    logger.debug('Found %s files matching regex in folder', len(result_files))
     return result_files
 
+def find_resource_jar(jar_name_prefix):
+    """
+    Finds the versioned jar file with the given name prefix (e.g. "plantuml") in the resources folder.
+    Returns the path of the newest jar file, or None if there is no such jar file.
+    """
+    folder_exists(cfg.RESOURCES_FOLDER)
+    jar_file_names = find_specific_file_regex(cfg.RESOURCES_FOLDER, cfg.RESOURCE_JAR_REGEX % re.escape(jar_name_prefix))
+    if not jar_file_names:
+        logger.warning('No "%s" jar file found in the "%s" folder', jar_name_prefix, cfg.RESOURCES_FOLDER)
+        return None
+    elif len(jar_file_names) > 1:
+        logger.warning('More than one "%s" jar file found in the "%s" folder. Using the newest one: %s', jar_name_prefix, cfg.RESOURCES_FOLDER, jar_file_names[0])
+
+    jar_path = get_path(get_current_path(), cfg.RESOURCES_FOLDER, jar_file_names[0])
+    logger.debug('Using jar file "%s"', jar_path)
+    return jar_path
+
 def find_java_app_file(folder_path):
     """
     Searches for a specific Java application file in the given folder and its subfolders.
     """
     pattern = join(folder_path, '**', cfg.SPRING_BOOT_APPLICATION_FILE)
-    logging.debug(f'Searching for Java application file in folder "{folder_path}"')
+    logger.debug('Searching for Java application file in folder "%s"', folder_path)
     files = glob.glob(pattern, recursive=True)
     if not files:
         raise FileNotFoundError(f'Java application file not found in folder "{folder_path}"')
     elif len(files) > 1:
         raise Exception(f'Found multiple Java application files in folder "{folder_path}"')
-    logging.debug(f'Found Java application file "{files[0]}" in folder')
+    logger.debug('Found Java application file "%s" in folder', files[0])
     return Path(files[0])
 
 def set_font(font_name, font_size, bold=False):
@@ -140,7 +246,7 @@ def set_font(font_name, font_size, bold=False):
     Sets the font properties for a widget.
     Returns a tuple containing the font name and size, with an additional 'bold' element if bold is True.
     """
-    logging.debug(f'Setting font: name="{font_name}", size="{font_size}", bold="{bold}"')
+    logger.debug('Setting font: name="%s", size="%s", bold="%s"', font_name, font_size, bold)
     return (font_name, font_size, 'bold') if bold else (font_name, font_size)
 
 def convert_rgb_to_hex(rgb_value):
@@ -149,131 +255,132 @@ def convert_rgb_to_hex(rgb_value):
     """
     red, green, blue = rgb_value
     hex_value = '#%02x%02x%02x' % rgb_value # Convert the RGB values to a hexadecimal color code
-    logging.debug(f'Converting RGB values ({red}, {green}, {blue}) to hex: {hex_value}')
+    logger.debug('Converting RGB values (%s, %s, %s) to hex: %s', red, green, blue, hex_value)
     return hex_value
 
 def is_spring_boot_application(folder_path):
     """
     Determines if the given folder path is a Spring Boot application.
     """
-    logging.debug(f'Checking if folder "{folder_path}" is a Spring Boot application')
+    logger.debug('Checking if folder "%s" is a Spring Boot application', folder_path)
     build_tool = detect_build_tool(folder_path)
     # Check if all required source folders exist
     has_source_folders = all(
         isdir(get_path(folder_path, source_folder))
         for source_folder in [cfg.PROJECT_JAVA_FOLDER, cfg.PROJECT_RESOURCES_FOLDER, cfg.PROJECT_TEST_JAVA_FOLDER]  # Required source folders for a Spring Boot application
     )
-    logging.debug(f'Source folders exist: {has_source_folders}')
+    logger.debug('Source folders exist: %s', has_source_folders)
     is_spring_boot = build_tool is not None and has_source_folders
-    logging.debug(f'Confirmed as Spring Boot application: {is_spring_boot}. Build tool: {build_tool}')
+    logger.debug('Confirmed as Spring Boot application: %s. Build tool: %s', is_spring_boot, build_tool)
     return build_tool, is_spring_boot
 
 def detect_build_tool(folder_path):
     """
     Detects the Spring Boot build tool used in a given folder.
     """
-    logging.debug(f'Detecting build tool in folder: "{folder_path}"')
+    logger.debug('Detecting build tool in folder: "%s"', folder_path)
     for tool, file_name in cfg.BUILD_TOOL_FILE_MAPPING.items():
         if file_name in listdir(folder_path):
-            logging.debug(f'Build tool "{tool}" detected in folder')
+            logger.debug('Build tool "%s" detected in folder', tool)
             return tool
-    logging.debug('No build tool detected in folder')
+    logger.debug('No build tool detected in folder')
     return None
 
 def check_dependencies(build_tool, dependencies_to_check, build_content):
     """
     Checks if the specified dependencies are present in the build configuration.
     """
-    logging.debug(f'Checking dependencies in "{build_tool}" build configuration')
+    logger.debug('Checking dependencies in "%s" build configuration', build_tool)
     dependencies_section = get_dependencies_section(build_tool, build_content)
     if dependencies_section:
         # Iterate over the dependencies to check and check if they are in the dependencies block
         missing_dependencies = {key: value for key, value in dict(dependencies_to_check).items() if value not in dependencies_section}
-        logging.debug(f'Missing dependencies: "{missing_dependencies}"')
+        logger.debug('Missing dependencies: "%s"', missing_dependencies)
         return missing_dependencies
-    logging.warning(f'Could not find the dependencies section in the "{build_tool}" configuration file')
+    logger.warning('Could not find the dependencies section in the "%s" configuration file', build_tool)
     return cfg.ERROR
 
 def get_database_driver_dependency(build_tool, build_content):
     """
     Extracts the database driver dependency from the build configuration content.
     """
-    logging.debug(f'Finding database driver dependency in "{build_tool}" build configuration')
+    logger.debug('Finding database driver dependency in "%s" build configuration', build_tool)
     dependencies_section = get_dependencies_section(build_tool, build_content)
     if not dependencies_section:
-        logging.warning(f'Could not find the dependencies section in the "{build_tool}" configuration file')
+        logger.warning('Could not find the dependencies section in the "%s" configuration file', build_tool)
         return cfg.ERROR
     
     for driver_name, dependency in cfg.DATABASE_DEPENDENCY_MAPPING[build_tool].items():
         if dependency in dependencies_section:
-            logging.debug(f'Database driver dependency found: "{driver_name}"')
+            logger.debug('Database driver dependency found: "%s"', driver_name)
             return driver_name
     
-    logging.debug('Database driver dependency not found')
+    logger.debug('Database driver dependency not found')
     return None
 
 def get_dependencies_section(build_tool, build_content):
     """
     Extracts the dependencies section from the build configuration content.
     """
-    logging.debug(f'Finding dependencies section in "{build_tool}" build configuration')
+    logger.debug('Finding dependencies section in "%s" build configuration', build_tool)
     pattern = cfg.BUILD_TOOL_PATTER_REGEX[build_tool]
     match = re.search(pattern, build_content)
     if match:
-        logging.debug('Dependencies section found')
+        logger.debug('Dependencies section found')
         dependencies_section = match.group(1)
         return dependencies_section
-    logging.warning(f'Could not find the dependencies section in the "{build_tool}" configuration file')
+    logger.warning('Could not find the dependencies section in the "%s" configuration file', build_tool)
     return None
 
 def get_import_package_tree(project_path, pattern):
     """
     Extracts the import package tree from the given project path.
     """
-    logging.debug(f'Finding import package tree for project path: "{project_path.as_posix()}"')
+    logger.debug('Finding import package tree for project path: "%s"', project_path.as_posix())
     project_path_str = project_path.as_posix()
     # Create the regex pattern with a capturing group for everything after the pattern/
     regex_pattern = rf'{re.escape(pattern)}/(.*)'
     match = re.search(regex_pattern, project_path_str)
     if match:
         package_tree = match.group(1).replace('/', '.')
-        logging.debug(f'Found import package tree: "{package_tree}"')
+        logger.debug('Found import package tree: "%s"', package_tree)
         return package_tree
-    logging.debug(f'Failed to find import package tree')
+    logger.debug('Failed to find import package tree')
     return None
 
 def convert_string_to_list(text_value):
     """
     Converts a string value to a list.
     """
-    logging.debug(f'Converting string to list: "{text_value}"')
+    logger.debug('Converting string to list: "%s"', text_value)
     return json.loads(text_value)
 
 def check_words_in_string(first_string, second_string):
     """
     Checks if all the words in the first string are present in the second string.
     """
-    logging.debug(f'Checking if all words in "{first_string}" are present in "{second_string}"')
+    logger.debug('Checking if all words in "%s" are present in "%s"', first_string, second_string)
     first_words = first_string.split()
     all_present = all(word in second_string for word in first_words)
-    logging.debug(f'All words in "{first_string}" are present in "{second_string}": {all_present}')
+    logger.debug('All words in "%s" are present in "%s": %s', first_string, second_string, all_present)
     return all_present
 
 def add_punctuation(text, punctuation='!'):
     """
     Adds punctuation to the end of a text string after removing any existing punctuation.
     """
-    logging.debug(f'Adding punctuation: "{punctuation}" to text: "{text}"')
+    logger.debug('Adding punctuation: "%s" to text: "%s"', punctuation, text)
     if text.endswith('.'):
-        logging.debug('Text already ends with a period, no need to add punctuation')
+        logger.debug('Text already ends with a period, no need to add punctuation')
         return text
     elif text and text[-1] in string.punctuation:
-        logging.debug('Removing existing punctuation from text')
+        logger.debug('Removing existing punctuation from text')
         text = text[:-1]
     text += punctuation
-    logging.debug(f'Added punctuation: "{punctuation}" to text: "{text}"')
+    logger.debug('Added punctuation: "%s" to text: "%s"', punctuation, text)
     return text
 
+@lru_cache(maxsize=cfg.FILTER_CACHE_SIZE)
 def pluralize_word(word):
     """
     Pluralize a singular English word based on common rules.
@@ -289,21 +396,35 @@ def pluralize_word(word):
         plural = re.sub('y$', 'ies', word)
     else:
         plural = f'{word}s'
-    logging.debug(f"Pluralized '{word}' to '{plural}'")
+    logger.debug("Pluralized '%s' to '%s'", word, plural)
     return plural
 
+@lru_cache(maxsize=cfg.FILTER_CACHE_SIZE)
+def uppercase_first_letter(word):
+    """
+    Capitalize the first letter of the given word leaving the rest.
+    """
+    return f'{word[0].upper()}{word[1:]}'
+
+@lru_cache(maxsize=cfg.FILTER_CACHE_SIZE)
+def lowercase_first_letter(word):
+    """
+    Convert the first letter of the given word to lowercase leaving the rest.
+    """
+    return f'{word[0].lower()}{word[1:]}'
+
 def create_syntax_error_message(error):
     """
     Creates a message for a syntax error.
     """
     try:
-        logging.debug(f'Parsing syntax error message: "{error.message}"')
+        logger.debug('Parsing syntax error message: "%s"', error.message)
         pattern = cfg.SYNTAX_ERROR_MESSAGE_REGEX
         match = re.match(pattern, error.message, re.DOTALL)
         expected_value, found_value = match.group(1, 2) if match else (error.message, None)
         expected_value = expected_value.strip().replace('\'', '"')
         if not found_value:
-            logging.debug(f'Failed to parse syntax error message: "{error.message}". Returning original error message')
+            logger.debug('Failed to parse syntax error message: "%s". Returning original error message', error.message)
             message = f'at position ({error.line},{error.col}): Context of the syntax error: "{error.context}"! {expected_value} but not found.'
             return message, None, None
         found_value = extract_between_quotes(found_value.strip())
@@ -311,10 +432,10 @@ def create_syntax_error_message(error):
         near_part = near_part.strip()
         found_part = found_part.strip()
         message = f'at position ({error.line},{error.col}): Syntax error near "{near_part}". {expected_value} but found "{found_part}"!'
-        logging.debug(f'Parsed syntax error message: "{message}"')
+        logger.debug('Parsed syntax error message: "%s"', message)
         return message, near_part, found_part
     except Exception as e:
-        logging.debug(f'Failed to parse syntax error message: "{e}"')
+        logger.debug('Failed to parse syntax error message: "%s"', e)
         return error.message
     
 def get_unknown_object_name(error):
@@ -322,13 +443,13 @@ def get_unknown_object_name(error):
     Extracts the unknown object name from the error message.
     """
     try:
-        logging.debug(f'Parsing "Unknown object" error message: "{error.message}"')
+        logger.debug('Parsing "Unknown object" error message: "%s"', error.message)
         pattern = cfg.UNKNOWN_OBJECT_ERROR_MESSAGE_REGEX
         unknown_object, class_name = re.match(pattern, error.message, re.DOTALL).group(1, 2)
-        logging.debug(f'Parsed Unknown object: "{unknown_object}", class name: "{class_name}"')
+        logger.debug('Parsed Unknown object: "%s", class name: "%s"', unknown_object, class_name)
         return unknown_object
     except Exception as e:
-        logging.debug(f'Failed to parse "Unknown object" error message: "{e}"')
+        logger.debug('Failed to parse "Unknown object" error message: "%s"', e)
         return error.message
     
 def get_is_not_unique_name(error):
@@ -336,19 +457,19 @@ def get_is_not_unique_name(error):
     Extracts the property name from the 'is not unique' error message.
     """
     try:
-        logging.debug(f'Parsing "is not unique" error message: "{error.message}"')
+        logger.debug('Parsing "is not unique" error message: "%s"', error.message)
         pattern = cfg.IS_NOT_UNIQUE_ERROR_MESSAGE_REGEX
         is_not_unique = re.match(pattern, error.message, re.DOTALL).group(1)
-        logging.debug(f'Parsed is not unique: "{is_not_unique}"')
+        logger.debug('Parsed is not unique: "%s"', is_not_unique)
         return is_not_unique
     except Exception as e:
-        logging.debug(f'Failed to parse "is not unique" error message: "{e}"')
+        logger.debug('Failed to parse "is not unique" error message: "%s"', e)
 
 def extract_jinja_subprocess_output(output):
     """
     Extracts the content from the jinja subprocess output.
     """
-    logging.debug(f'Extracting content from jinja subprocess output: "{output}"')
+    logger.debug('Extracting content from jinja subprocess output: "%s"', output)
     matches = re.findall(cfg.JINJA_SUBPROCESS_ERROR_REGEX, output)
     if matches:
         first_line = matches[0]
@@ -360,7 +481,7 @@ def extract_between_quotes(text):
     """
     Find and return content between single quotes.
     """
-    logging.debug(f'Extracting content between quotes from text: "{text}"')
+    logger.debug('Extracting content between quotes from text: "%s"', text)
     match = re.search(cfg.QUOTE_REGEX, text)
     return match.group(1) if match else None
 
@@ -368,131 +489,215 @@ def extract_rule_defined_signs_regex(content):
     """
     Extract rule defined signs from the provided content using regex.
     """
-    logging.debug(f'Extracting rule defined signs from text editor content')
+    logger.debug('Extracting rule defined signs from text editor content')
     rule_defined_sign_pattern = re.compile(cfg.RULE_DEFINED_SIGNS_REGEX)
     rule_defined_signs = [match.group(0) for match in rule_defined_sign_pattern.finditer(content)]
     unique_signs = list(set(rule_defined_signs))  # Convert to set and back to list for uniqueness
-    logging.debug(f'Found unique rule defined signs: "{unique_signs}"')
+    logger.debug('Found unique rule defined signs: "%s"', unique_signs)
     return unique_signs
 
 def extract_class_names_regex(content):
     """
     Extract class names from the provided content using regex.
     """
-    logging.debug(f'Extracting class names from text editor content')
+    logger.debug('Extracting class names from text editor content')
     class_pattern = re.compile(cfg.CLASS_NAME_REGEX)
     class_names = [match.group(1) for match in class_pattern.finditer(content)]
-    logging.debug(f'Found class names: "{class_names}"')
+    logger.debug('Found class names: "%s"', class_names)
     return class_names
 
 def extract_property_values_regex(content):
     """
     Extract property values from the provided content using regex.
     """
-    logging.debug(f'Extracting property values from text editor content')
+    logger.debug('Extracting property values from text editor content')
     property_pattern = re.compile(cfg.PROPERTY_VALUE_REGEX)
     group_values = [match.group(1) for match in property_pattern.finditer(content)]
     property_values = [value for value in group_values if value]  # Remove empty values
     unique_property_values = list(set(property_values))  # Convert to set and back to list for uniqueness
-    logging.debug(f'Found property values: "{unique_property_values}"')
+    logger.debug('Found property values: "%s"', unique_property_values)
     return unique_property_values
 
 def extract_comments_regex(content):
     """
     Extract comments from the provided content using regex.
     """
-    logging.debug(f'Extracting comments from text editor content')
+    logger.debug('Extracting comments from text editor content')
     comment_pattern = re.compile(cfg.COMMENT_REGEX)
     comments = [match.group(0) for match in comment_pattern.finditer(content)]
-    logging.debug(f'Found comments: "{comments}"')
+    logger.debug('Found comments: "%s"', comments)
     return comments
 
 def check_value_regex(regex_pattern, value_to_check):
     """
     Checks if the provided value matches the provided regex pattern.
     """
-    logging.debug(f'Checking if value "{value_to_check}" matches regex pattern "{regex_pattern}"')
+    logger.debug('Checking if value "%s" matches regex pattern "%s"', value_to_check, regex_pattern)
     return bool(re.match(regex_pattern, value_to_check))
 
 def check_app_file_content(file_path):
     """
     Checks if the provided file contains the OpenAPI definition.
     """
-    logging.debug(f'Checking if file "{file_path}" contains the OpenAPI definition')
+    logger.debug('Checking if file "%s" contains the OpenAPI definition', file_path)
     content = read_file(file_path)
     pattern_info = re.compile(cfg.OPEN_API_DEFINITION_REGEX, re.DOTALL)
     # Returns True if the pattern is not found in the content
     return not pattern_info.search(content)
 
-def check_property_value(property_type, property_value):
+def check_datetime(date_str, format):
     """
-    Checks if the provided value is appropriate for the given property type.
+    Check if the provided string is a valid datetime in specific format.
     """
-    def error(message):
-        """
-        Returns an error message.
-        """
-        logging.debug(f'{message} ({property_type} type)')
-        return message
-    
-    def check_datetime(date_str, format):
-        """
-        Check if the provided string is a valid datetime in specific format.
-        """
-        try:
-            datetime.strptime(date_str, format)
-            return True
-        except ValueError:
-            return False
-    
-    property_checking_rules = {
-        # PrimitiveDataTypes
-        cfg.BYTE: lambda value: cfg.OK if isinstance(int(value), int) and -128 <= int(value) <= 127 else error(cfg.ERROR_MESSAGES[cfg.BYTE]),
-        cfg.SHORT: lambda value: cfg.OK if isinstance(int(value), int) and -32768 <= int(value) <= 32767 else error(cfg.ERROR_MESSAGES[cfg.SHORT]),
-        cfg.CHAR: lambda value: cfg.OK if isinstance(value, str) and len(value) == 3 and value[0] == '\'' and value[-1] == '\'' else error(cfg.ERROR_MESSAGES[cfg.CHAR]),
-        cfg.INT: lambda value: cfg.OK if isinstance(int(value), int) and -2147483648 <= int(value) <= 2147483647 else error(cfg.ERROR_MESSAGES[cfg.INT]),
-        cfg.FLOAT: lambda value: cfg.OK if isinstance(float(value[:-1]), (int, float)) and value.upper().endswith('F') else error(cfg.ERROR_MESSAGES[cfg.FLOAT]),
-        cfg.LONG: lambda value: cfg.OK if isinstance(int(value[:-1]), int) and -9223372036854775808 <= int(value[:-1]) <= 9223372036854775807 and value.upper().endswith('L') else error(cfg.ERROR_MESSAGES[cfg.LONG]),
-        cfg.DOUBLE: lambda value: cfg.OK if isinstance(float(value[:-1]), (int, float)) and value.upper().endswith('D') else error(cfg.ERROR_MESSAGES[cfg.DOUBLE]),
-        cfg.BOOLEAN: lambda value: cfg.OK if isinstance(value, str) and value.lower() in ('true', 'false') else error(cfg.ERROR_MESSAGES[cfg.BOOLEAN]),
-
-        # WrapperDataTypes
-        cfg.BYTE_W: lambda value: cfg.OK if isinstance(int(value), int) and -128 <= int(value) <= 127 else error(cfg.ERROR_MESSAGES[cfg.BYTE_W]),
-        cfg.SHORT_W: lambda value: cfg.OK if isinstance(int(value), int) and -32768 <= int(value) <= 32767 else error(cfg.ERROR_MESSAGES[cfg.SHORT_W]),
-        cfg.CHARACTER_W: lambda value: cfg.OK if isinstance(value, str) and len(value) == 3 and value[0] == '\'' and value[-1] == '\'' else error(cfg.ERROR_MESSAGES[cfg.CHARACTER_W]),
-        cfg.INTEGER_W: lambda value: cfg.OK if isinstance(int(value), int) and -2147483648 <= int(value) <= 2147483647 else error(cfg.ERROR_MESSAGES[cfg.INTEGER_W]),
-        cfg.FLOAT_W: lambda value: cfg.OK if isinstance(float(value[:-1]), (int, float)) and value.upper().endswith('F') else error(cfg.ERROR_MESSAGES[cfg.FLOAT_W]),
-        cfg.LONG_W: lambda value: cfg.OK if isinstance(int(value[:-1]), int) and -9223372036854775808 <= int(value[:-1]) <= 9223372036854775807 and value.upper().endswith('L') else error(cfg.ERROR_MESSAGES[cfg.LONG_W]),
-        cfg.DOUBLE_W: lambda value: cfg.OK if isinstance(float(value[:-1]), (int, float)) and value.upper().endswith('D') else error(cfg.ERROR_MESSAGES[cfg.DOUBLE_W]),
-        cfg.BOOLEAN_W: lambda value: cfg.OK if isinstance(value, str) and value.lower() in ('true', 'false') else error(cfg.ERROR_MESSAGES[cfg.BOOLEAN_W]),
-        
-        # OtherDataTypes
-        cfg.STR: lambda value: cfg.OK if isinstance(value, str) and value.startswith('"') and value.endswith('"') else error(cfg.ERROR_MESSAGES[cfg.STRING]),
-        cfg.STRING: lambda value: cfg.OK if isinstance(value, str) and value.startswith('"') and value.endswith('"') else error(cfg.ERROR_MESSAGES[cfg.STRING]),
-        cfg.STRING_C: lambda value: cfg.OK if isinstance(value, str) and value.startswith('"') and value.endswith('"') else error(cfg.ERROR_MESSAGES[cfg.STRING]),
-
-        # DateTypes
-        cfg.DATE: lambda value: cfg.OK if isinstance(value, str) and check_datetime(value, cfg.DATE_REGEX) else error(cfg.ERROR_MESSAGES[cfg.DATE]),
-        cfg.TIME: lambda value: cfg.OK if isinstance(value, str) and check_datetime(value, cfg.TIME_REGEX) else error(cfg.ERROR_MESSAGES[cfg.TIME]),
-        cfg.DATETIME: lambda value: cfg.OK if isinstance(value, str) and check_datetime(value, cfg.DATETIME_REGEX) else error(cfg.ERROR_MESSAGES[cfg.DATETIME]),
-
-        # ListTypes
-        cfg.ARRAY: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.ARRAY]),
-        cfg.LINKED: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.LINKED]),
-        cfg.HASHMAP: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.HASHMAP]),
-        cfg.HASHSET: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.HASHSET]),
-        cfg.TREEMAP: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.TREEMAP]),
-        cfg.LIST: lambda value: cfg.OK if isinstance(value, str) and value.startswith('[') and value.endswith(']') else error(cfg.ERROR_MESSAGES[cfg.LIST]),
-    }
-
-    if property_type not in property_checking_rules:
-        logging.error(f'Unknown property type: "{property_type}"')
+    try:
+        datetime.strptime(date_str, format)
+        return True
+    except ValueError:
+        return False
+
+def create_integer_validator(value_range, suffix=None):
+    """
+    Creates a validator for integer values in the given range, which end with the given type suffix (e.g. "L").
+    """
+    min_value, max_value = value_range
+
+    def is_valid(value):
+        if suffix:
+            if not value.upper().endswith(suffix):
+                return False
+            value = value[:-1]
+        return min_value <= int(value) <= max_value
+    return is_valid
+
+def create_decimal_validator(suffix):
+    """
+    Creates a validator for float or integer values which end with the given type suffix (e.g. "F").
+    """
+    def is_valid(value):
+        float(value[:-1])
+        return value.upper().endswith(suffix)
+    return is_valid
+
+def is_valid_char(value):
+    """
+    Checks if the value is a single character surrounded by single quotes.
+    """
+    return isinstance(value, str) and len(value) == 3 and value[0] == '\'' and value[-1] == '\''
+
+def is_valid_boolean(value):
+    """
+    Checks if the value is "true" or "false".
+    """
+    return isinstance(value, str) and value.lower() in ('true', 'false')
+
+def is_valid_string(value):
+    """
+    Checks if the value is surrounded by double quotes.
+    """
+    return isinstance(value, str) and value.startswith('"') and value.endswith('"')
+
+def is_valid_list(value):
+    """
+    Checks if the value starts with "[" and ends with "]".
+    """
+    return isinstance(value, str) and value.startswith('[') and value.endswith(']')
+
+# Property type -> (validator, error message), created once instead of on every checked value
+# A validator returns False (or raises a ValueError) if the value is not valid for the property type
+PROPERTY_VALUE_VALIDATORS = {
+    # PrimitiveDataTypes
+    cfg.BYTE: (create_integer_validator(cfg.BYTE_RANGE), cfg.ERROR_MESSAGES[cfg.BYTE]),
+    cfg.SHORT: (create_integer_validator(cfg.SHORT_RANGE), cfg.ERROR_MESSAGES[cfg.SHORT]),
+    cfg.CHAR: (is_valid_char, cfg.ERROR_MESSAGES[cfg.CHAR]),
+    cfg.INT: (create_integer_validator(cfg.INT_RANGE), cfg.ERROR_MESSAGES[cfg.INT]),
+    cfg.FLOAT: (create_decimal_validator('F'), cfg.ERROR_MESSAGES[cfg.FLOAT]),
+    cfg.LONG: (create_integer_validator(cfg.LONG_RANGE, 'L'), cfg.ERROR_MESSAGES[cfg.LONG]),
+    cfg.DOUBLE: (create_decimal_validator('D'), cfg.ERROR_MESSAGES[cfg.DOUBLE]),
+    cfg.BOOLEAN: (is_valid_boolean, cfg.ERROR_MESSAGES[cfg.BOOLEAN]),
+
+    # WrapperDataTypes
+    cfg.BYTE_W: (create_integer_validator(cfg.BYTE_RANGE), cfg.ERROR_MESSAGES[cfg.BYTE_W]),
+    cfg.SHORT_W: (create_integer_validator(cfg.SHORT_RANGE), cfg.ERROR_MESSAGES[cfg.SHORT_W]),
+    cfg.CHARACTER_W: (is_valid_char, cfg.ERROR_MESSAGES[cfg.CHARACTER_W]),
+    cfg.INTEGER_W: (create_integer_validator(cfg.INT_RANGE), cfg.ERROR_MESSAGES[cfg.INTEGER_W]),
+    cfg.FLOAT_W: (create_decimal_validator('F'), cfg.ERROR_MESSAGES[cfg.FLOAT_W]),
+    cfg.LONG_W: (create_integer_validator(cfg.LONG_RANGE, 'L'), cfg.ERROR_MESSAGES[cfg.LONG_W]),
+    cfg.DOUBLE_W: (create_decimal_validator('D'), cfg.ERROR_MESSAGES[cfg.DOUBLE_W]),
+    cfg.BOOLEAN_W: (is_valid_boolean, cfg.ERROR_MESSAGES[cfg.BOOLEAN_W]),
+
+    # OtherDataTypes
+    cfg.STR: (is_valid_string, cfg.ERROR_MESSAGES[cfg.STRING]),
+    cfg.STRING: (is_valid_string, cfg.ERROR_MESSAGES[cfg.STRING]),
+    cfg.STRING_C: (is_valid_string, cfg.ERROR_MESSAGES[cfg.STRING]),
+
+    # DateTypes
+    cfg.DATE: (lambda value: isinstance(value, str) and check_datetime(value, cfg.DATE_REGEX), cfg.ERROR_MESSAGES[cfg.DATE]),
+    cfg.TIME: (lambda value: isinstance(value, str) and check_datetime(value, cfg.TIME_REGEX), cfg.ERROR_MESSAGES[cfg.TIME]),
+    cfg.DATETIME: (lambda value: isinstance(value, str) and check_datetime(value, cfg.DATETIME_REGEX), cfg.ERROR_MESSAGES[cfg.DATETIME]),
+
+    # ListTypes
+    cfg.ARRAY: (is_valid_list, cfg.ERROR_MESSAGES[cfg.ARRAY]),
+    cfg.LINKED: (is_valid_list, cfg.ERROR_MESSAGES[cfg.LINKED]),
+    cfg.HASHMAP: (is_valid_list, cfg.ERROR_MESSAGES[cfg.HASHMAP]),
+    cfg.HASHSET: (is_valid_list, cfg.ERROR_MESSAGES[cfg.HASHSET]),
+    cfg.TREEMAP: (is_valid_list, cfg.ERROR_MESSAGES[cfg.TREEMAP]),
+    cfg.LIST: (is_valid_list, cfg.ERROR_MESSAGES[cfg.LIST]),
+}
+
+# Property type -> value range of the integer types without a suffix, which are validated in bulk by get_invalid_property_values
+INTEGER_VALUE_RANGES = {
+    cfg.BYTE: cfg.BYTE_RANGE,
+    cfg.SHORT: cfg.SHORT_RANGE,
+    cfg.INT: cfg.INT_RANGE,
+    cfg.BYTE_W: cfg.BYTE_RANGE,
+    cfg.SHORT_W: cfg.SHORT_RANGE,
+    cfg.INTEGER_W: cfg.INT_RANGE,
+}
+
+def get_property_value_validator(property_type):
+    """
+    Returns the validator and the error message for the given property type.
+    """
+    if property_type not in PROPERTY_VALUE_VALIDATORS:
+        logger.error('Unknown property type: "%s"', property_type)
         raise ValueError(f"Unknown property type: {property_type}")
+    return PROPERTY_VALUE_VALIDATORS[property_type]
 
+def is_valid_property_value(validator, property_value):
+    """
+    Checks the value with the given validator, treating values that cannot be parsed as invalid.
+    """
     try:
-        result = property_checking_rules[property_type](property_value)
-        logging.debug(f'"{property_value}" is a valid value for "{property_type}" type')
-        return result
+        return bool(validator(property_value))
     except ValueError:
-        logging.error(f'"{property_value}" is NOT a valid value for "{property_type}" type: {cfg.ERROR_MESSAGES[property_type]}')
-        return error(f'{cfg.ERROR_MESSAGES[property_type]}')
+        return False
+
+def check_property_value(property_type, property_value):
+    """
+    Checks if the provided value is appropriate for the given property type.
+    """
+    validator, error_message = get_property_value_validator(property_type)
+    if is_valid_property_value(validator, property_value):
+        logger.debug('"%s" is a valid value for "%s" type', property_value, property_type)
+        return cfg.OK
+    logger.debug('%s (%s type)', error_message, property_type)
+    return error_message
+
+def get_invalid_property_values(property_type, property_values):
+    """
+    Checks all provided values (e.g. the elements of a list literal) against the given property type at once.
+    Returns the indexes of all invalid values and the error message of the property type.
+    """
+    validator, error_message = get_property_value_validator(property_type)
+    value_range = INTEGER_VALUE_RANGES.get(property_type)
+    if value_range:
+        try:
+            # Convert all values in a single pass and check only the range, if every value is an integer
+            min_value, max_value = value_range
+            numbers = list(map(int, property_values))
+            return [index for index, number in enumerate(numbers) if not min_value <= number <= max_value], error_message
+        except ValueError:
+            pass  # Some values are not integers, check them one by one to find their indexes
+    invalid_indexes = [index for index, property_value in enumerate(property_values) if not is_valid_property_value(validator, property_value)]
+    logger.debug('Found %s invalid value(s) out of %s for "%s" type', len(invalid_indexes), len(property_values), property_type)
+    return invalid_indexes, error_message
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import src.config as cfg
+
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+GRAMMAR_PATH = ROOT_PATH / cfg.GRAMMAR_FOLDER / cfg.GRAMMAR_FILE
+DATABASE_DRIVER = cfg.DATABASE_MAPPINGS['postgresql']['name']  # Driver of the model database, so no dependency is added
+POM_CONTENT = '<project>\n\t<dependencies>\n\t</dependencies>\n</project>\n'
+APPLICATION_CONTENT = 'package com.example;\n\npublic class MavenApplication {}\n'
+DATABASE = '''Database {
+    DB driver: postgresql,
+    DB name: jsd_mbrs,
+    DB username: postgres,
+    DB password: rootPassword1
+}
+'''
+CUSTOMER = '''public class Customer {
+    customerId: id (get);
+    name: string (get, set);
+    orders: Order list 1..*;
+
+    Constructors {
+        default,
+        empty
+    }
+    Methods {}
+    toString: yes
+}
+'''
+ORDER = '''public class Order {
+    orderId: id (get);
+    total: double (get, set);
+    customer: Customer *..1(+) (get, set);
+
+    Constructors {
+        default,
+        empty
+    }
+    Methods {}
+    toString: yes
+}
+'''
+PRODUCT = '''public class Product {
+    productId: id (get);
+    price: double (get, set);
+
+    Constructors {
+        default,
+        empty
+    }
+    Methods {}
+    toString: no
+}
+'''
+MODEL = '\n'.join([DATABASE, CUSTOMER, ORDER, PRODUCT])
+
+
+def create_project(project_path):
+    """
+    Create a minimal Maven Spring Boot project with the JSD-MBRS Generator grammar folder.
+    Returns the path of the grammar folder.
+    """
+    java_app_folder = project_path / cfg.PROJECT_JAVA_FOLDER / 'com' / 'example'
+    java_app_folder.mkdir(parents=True)
+    (java_app_folder / 'MavenApplication.java').write_text(APPLICATION_CONTENT)
+    (project_path / cfg.PROJECT_RESOURCES_FOLDER).mkdir(parents=True)
+    (project_path / cfg.BUILD_TOOL_FILE_MAPPING[cfg.MAVEN]).write_text(POM_CONTENT)
+    grammar_folder = project_path / cfg.JSD_MBRS_GENERATOR_FOLDER / cfg.GRAMMAR_FOLDER
+    grammar_folder.mkdir(parents=True)
+    return grammar_folder
@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.config as cfg
+from src.java_formatter import GoogleJavaFormatter
+from src.plantuml_worker import PlantUmlWorker
+from src.textx_grammar import TextXGrammar
+from tests.helpers import DATABASE_DRIVER, MODEL, ROOT_PATH, create_project
+
+
+MODEL_FILE_NAME = 'model.jsdmbrs'
+METAMODEL_DOT_NAME = f'{cfg.METAMODEL_NAME}{cfg.DOT_FILE_EXTENSION}'
+# Stub of the Graphviz dot executable, which writes the dot content streamed to its standard input to the -o file and logs the rendered file name
+DOT_STUB = f'''#!{sys.executable}
+import os, sys
+output_path = sys.argv[sys.argv.index('-o') + 1]
+with open(output_path, 'w') as file:
+    file.write(sys.stdin.read())
+with open(os.environ['DOT_STUB_LOG'], 'a') as log:
+    log.write(os.path.basename(output_path) + '\\n')
+'''
+
+
+class ExportCacheTest(unittest.TestCase):
+    """
+    Tests for skipping the render of the exported diagrams whose inputs did not change, with a stub dot executable on the PATH.
+    Google Java Format and PlantUML are disabled.
+    """
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.temp_folder.name) / 'project'
+        self.project_path.mkdir()
+        self.grammar_folder = create_project(self.project_path)
+        self.dot_folder = self.project_path / cfg.JSD_MBRS_GENERATOR_FOLDER / cfg.EXPORT_FOLDER / cfg.EXPORT_DOT_FOLDER
+        bin_path = Path(self.temp_folder.name) / 'bin'
+        bin_path.mkdir()
+        dot_path = bin_path / cfg.DOT_COMMAND
+        dot_path.write_text(DOT_STUB)
+        dot_path.chmod(0o755)
+        self.log_path = Path(self.temp_folder.name) / 'dot.log'
+        self.log_path.touch()
+        current_path = os.getcwd()
+        os.chdir(ROOT_PATH)  # Grammar and template folders are relative to the generator folder
+        self.addCleanup(os.chdir, current_path)
+        patchers = [
+            mock.patch.object(GoogleJavaFormatter, 'get_google_format_jar_path', return_value=None),
+            mock.patch.object(PlantUmlWorker, 'get_plantuml_jar_path', return_value=None),
+            mock.patch.object(cfg, 'EXPORT_IMAGE_FORMAT', 'svg'),
+            mock.patch.dict(os.environ, {'PATH': str(bin_path), 'DOT_STUB_LOG': str(self.log_path)}),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.textx_grammar = TextXGrammar()
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def export(self, model_content):
+        """
+        Generate the given model, export it and return the names of the rendered images.
+        """
+        (self.grammar_folder / MODEL_FILE_NAME).write_text(model_content)
+        response = self.textx_grammar.generate(self.project_path, MODEL_FILE_NAME, DATABASE_DRIVER)
+        self.assertEqual(response.status, cfg.OK, response.error_msg)
+        rendered_count = len(self.log_path.read_text().split())
+        response = self.textx_grammar.export()
+        self.assertEqual(response.status, cfg.OK, response.error_msg)
+        return sorted(self.log_path.read_text().split()[rendered_count:])
+
+    def test_unchanged_model(self):
+        self.assertEqual(self.export(MODEL), [f'{METAMODEL_DOT_NAME}.svg', f'{cfg.MODEL_NAME}.svg'])
+
+        self.assertEqual(self.export(MODEL), [])
+        self.assertEqual((self.dot_folder / f'{cfg.MODEL_NAME}.svg').read_text(), (self.dot_folder / cfg.MODEL_NAME).read_text())
+
+    def test_changed_model(self):
+        self.export(MODEL)
+
+        self.assertEqual(self.export(MODEL.replace('total: double', 'amount: double')), [f'{cfg.MODEL_NAME}.svg'])
+        self.assertIn('amount', (self.dot_folder / f'{cfg.MODEL_NAME}.svg').read_text())
+
+    def test_deleted_image(self):
+        self.export(MODEL)
+
+        (self.dot_folder / f'{cfg.MODEL_NAME}.svg').unlink()
+
+        self.assertEqual(self.export(MODEL), [f'{cfg.MODEL_NAME}.svg'])
+
+    def test_changed_image_format(self):
+        self.export(MODEL)
+
+        with mock.patch.object(cfg, 'EXPORT_IMAGE_FORMAT', 'png'):
+            self.assertEqual(self.export(MODEL), [f'{METAMODEL_DOT_NAME}.png', f'{cfg.MODEL_NAME}.png'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.config as cfg
+from src.java_formatter import GoogleJavaFormatter
+from src.textx_grammar import TextXGrammar
+from tests.helpers import CUSTOMER, DATABASE, DATABASE_DRIVER, MODEL, ORDER, PRODUCT, ROOT_PATH, create_project
+
+
+MODEL_FILE_NAME = 'model.jsdmbrs'
+
+
+class GenerationManifestTest(unittest.TestCase):
+    """
+    Tests for re-rendering only the entities which changed since the last generation.
+    Google Java Format is disabled, so the generated files keep their rendered content.
+    """
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.temp_folder.name)
+        self.grammar_folder = create_project(self.project_path)
+        self.java_folder = self.project_path / cfg.PROJECT_JAVA_FOLDER
+        current_path = os.getcwd()
+        os.chdir(ROOT_PATH)  # Grammar and template folders are relative to the generator folder
+        self.addCleanup(os.chdir, current_path)
+        patcher = mock.patch.object(GoogleJavaFormatter, 'get_google_format_jar_path', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def generate(self, model_content):
+        (self.grammar_folder / MODEL_FILE_NAME).write_text(model_content)
+        response = TextXGrammar().generate(self.project_path, MODEL_FILE_NAME, DATABASE_DRIVER)
+        self.assertEqual(response.status, cfg.OK, response.error_msg)
+        return response.message
+
+    def get_generated_files(self):
+        return {file_path.relative_to(self.java_folder).as_posix(): file_path.read_text() for file_path in self.java_folder.rglob('*.java')}
+
+    def get_changed_entities(self, previous_files):
+        """
+        Get the names of the entity folders whose generated files were added, changed or deleted.
+        """
+        current_files = self.get_generated_files()
+        changed_files = {file_path for file_path in previous_files.keys() | current_files.keys() if previous_files.get(file_path) != current_files.get(file_path)}
+        return {Path(file_path).parent.name for file_path in changed_files}
+
+    def test_unchanged_model(self):
+        self.generate(MODEL)
+        generated_files = self.get_generated_files()
+
+        message = self.generate(MODEL)
+
+        self.assertTrue(message.startswith('0 file(s) written'), message)
+        self.assertEqual(self.get_generated_files(), generated_files)
+
+    def test_changed_property(self):
+        self.generate(MODEL)
+        generated_files = self.get_generated_files()
+
+        self.generate(MODEL.replace('total: double', 'amount: double'))
+
+        self.assertEqual(self.get_changed_entities(generated_files), {'Order'})
+
+    def test_changed_relationship_property(self):
+        self.generate(MODEL)
+        generated_files = self.get_generated_files()
+
+        # The mapped-by value of the non-owner side is the name of the relationship property of the owner side
+        self.generate('\n'.join([DATABASE, CUSTOMER, ORDER.replace('customer: Customer', 'buyer: Customer'), PRODUCT]))
+
+        self.assertEqual(self.get_changed_entities(generated_files), {'Customer', 'Order'})
+
+    def test_removed_entity(self):
+        self.generate(MODEL)
+        generated_files = self.get_generated_files()
+
+        message = self.generate('\n'.join([DATABASE, CUSTOMER, ORDER]))
+
+        self.assertIn('4 deleted', message)
+        self.assertFalse((self.java_folder / 'com' / 'example' / 'Product').exists())
+        # Every entity class imports all other entities, so the remaining entities are rendered again
+        # The repository configuration (in the application folder) lists the repositories of all entities
+        self.assertEqual(self.get_changed_entities(generated_files), {'Customer', 'Order', 'Product', 'example'})
+
+
+if __name__ == '__main__':
+    unittest.main()
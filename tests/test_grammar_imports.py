@@ -0,0 +1,119 @@
+import tempfile
+import unittest
+from os.path import abspath
+from pathlib import Path
+
+import src.config as cfg
+from src.textx_grammar import TextXGrammar
+from tests.helpers import CUSTOMER, DATABASE, DATABASE_DRIVER, GRAMMAR_PATH, ORDER, PRODUCT, create_project
+
+
+MODEL_FILE_NAME = 'model.jsdmbrs'
+CUSTOMERS_FILE_NAME = 'customers.jsdmbrs'
+ORDERS_FILE_NAME = 'orders.jsdmbrs'
+PRODUCTS_FILE_NAME = 'products.jsdmbrs'
+# The main grammar file holds the Database section and the imports, the classes are split into imported grammar files
+GRAMMAR_FILES = {
+    MODEL_FILE_NAME: f'import "{CUSTOMERS_FILE_NAME}";\nimport "{PRODUCTS_FILE_NAME}";\n{DATABASE}',
+    CUSTOMERS_FILE_NAME: f'import "{ORDERS_FILE_NAME}";\n{CUSTOMER}',
+    ORDERS_FILE_NAME: f'import "{CUSTOMERS_FILE_NAME}";\n{ORDER}',  # Grammar files with related classes import each other
+    PRODUCTS_FILE_NAME: PRODUCT,
+}
+
+
+class GrammarImportsTest(unittest.TestCase):
+    """
+    Tests for splitting the grammar into imported grammar files, which are cached in the global model repository.
+    """
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.temp_folder.name)
+        self.grammar_folder = create_project(self.project_path)
+        self.textx_grammar = TextXGrammar()
+        self.textx_grammar.set_project_path(self.project_path)
+        self.textx_grammar.set_database_driver(DATABASE_DRIVER)
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def write_grammar_files(self, grammar_files):
+        for file_name, content in grammar_files.items():
+            (self.grammar_folder / file_name).write_text(content)
+
+    def get_model(self):
+        with self.textx_grammar.parse_lock:
+            metamodel = self.textx_grammar.get_metamodel(GRAMMAR_PATH)
+            model = self.textx_grammar.get_model(metamodel, self.grammar_folder / MODEL_FILE_NAME, MODEL_FILE_NAME)
+        return model, metamodel._tx_model_repository.all_models.filename_to_model
+
+    def get_file_path(self, file_name):
+        return abspath(self.grammar_folder / file_name)
+
+    def test_import_resolution(self):
+        self.write_grammar_files(GRAMMAR_FILES)
+
+        model, cached_models = self.get_model()
+
+        self.assertEqual(model.database.name, 'jsd_mbrs')
+        # The classes of the imported grammar files are added to the main model
+        self.assertEqual(sorted(entity.name for entity in model.entities), ['Customer', 'Order', 'Product'])
+        for file_name in GRAMMAR_FILES:
+            self.assertIn(self.get_file_path(file_name), cached_models)
+        # The relationship property refers to the class of the mutually imported grammar file
+        customer = cached_models[self.get_file_path(ORDERS_FILE_NAME)].entities[0].properties[2].property_type
+        self.assertIs(customer, cached_models[self.get_file_path(CUSTOMERS_FILE_NAME)].entities[0])
+
+    def test_changed_imported_file_eviction(self):
+        self.write_grammar_files(GRAMMAR_FILES)
+        model, cached_models = self.get_model()
+        previous_models = dict(cached_models)
+
+        self.write_grammar_files({PRODUCTS_FILE_NAME: PRODUCT.replace('price: double', 'amount: double')})
+        changed_model, cached_models = self.get_model()
+
+        # The changed grammar file and the main grammar file importing it are parsed again, the other models are reused
+        self.assertIsNot(changed_model, model)
+        self.assertIsNot(cached_models[self.get_file_path(PRODUCTS_FILE_NAME)], previous_models[self.get_file_path(PRODUCTS_FILE_NAME)])
+        for file_name in (CUSTOMERS_FILE_NAME, ORDERS_FILE_NAME):
+            self.assertIs(cached_models[self.get_file_path(file_name)], previous_models[self.get_file_path(file_name)])
+        self.assertEqual(self.textx_grammar.model_file_hashes.keys() & previous_models.keys(), previous_models.keys())
+        self.assertIs(self.get_model()[0], changed_model)
+
+    def test_changed_mutually_imported_file_eviction(self):
+        self.write_grammar_files(GRAMMAR_FILES)
+        model, cached_models = self.get_model()
+        previous_models = dict(cached_models)
+
+        self.write_grammar_files({ORDERS_FILE_NAME: GRAMMAR_FILES[ORDERS_FILE_NAME].replace('total: double', 'amount: double')})
+        changed_model, cached_models = self.get_model()
+
+        # The grammar files importing the changed grammar file (directly or indirectly) are parsed again
+        self.assertIsNot(changed_model, model)
+        for file_name in (CUSTOMERS_FILE_NAME, ORDERS_FILE_NAME):
+            self.assertIsNot(cached_models[self.get_file_path(file_name)], previous_models[self.get_file_path(file_name)])
+        self.assertIs(cached_models[self.get_file_path(PRODUCTS_FILE_NAME)], previous_models[self.get_file_path(PRODUCTS_FILE_NAME)])
+
+    def test_imported_file_error_position(self):
+        self.write_grammar_files({**GRAMMAR_FILES, PRODUCTS_FILE_NAME: f'{DATABASE}{PRODUCT}'})
+
+        response = self.textx_grammar.generate(self.project_path, MODEL_FILE_NAME, DATABASE_DRIVER)
+
+        self.assertEqual(response.status, cfg.ERROR)
+        self.assertTrue(response.error_msg.startswith(f'in "{PRODUCTS_FILE_NAME}" at position (2,5): '), response.error_msg)
+        self.assertIn(cfg.IMPORTED_DATABASE_ERROR % (PRODUCTS_FILE_NAME), response.error_msg)
+        self.assertNotIn(self.get_file_path(PRODUCTS_FILE_NAME), self.textx_grammar.model_file_hashes)
+
+    def test_imported_file_referring_to_importing_file(self):
+        # Unsupported layout, the imported grammar file refers to a class of the main grammar file
+        self.write_grammar_files({MODEL_FILE_NAME: f'import "{ORDERS_FILE_NAME}";\n{DATABASE}{CUSTOMER}', ORDERS_FILE_NAME: ORDER})
+
+        response = self.textx_grammar.generate(self.project_path, MODEL_FILE_NAME, DATABASE_DRIVER)
+
+        self.assertEqual(response.status, cfg.ERROR)
+        self.assertTrue(response.error_msg.startswith(f'in "{ORDERS_FILE_NAME}" at position'), response.error_msg)
+        self.assertIn('Unknown object "Customer"', response.error_msg)
+        self.assertTrue(response.error_msg.endswith(cfg.IMPORTED_UNKNOWN_OBJECT_ERROR), response.error_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
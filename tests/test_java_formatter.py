@@ -0,0 +1,105 @@
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.config as cfg
+import src.error_handler as eh
+from src.java_formatter import GoogleJavaFormatter
+
+
+GOOGLE_FORMAT_JAR_NAME = 'google-java-format-1.22.0-all-deps.jar'
+FORMATTED_MARKER = '// formatted\n'
+# Stub of the java executable, which marks every file passed after --replace and logs one line per started process
+JAVA_STUB = f'''#!{sys.executable}
+import os, sys
+files = sys.argv[sys.argv.index('--replace') + 1:]
+for file_path in files:
+    with open(file_path, 'a') as file:
+        file.write({FORMATTED_MARKER!r})
+with open(os.environ['JAVA_STUB_LOG'], 'a') as log:
+    log.write(f'{{len(files)}}\\n')
+'''
+
+
+class GoogleJavaFormatterTest(unittest.TestCase):
+    """
+    Tests for formatting the generated files in batches, with a stub java executable on the PATH.
+    """
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.temp_folder.name) / 'project'
+        self.project_path.mkdir()
+        self.bin_path = Path(self.temp_folder.name) / 'bin'
+        self.bin_path.mkdir()
+        self.log_path = Path(self.temp_folder.name) / 'java.log'
+        patchers = [
+            mock.patch.object(GoogleJavaFormatter, 'google_format_jar_path', Path(self.temp_folder.name) / GOOGLE_FORMAT_JAR_NAME),
+            mock.patch.object(cfg, 'GOOGLE_FORMAT_MIN_BATCH_SIZE', 1),
+            mock.patch.dict(os.environ, {'PATH': str(self.bin_path), 'JAVA_STUB_LOG': str(self.log_path)}),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def install_java_stub(self):
+        java_path = self.bin_path / 'java'
+        java_path.write_text(JAVA_STUB)
+        java_path.chmod(0o755)
+
+    def add_files(self, java_formatter, file_count):
+        files = [(self.project_path / f'Entity{index}.java', f'class Entity{index} {{}}\n') for index in range(file_count)]
+        for file_path, content in files:
+            java_formatter.add_file(file_path, content)
+        return files
+
+    def test_batches_run_in_parallel_processes(self):
+        self.install_java_stub()
+        java_formatter = GoogleJavaFormatter(self.project_path, batch_size=2, workers=2)
+        files = self.add_files(java_formatter, 5)
+
+        formatted_files = java_formatter.format_pending_files()
+
+        self.assertEqual(formatted_files, [(file_path, f'{content}{FORMATTED_MARKER}') for file_path, content in files])
+        self.assertEqual(sorted(self.log_path.read_text().split()), ['1', '2', '2'])
+        self.assertFalse(java_formatter.staging_folder_path.exists())
+        for file_path, content in files:
+            self.assertEqual(java_formatter.get_formatted_content(file_path, content), f'{content}{FORMATTED_MARKER}')
+
+    def test_missing_java(self):
+        java_formatter = GoogleJavaFormatter(self.project_path, batch_size=2, workers=2)
+        self.add_files(java_formatter, 5)
+
+        with self.assertRaises(eh.JavaNotFoundError):
+            java_formatter.format_pending_files()
+        self.assertFalse(java_formatter.staging_folder_path.exists())
+
+    def test_command_line_too_long(self):
+        java_formatter = GoogleJavaFormatter(self.project_path, workers=1)
+        self.add_files(java_formatter, 3)
+
+        side_effects = [OSError(errno.E2BIG, 'Argument list too long'), None, None, None]
+        with mock.patch('src.java_formatter.subprocess.run', side_effect=side_effects) as run:
+            java_formatter.format_pending_files()
+        self.assertEqual(run.call_count, 4)
+        replaced_files = [call.args[0][call.args[0].index('--replace') + 1:] for call in run.call_args_list]
+        self.assertEqual([len(files) for files in replaced_files], [3, 1, 1, 1])
+
+    def test_other_start_error(self):
+        java_formatter = GoogleJavaFormatter(self.project_path, workers=1)
+        self.add_files(java_formatter, 3)
+
+        with mock.patch('src.java_formatter.subprocess.run', side_effect=PermissionError(errno.EACCES, 'Permission denied')) as run:
+            with self.assertRaises(PermissionError):
+                java_formatter.format_pending_files()
+        self.assertEqual(run.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
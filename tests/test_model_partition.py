@@ -0,0 +1,93 @@
+import io
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from textx.const import MULT_ONE
+
+import src.config as cfg
+from src.model_partition import export_cluster_to_file, get_entity_cluster_names, get_model_clusters
+
+
+# Exported class of the entity objects, with the textX attribute description used by export_cluster_to_file
+Entity = type('Entity', (), {'_tx_attrs': {attr_name: SimpleNamespace(mult=MULT_ONE, cont=False) for attr_name in ('name', 'comment', 'related')}})
+
+
+def create_entities(relationships):
+    """
+    Create the entities of a synthetic relationship graph, given as entity name -> names of the related entities.
+    """
+    entities = list()
+    for entity_name, related_entity_names in relationships.items():
+        entity = Entity()
+        entity.name = entity_name
+        entity.comment = None
+        entity.related = None
+        entity.relationships = [SimpleNamespace(property_type=SimpleNamespace(name=related_entity_name)) for related_entity_name in related_entity_names]
+        entities.append(entity)
+    return entities
+
+
+def get_cluster_entity_names(clusters):
+    return {cluster.name: [entity.name for entity in cluster.entities] for cluster in clusters}
+
+
+class ModelPartitionTest(unittest.TestCase):
+    """
+    Tests for partitioning the model entities into clusters which are exported as their own diagrams.
+    """
+    def test_connected_components(self):
+        # "E" is related to "A" only through "D", which is declared after it
+        entities = create_entities({'A': [], 'B': ['C'], 'C': [], 'E': ['D'], 'D': ['A'], 'F': ['F']})
+
+        with mock.patch.object(cfg, 'MODEL_CLUSTER_MAX_ENTITIES', 2):
+            clusters = get_model_clusters(entities, {})
+
+        # Components are kept whole even if they are larger than the maximum cluster size
+        self.assertEqual(get_cluster_entity_names(clusters), {'cluster_1': ['A', 'E', 'D'], 'cluster_2': ['B', 'C'], 'cluster_3': ['F']})
+
+    def test_packing_small_components(self):
+        entities = create_entities({'A': ['B'], 'B': [], 'C': [], 'D': [], 'E': ['F'], 'F': [], 'G': []})
+
+        with mock.patch.object(cfg, 'MODEL_CLUSTER_MAX_ENTITIES', 3):
+            clusters = get_model_clusters(entities, {})
+
+        self.assertEqual(get_cluster_entity_names(clusters), {'cluster_1': ['A', 'B', 'C'], 'cluster_2': ['D', 'E', 'F'], 'cluster_3': ['G']})
+        self.assertTrue(all(len(cluster.entities) <= 3 for cluster in clusters))
+
+    def test_entity_groups(self):
+        entities = create_entities({'A': ['B'], 'B': ['C'], 'C': [], 'D': []})
+        entity_groups = {'cluster_1': ['B', 'Missing'], 'Empty': ['Missing']}
+
+        clusters = get_model_clusters(entities, entity_groups)
+
+        # Grouped entities split the components, and the component names used by the export groups are skipped
+        self.assertEqual(get_cluster_entity_names(clusters), {'cluster_1': ['B'], 'cluster_2': ['A', 'C', 'D']})
+        self.assertEqual(get_entity_cluster_names(clusters), {'A': 'cluster_2', 'B': 'cluster_1', 'C': 'cluster_2', 'D': 'cluster_2'})
+        self.assertEqual([cluster.file_name for cluster in clusters], [cfg.MODEL_CLUSTER_FILE_NAME % 'cluster_1', cfg.MODEL_CLUSTER_FILE_NAME % 'cluster_2'])
+
+    def test_unique_file_names(self):
+        entities = create_entities({'A': [], 'B': [], 'C': []})
+        entity_groups = {'Core': ['A'], 'core': ['B'], 'index': ['C']}
+
+        clusters = get_model_clusters(entities, entity_groups)
+
+        # File names differing only in case, or equal to the index diagram name, get a suffix
+        self.assertEqual([cluster.file_name for cluster in clusters], ['model_Core.dot', 'model_core_2.dot', 'model_index_2.dot'])
+
+    def test_export_escapes_names(self):
+        entities = create_entities({'A"{|}': ['B<b>'], 'B<b>': []})
+        entities[0].comment = 'Quoted "comment"'
+        entities[0].related = entities[1]
+        clusters = get_model_clusters(entities, {'Main': ['A"{|}'], 'Other': ['B<b>']})
+        dot_content = io.StringIO()
+
+        export_cluster_to_file(dot_content, clusters[0], get_entity_cluster_names(clusters))
+
+        dot_content = dot_content.getvalue()
+        self.assertIn('1[label="{A\\"\\{\\|\\}:Entity|+comment:str=\'Quoted \\"comment\\"\'\\l}"]', dot_content)
+        self.assertIn('2[label="{B\\<b\\>:Entity|Other\\l}" style="filled,dashed"]', dot_content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+from datetime import datetime
+
+import src.config as cfg
+import src.utils as utils
+
+
+def is_datetime(value, format):
+    try:
+        datetime.strptime(value, format)
+        return True
+    except ValueError:
+        return False
+
+
+# Property type -> rule of the per-element value check used before the validators were precompiled
+# A rule returns False (or raises a ValueError) if the value is not valid for the property type
+PREVIOUS_PROPERTY_CHECKING_RULES = {
+    cfg.BYTE: lambda value: -128 <= int(value) <= 127,
+    cfg.SHORT: lambda value: -32768 <= int(value) <= 32767,
+    cfg.CHAR: lambda value: len(value) == 3 and value[0] == '\'' and value[-1] == '\'',
+    cfg.INT: lambda value: -2147483648 <= int(value) <= 2147483647,
+    cfg.FLOAT: lambda value: isinstance(float(value[:-1]), float) and value.upper().endswith('F'),
+    cfg.LONG: lambda value: -9223372036854775808 <= int(value[:-1]) <= 9223372036854775807 and value.upper().endswith('L'),
+    cfg.DOUBLE: lambda value: isinstance(float(value[:-1]), float) and value.upper().endswith('D'),
+    cfg.BOOLEAN: lambda value: value.lower() in ('true', 'false'),
+    cfg.BYTE_W: lambda value: -128 <= int(value) <= 127,
+    cfg.SHORT_W: lambda value: -32768 <= int(value) <= 32767,
+    cfg.CHARACTER_W: lambda value: len(value) == 3 and value[0] == '\'' and value[-1] == '\'',
+    cfg.INTEGER_W: lambda value: -2147483648 <= int(value) <= 2147483647,
+    cfg.FLOAT_W: lambda value: isinstance(float(value[:-1]), float) and value.upper().endswith('F'),
+    cfg.LONG_W: lambda value: -9223372036854775808 <= int(value[:-1]) <= 9223372036854775807 and value.upper().endswith('L'),
+    cfg.DOUBLE_W: lambda value: isinstance(float(value[:-1]), float) and value.upper().endswith('D'),
+    cfg.BOOLEAN_W: lambda value: value.lower() in ('true', 'false'),
+    cfg.STR: lambda value: value.startswith('"') and value.endswith('"'),
+    cfg.STRING: lambda value: value.startswith('"') and value.endswith('"'),
+    cfg.STRING_C: lambda value: value.startswith('"') and value.endswith('"'),
+    cfg.DATE: lambda value: is_datetime(value, cfg.DATE_REGEX),
+    cfg.TIME: lambda value: is_datetime(value, cfg.TIME_REGEX),
+    cfg.DATETIME: lambda value: is_datetime(value, cfg.DATETIME_REGEX),
+    cfg.ARRAY: lambda value: value.startswith('[') and value.endswith(']'),
+    cfg.LINKED: lambda value: value.startswith('[') and value.endswith(']'),
+    cfg.HASHMAP: lambda value: value.startswith('[') and value.endswith(']'),
+    cfg.HASHSET: lambda value: value.startswith('[') and value.endswith(']'),
+    cfg.TREEMAP: lambda value: value.startswith('[') and value.endswith(']'),
+    cfg.LIST: lambda value: value.startswith('[') and value.endswith(']'),
+}
+# The string types share the error message of the "string" type
+PREVIOUS_ERROR_MESSAGE_TYPES = {cfg.STR: cfg.STRING, cfg.STRING_C: cfg.STRING}
+
+INTEGER_VALUES = ['1', '+2', '-3', '1.5', 'abc', '', '1L']
+DECIMAL_VALUES = ['1.5F', '2f', '3.0D', '4d', '5', 'abcF', 'F', '', '1.5']
+LONG_VALUES = ['1L', '-2l', '9223372036854775807L', '9223372036854775808L', '1', 'abcL', 'L', '']
+CHAR_VALUES = ["'a'", "'ab'", 'a', "''", '']
+BOOLEAN_VALUES = ['true', 'FALSE', 'yes', '1', '']
+STRING_VALUES = ['"text"', '""', 'text', '"text', '']
+LIST_VALUES = ['[1, 2]', '[]', '1, 2', '[1', '']
+# Property type -> values to check (including values at and out of the range of the integer types)
+PROPERTY_VALUES = {
+    cfg.BYTE: [*INTEGER_VALUES, '127', '-128', '128', '-129'],
+    cfg.SHORT: [*INTEGER_VALUES, '32767', '-32768', '32768', '-32769'],
+    cfg.CHAR: CHAR_VALUES,
+    cfg.INT: [*INTEGER_VALUES, '2147483647', '-2147483648', '2147483648', '-2147483649'],
+    cfg.FLOAT: DECIMAL_VALUES,
+    cfg.LONG: LONG_VALUES,
+    cfg.DOUBLE: DECIMAL_VALUES,
+    cfg.BOOLEAN: BOOLEAN_VALUES,
+    cfg.BYTE_W: [*INTEGER_VALUES, '127', '-128', '128', '-129'],
+    cfg.SHORT_W: [*INTEGER_VALUES, '32767', '-32768', '32768', '-32769'],
+    cfg.CHARACTER_W: CHAR_VALUES,
+    cfg.INTEGER_W: [*INTEGER_VALUES, '2147483647', '-2147483648', '2147483648', '-2147483649'],
+    cfg.FLOAT_W: DECIMAL_VALUES,
+    cfg.LONG_W: LONG_VALUES,
+    cfg.DOUBLE_W: DECIMAL_VALUES,
+    cfg.BOOLEAN_W: BOOLEAN_VALUES,
+    cfg.STR: STRING_VALUES,
+    cfg.STRING: STRING_VALUES,
+    cfg.STRING_C: STRING_VALUES,
+    cfg.DATE: ['2024-02-29', '2023-02-29', '2024-13-01', '12:30:00', ''],
+    cfg.TIME: ['12:30:00', '24:00:00', '12:30', '2024-01-01', ''],
+    cfg.DATETIME: ['2024-01-01 12:30:00', '2024-01-01', '2024-01-01 25:00:00', '12:30:00', ''],
+    cfg.ARRAY: LIST_VALUES,
+    cfg.LINKED: LIST_VALUES,
+    cfg.HASHMAP: LIST_VALUES,
+    cfg.HASHSET: LIST_VALUES,
+    cfg.TREEMAP: LIST_VALUES,
+    cfg.LIST: LIST_VALUES,
+}
+
+
+def check_property_value_per_element(property_type, property_value):
+    """
+    Check the value the way it was checked before the validators were precompiled, returning cfg.OK or the error message.
+    """
+    error_message = cfg.ERROR_MESSAGES[PREVIOUS_ERROR_MESSAGE_TYPES.get(property_type, property_type)]
+    try:
+        return cfg.OK if PREVIOUS_PROPERTY_CHECKING_RULES[property_type](property_value) else error_message
+    except ValueError:
+        return error_message
+
+
+class PropertyValueValidatorsTest(unittest.TestCase):
+    """
+    Tests for the precompiled property value validators, which must accept and reject the same values,
+    with the same error messages, as the previous per-element checks.
+    """
+    def test_every_property_type_is_checked(self):
+        self.assertEqual(PROPERTY_VALUES.keys(), utils.PROPERTY_VALUE_VALIDATORS.keys())
+
+    def test_check_property_value(self):
+        for property_type, property_values in PROPERTY_VALUES.items():
+            for property_value in property_values:
+                with self.subTest(property_type=property_type, property_value=property_value):
+                    self.assertEqual(utils.check_property_value(property_type, property_value), check_property_value_per_element(property_type, property_value))
+
+    def test_get_invalid_property_values(self):
+        for property_type, property_values in PROPERTY_VALUES.items():
+            with self.subTest(property_type=property_type):
+                responses = [check_property_value_per_element(property_type, property_value) for property_value in property_values]
+                invalid_indexes, error_message = utils.get_invalid_property_values(property_type, property_values)
+
+                self.assertEqual(invalid_indexes, [index for index, response in enumerate(responses) if response != cfg.OK])
+                self.assertTrue(invalid_indexes)
+                self.assertEqual({error_message}, {response for response in responses if response != cfg.OK})
+
+    def test_get_invalid_property_values_in_range(self):
+        # Values which are all integers are checked in a single pass, only the out of range values are invalid
+        for property_type in (cfg.BYTE, cfg.SHORT, cfg.INT, cfg.BYTE_W, cfg.SHORT_W, cfg.INTEGER_W):
+            with self.subTest(property_type=property_type):
+                invalid_indexes, error_message = utils.get_invalid_property_values(property_type, ['0', '-1', '4294967296', '7'])
+
+                self.assertEqual(invalid_indexes, [2])
+                self.assertEqual(error_message, check_property_value_per_element(property_type, '4294967296'))
+
+    def test_unknown_property_type(self):
+        with self.assertRaises(ValueError):
+            utils.get_invalid_property_values('Unknown', ['1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.config as cfg
+from src.textx_grammar import SemanticErrors, TextXGrammar
+
+
+ROOT_PATH = Path(__file__).resolve().parent.parent
+GRAMMAR_PATH = ROOT_PATH / cfg.GRAMMAR_FOLDER / cfg.GRAMMAR_FILE
+TEST_INPUT_PATH = ROOT_PATH / cfg.GRAMMAR_FOLDER / 'test_input.jsdmbrs'
+MODEL_FILE_NAME = 'model.jsdmbrs'
+LAST_PERSON_PROPERTY = '    testLong: Long;\n'
+
+
+class CollectAllSemanticErrorsTest(unittest.TestCase):
+    """
+    Tests for the semantic checks in the collect-all-errors mode, for both model processing modes.
+    Every invalid input must be reported as positioned semantic errors, instead of aborting the parse.
+    """
+    def setUp(self):
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.project_path = Path(self.temp_folder.name)
+        java_app_folder = self.project_path / cfg.PROJECT_JAVA_FOLDER / 'com' / 'example'
+        java_app_folder.mkdir(parents=True)
+        (java_app_folder / 'ExampleApplication.java').write_text('public class ExampleApplication {}')
+        self.grammar_folder = self.project_path / cfg.JSD_MBRS_GENERATOR_FOLDER / cfg.GRAMMAR_FOLDER
+        self.grammar_folder.mkdir(parents=True)
+        self.test_input = TEST_INPUT_PATH.read_text()
+
+    def tearDown(self):
+        self.temp_folder.cleanup()
+
+    def get_semantic_errors(self, model_content, batch_model_processing):
+        """
+        Parse the given model content and return the collected semantic errors as (line, message) tuples.
+        """
+        model_file_path = self.grammar_folder / MODEL_FILE_NAME
+        model_file_path.write_text(model_content)
+        textx_grammar = TextXGrammar()
+        textx_grammar.set_project_path(self.project_path)
+        textx_grammar.set_database_driver(None)
+        with mock.patch.object(cfg, 'COLLECT_ALL_SEMANTIC_ERRORS', True), mock.patch.object(cfg, 'BATCH_MODEL_PROCESSING', batch_model_processing):
+            with textx_grammar.parse_lock:
+                metamodel = textx_grammar.get_metamodel(GRAMMAR_PATH)
+                with self.assertRaises(SemanticErrors) as context:
+                    textx_grammar.get_model(metamodel, model_file_path, MODEL_FILE_NAME)
+        return [(error.line, error.message) for error in context.exception.errors]
+
+    def assert_property_error(self, property_line, expected_message_part):
+        """
+        Add the property to the "Person" class of the test input and check that its error is reported in both processing modes.
+        """
+        model_content = self.test_input.replace(LAST_PERSON_PROPERTY, f'{LAST_PERSON_PROPERTY}    {property_line}\n', 1)
+        property_line_number = model_content.splitlines().index(f'    {property_line}') + 1
+        for batch_model_processing in (False, True):
+            with self.subTest(batch_model_processing=batch_model_processing):
+                errors = self.get_semantic_errors(model_content, batch_model_processing)
+                property_errors = [message for line, message in errors if line == property_line_number]
+                self.assertEqual(len(property_errors), 1)
+                self.assertIn(expected_message_part, property_errors[0])
+
+    def test_test_input(self):
+        for batch_model_processing in (False, True):
+            with self.subTest(batch_model_processing=batch_model_processing):
+                errors = self.get_semantic_errors(self.test_input, batch_model_processing)
+                self.assertEqual(errors[0][0], 10)
+                self.assertIn('"testVariable" list property does not support the relationships', errors[0][1])
+
+    def test_primitive_type_relationship(self):
+        self.assert_property_error('rb: int 1..1 (get);', '"rb" property cannot have a relationship')
+
+    def test_constant_without_value(self):
+        self.assert_property_error('cnv: const int (get);', 'constant property int value is missing for "cnv"')
+
+    def test_class_type_constant(self):
+        self.assert_property_error('ce: const Person (get) = 5;', '"ce" property of the "Person" class type cannot be declared as a constant')
+
+
+if __name__ == '__main__':
+    unittest.main()